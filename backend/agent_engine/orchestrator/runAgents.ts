@@ -7,10 +7,12 @@ import { BaseAgent, MarketData, AgentData, AgentDecision } from '../agents/baseA
 
 /**
  * Run all 5 agents in parallel and return their decisions
+ * @param onResult Optional callback invoked as soon as each agent finishes
  */
 export async function runAgents(
   market: MarketData,
-  data: AgentData
+  data: AgentData,
+  onResult?: (output: { agent: string; decision: AgentDecision }) => void
 ): Promise<Array<{ agent: string; decision: AgentDecision }>> {
   // Instantiate all agents
   const agents: BaseAgent[] = [
@@ -23,16 +25,17 @@ export async function runAgents(
 
   // Run all agents in parallel
   const promises = agents.map(async (agent) => {
+    let output: { agent: string; decision: AgentDecision };
     try {
       const decision = await agent.evaluate(market, data);
-      return {
+      output = {
         agent: agent.getName(),
         decision,
       };
     } catch (error) {
       console.error(`[${agent.getName()}] Error during evaluation:`, error);
       // Return conservative default on error
-      return {
+      output = {
         agent: agent.getName(),
         decision: {
           direction: 'NO',
@@ -42,6 +45,8 @@ export async function runAgents(
         } as AgentDecision,
       };
     }
+    onResult?.(output);
+    return output;
   });
 
   // Wait for all agents to complete
@@ -43,6 +43,20 @@ export interface EnhancedDecisionResponse {
   error?: string;
 }
 
+/**
+ * Incremental debate event, emitted as the pipeline progresses:
+ * initial theses, debate round, final votes and the consensus
+ */
+export interface DebateEvent {
+  phase: 'initial' | 'debate' | 'final' | 'consensus';
+  agent: string;
+  message: string;
+  vote: 'YES' | 'NO';
+  timestamp: string;
+}
+
+export type DebateEventHandler = (event: DebateEvent) => void;
+
 /**
  * Helper to log to stderr when running as subprocess (so stdout only has JSON)
  */
@@ -63,10 +77,14 @@ const logToStderr = (...args: any[]) => {
 export async function processDecision(
   market: MarketData,
   data: AgentData,
-  marketSelection?: { enriched: any; selected: any }
+  marketSelection?: { enriched: any; selected: any },
+  onEvent?: DebateEventHandler
 ): Promise<EnhancedDecisionResponse> {
   const decisionId = uuidv4();
   const timestamp = new Date().toISOString();
+  const emit = (phase: DebateEvent['phase'], agent: string, message: string, vote: 'YES' | 'NO') => {
+    onEvent?.({ phase, agent, message, vote, timestamp: new Date().toLocaleTimeString() });
+  };
   
   try {
     // Validate request
@@ -86,18 +104,32 @@ export async function processDecision(
 
     // Step 1: Run all agents in parallel (capture initial decisions)
     console.log(`[DecisionService] Running agents for market: ${market.symbol}`);
-    const initialAgentOutputs = await runAgents(market, data);
+    const initialAgentOutputs = await runAgents(market, data, (output) =>
+      emit('initial', output.agent, output.decision.reasoning, output.decision.direction)
+    );
     console.log(`[DecisionService] Initial agent outputs received:`, initialAgentOutputs.length);
 
     // Step 2: Run one debate round (capture final decisions)
     console.log(`[DecisionService] Running debate round...`);
     const finalAgentOutputs = await debate(initialAgentOutputs);
     console.log(`[DecisionService] Debate round completed`);
+    for (const output of finalAgentOutputs) {
+      emit('debate', output.agent, output.decision.reasoning, output.decision.direction);
+    }
+    for (const output of finalAgentOutputs) {
+      emit(
+        'final',
+        output.agent,
+        `Final vote: ${output.decision.direction} at ${output.decision.confidence}% confidence, size $${output.decision.size.toLocaleString()}.`,
+        output.decision.direction
+      );
+    }
 
     // Step 3: Calculate consensus
     console.log(`[DecisionService] Calculating consensus...`);
     const consensus = calculateConsensus(finalAgentOutputs);
     console.log(`[DecisionService] Consensus: ${consensus.direction} with size $${consensus.size.toLocaleString()}`);
+    emit('consensus', 'Consensus', consensus.reasoning, consensus.direction);
 
     // Step 4: Create clean investment decision summary (4 sentences)
     const investmentSummary = createInvestmentSummary(consensus, finalAgentOutputs);
@@ -244,9 +276,93 @@ function calculateWeightedConfidence(agents: AgentOutput[]): number {
   return totalWeight > 0 ? weightedSum / totalWeight : 0;
 }
 
+/**
+ * Resolve a raw request (auto-selecting a Polymarket market when none is given)
+ * and run the full decision pipeline
+ */
+export async function handleDecisionRequest(
+  request: Partial<DecisionRequest>,
+  onEvent?: DebateEventHandler
+): Promise<EnhancedDecisionResponse> {
+  if (!request.market || !request.data || Object.keys(request.market).length === 0) {
+    logToStderr('[DecisionService] No market provided, running market selection...');
+    const selected = await selectAndEnrichBestMarket();
+
+    if (!selected) {
+      return {
+        status: 'error',
+        error: 'Market selection failed: No suitable markets found',
+      };
+    }
+
+    logToStderr(`[DecisionService] Selected market: ${selected.enriched.question.substring(0, 60)}...`);
+    return processDecision(selected.market, selected.data, {
+      enriched: selected.enriched,
+      selected: selected.selected,
+    }, onEvent);
+  }
+
+  return processDecision(request.market, request.data, undefined, onEvent);
+}
+
+/**
+ * Worker mode (`--worker`): stay resident and serve one JSON frame per line.
+ * Requests:  {"id": 1, "type": "decision", "request": {...}} or {"id": 2, "type": "ping"}
+ * Responses: {"id": 1, "result": {...}} / {"id": 2, "type": "pong"} / {"id": 1, "error": "..."}
+ * While a decision runs, progress is streamed as {"id": 1, "type": "event", "event": DebateEvent}.
+ * Used by the Python worker pool so Node startup and compilation are paid once per worker.
+ */
+const WORKER_MODE = process.argv.includes('--worker');
+
+if (WORKER_MODE) {
+  const readline = require('readline');
+  const writeFrame = (frame: Record<string, any>) => {
+    process.stdout.write(JSON.stringify(frame) + '\n');
+  };
+
+  // stdout carries protocol frames only, so route all logging to stderr
+  console.log = console.error;
+  console.info = console.error;
+
+  const rl = readline.createInterface({ input: process.stdin });
+
+  rl.on('line', async (line: string) => {
+    if (!line.trim()) {
+      return;
+    }
+
+    let frame: any;
+    try {
+      frame = JSON.parse(line);
+    } catch (error) {
+      writeFrame({ id: null, error: 'Invalid JSON frame' });
+      return;
+    }
+
+    if (frame.type === 'ping') {
+      writeFrame({ id: frame.id, type: 'pong', pid: process.pid });
+      return;
+    }
+
+    try {
+      const result = await handleDecisionRequest(frame.request || {}, (event) =>
+        writeFrame({ id: frame.id, type: 'event', event })
+      );
+      writeFrame({ id: frame.id, result });
+    } catch (error) {
+      writeFrame({
+        id: frame.id,
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
+    }
+  });
+
+  rl.on('close', () => process.exit(0));
+}
+
 // If run as a standalone script (for testing or direct invocation)
 // Read from stdin when called directly
-if (typeof require !== 'undefined' && require.main === module) {
+if (!WORKER_MODE && typeof require !== 'undefined' && require.main === module) {
   const readline = require('readline');
   const rl = readline.createInterface({
     input: process.stdin,
@@ -309,7 +425,7 @@ if (typeof require !== 'undefined' && require.main === module) {
 }
 
 // Alternative: Read all stdin at once (better for subprocess calls)
-if (process.stdin.isTTY === false) {
+if (!WORKER_MODE && process.stdin.isTTY === false) {
   // Running in non-interactive mode (piped input)
   let inputData = '';
   process.stdin.setEncoding('utf8');
@@ -158,55 +158,102 @@ async function ensureTableExists(): Promise<void> {
 }
 
 /**
- * Store a decision record in Snowflake
+ * Run one statement on the connection
+ */
+function executeStatement(conn: snowflake.Connection, sqlText: string, binds: any[]): Promise<void> {
+  return new Promise((resolve, reject) => {
+    conn.execute({
+      sqlText,
+      binds,
+      complete: (err: any, stmt: any, rows: any) => {
+        if (err) {
+          reject(err);
+        } else {
+          resolve();
+        }
+      },
+    });
+  });
+}
+
+/**
+ * Store a decision record in Snowflake.
+ * The full record goes to INVESTMENT_DECISIONS; a summary row with the same id
+ * goes to decisions, which the dashboard lists as proposals. A proposal id is
+ * therefore the DECISION_ID its conversation logs are stored under.
  */
 export async function storeDecision(record: DecisionRecord): Promise<void> {
   try {
     await ensureTableExists();
     const conn = await ensureConnected();
 
-    return new Promise((resolve, reject) => {
-      const insertSQL = `
-        INSERT INTO INVESTMENT_DECISIONS (
-          DECISION_ID, TIMESTAMP, MARKET_SYMBOL, MARKET_QUESTION,
-          MARKET_PRICE, MARKET_VOLUME24H, MARKET_CAP,
-          CONSENSUS_DIRECTION, CONSENSUS_SIZE, CONSENSUS_REASONING, CONSENSUS_CONFIDENCE,
-          AGENT_DECISIONS, CONVERSATION_LOGS, MARKET_SELECTION, RAW_JSON
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-      `;
-
-      const binds = [
-        record.decision_id,
-        record.timestamp,
-        record.market_symbol,
-        record.market_question || null,
-        record.market_price,
-        record.market_volume24h || null,
-        record.market_cap || null,
-        record.consensus_direction,
-        record.consensus_size,
-        record.consensus_reasoning,
-        record.consensus_confidence,
-        JSON.stringify(record.agent_decisions),
-        JSON.stringify(record.conversation_logs),
-        record.market_selection ? JSON.stringify(record.market_selection) : null,
-        record.raw_json,
-      ];
-
-      conn.execute({
-        sqlText: insertSQL,
-        binds,
-        complete: (err: any, stmt: any, rows: any) => {
-          if (err) {
-            console.error('[Snowflake] Error storing decision:', err);
-            reject(err);
-          } else {
-            console.log(`[Snowflake] Successfully stored decision ${record.decision_id}`);
-            resolve();
-          }
-        },
-      });
-    });
+    const insertSQL = `
+      INSERT INTO INVESTMENT_DECISIONS (
+        DECISION_ID, TIMESTAMP, MARKET_SYMBOL, MARKET_QUESTION,
+        MARKET_PRICE, MARKET_VOLUME24H, MARKET_CAP,
+        CONSENSUS_DIRECTION, CONSENSUS_SIZE, CONSENSUS_REASONING, CONSENSUS_CONFIDENCE,
+        AGENT_DECISIONS, CONVERSATION_LOGS, MARKET_SELECTION, RAW_JSON
+      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    `;
+
+    const binds = [
+      record.decision_id,
+      record.timestamp,
+      record.market_symbol,
+      record.market_question || null,
+      record.market_price,
+      record.market_volume24h || null,
+      record.market_cap || null,
+      record.consensus_direction,
+      record.consensus_size,
+      record.consensus_reasoning,
+      record.consensus_confidence,
+      JSON.stringify(record.agent_decisions),
+      JSON.stringify(record.conversation_logs),
+      record.market_selection ? JSON.stringify(record.market_selection) : null,
+      record.raw_json,
+    ];
+
+    try {
+      await executeStatement(conn, insertSQL, binds);
+    } catch (err) {
+      console.error('[Snowflake] Error storing decision:', err);
+      throw err;
+    }
+    console.log(`[Snowflake] Successfully stored decision ${record.decision_id}`);
+
+    // Same columns as src/services/snowflake/decisionLogger.ts (logDecision)
+    const summarySQL = `
+      INSERT INTO decisions (
+        id,
+        market_id,
+        market_question,
+        final_direction,
+        final_size,
+        agent_outputs,
+        consensus_reasoning,
+        raw_market_data
+      ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    `;
+
+    const summaryBinds = [
+      record.decision_id,
+      record.market_selection?.selected_market_id || record.market_symbol,
+      record.market_question || null,
+      record.consensus_direction,
+      record.consensus_size,
+      JSON.stringify(record.conversation_logs.final_decisions),
+      record.consensus_reasoning || null,
+      record.market_selection?.enrichment_data ? JSON.stringify(record.market_selection.enrichment_data) : null,
+    ];
+
+    try {
+      await executeStatement(conn, summarySQL, summaryBinds);
+    } catch (err) {
+      console.error('[Snowflake] Error logging decision summary:', err);
+      throw err;
+    }
+    console.log(`[Snowflake] Decision logged to decisions: ${record.decision_id}`);
   } catch (error) {
     console.error('[Snowflake] Error in storeDecision:', error);
     throw error;
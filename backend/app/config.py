@@ -0,0 +1,98 @@
+"""
+Application configuration.
+Settings are read from environment variables with sensible local defaults.
+"""
+import os
+
+# Decision engine worker pool
+# Long-lived Node workers that serve POST /api/agents/decision over JSON lines.
+# Set DECISION_POOL_SIZE=0 to disable the pool and spawn one process per request.
+DECISION_POOL_SIZE = int(os.getenv("DECISION_POOL_SIZE", "2"))
+DECISION_POOL_MAX_REQUESTS = int(os.getenv("DECISION_POOL_MAX_REQUESTS", "50"))
+DECISION_POOL_REQUEST_TIMEOUT = float(os.getenv("DECISION_POOL_REQUEST_TIMEOUT", "120"))
+DECISION_POOL_STARTUP_TIMEOUT = float(os.getenv("DECISION_POOL_STARTUP_TIMEOUT", "60"))
+DECISION_POOL_HEALTH_INTERVAL = float(os.getenv("DECISION_POOL_HEALTH_INTERVAL", "30"))
+
+# TypeScript bridge (one-off ts-node / node processes)
+# Caps concurrent child processes so a burst of requests cannot fork-bomb the host.
+# Dashboard queries and decision runs are capped separately, so long decisions never block the dashboard.
+TS_BRIDGE_CONCURRENCY = int(os.getenv("TS_BRIDGE_CONCURRENCY", "4"))
+TS_BRIDGE_DECISION_CONCURRENCY = int(os.getenv("TS_BRIDGE_DECISION_CONCURRENCY", "2"))
+TS_DASHBOARD_TIMEOUT = float(os.getenv("TS_DASHBOARD_TIMEOUT", "30"))
+TS_DECISION_TIMEOUT = float(os.getenv("TS_DECISION_TIMEOUT", "120"))
+
+# Snowflake dashboard query cache
+DASHBOARD_CACHE_TTL = float(os.getenv("DASHBOARD_CACHE_TTL", "15"))
+DASHBOARD_CACHE_STALE_TTL = float(os.getenv("DASHBOARD_CACHE_STALE_TTL", "60"))
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", "256"))
+
+# Dashboard query daemon
+# Resident Node process holding pooled Snowflake sessions, reached over a Unix socket.
+# Started on demand unless DASHBOARD_DAEMON_AUTOSTART=0 (e.g. when run under a process manager).
+DASHBOARD_DAEMON_ENABLED = os.getenv("DASHBOARD_DAEMON_ENABLED", "1") == "1"
+DASHBOARD_DAEMON_AUTOSTART = os.getenv("DASHBOARD_DAEMON_AUTOSTART", "1") == "1"
+DASHBOARD_DAEMON_SOCKET = os.getenv("DASHBOARD_DAEMON_SOCKET", "/tmp/quack-dashboard.sock")
+DASHBOARD_DAEMON_POOL_SIZE = int(os.getenv("DASHBOARD_DAEMON_POOL_SIZE", "4"))
+DASHBOARD_DAEMON_STARTUP_TIMEOUT = float(os.getenv("DASHBOARD_DAEMON_STARTUP_TIMEOUT", "30"))
+DASHBOARD_DAEMON_RETRY_INTERVAL = float(os.getenv("DASHBOARD_DAEMON_RETRY_INTERVAL", "60"))
+DASHBOARD_DAEMON_STANDIN = os.getenv("DASHBOARD_DAEMON_STANDIN", "0") == "1"
+
+# Decision store (primary-key index over Snowflake decisions)
+# Decisions are immutable once written, so entries can live much longer than dashboard lists.
+DECISION_STORE_TTL = float(os.getenv("DECISION_STORE_TTL", "600"))
+DECISION_STORE_MAX_ENTRIES = int(os.getenv("DECISION_STORE_MAX_ENTRIES", "10000"))
+# Proposals mapped from decisions, kept by id for detail lookups
+PROPOSAL_INDEX_MAX_ENTRIES = int(os.getenv("PROPOSAL_INDEX_MAX_ENTRIES", "10000"))
+# Encoded /governance/proposals pages kept for ETag revalidation (one per query shape)
+PROPOSAL_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("PROPOSAL_RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+# Governance votes
+# Accepted votes are appended to this log in batches of up to VOTE_FLUSH_BATCH, at least every VOTE_FLUSH_INTERVAL seconds.
+VOTE_LOG_PATH = os.getenv("VOTE_LOG_PATH", "votes.jsonl")
+VOTE_FLUSH_INTERVAL = float(os.getenv("VOTE_FLUSH_INTERVAL", "0.05"))
+VOTE_FLUSH_BATCH = int(os.getenv("VOTE_FLUSH_BATCH", "500"))
+
+# Debate transcripts
+# Compressed transcripts are appended to this file; the most recently read ones are kept decompressed.
+TRANSCRIPT_STORE_PATH = os.getenv("TRANSCRIPT_STORE_PATH", "transcripts.bin")
+TRANSCRIPT_CACHE_SIZE = int(os.getenv("TRANSCRIPT_CACHE_SIZE", "256"))
+
+# Wallet signature verification (votes and deposits)
+# Checks are batched onto a worker pool: up to SIGNATURE_BATCH_SIZE per batch, waiting at most SIGNATURE_BATCH_DELAY seconds.
+# Unsigned requests are rejected unless SIGNATURE_REQUIRED=0 (local development); signatures that are sent are always checked.
+# Signed messages older than SIGNATURE_MAX_AGE seconds are rejected, and each nonce is accepted once per wallet.
+SIGNATURE_REQUIRED = os.getenv("SIGNATURE_REQUIRED", "1") == "1"
+SIGNATURE_MAX_AGE = int(os.getenv("SIGNATURE_MAX_AGE", "300"))
+SIGNATURE_BATCH_SIZE = int(os.getenv("SIGNATURE_BATCH_SIZE", "64"))
+SIGNATURE_BATCH_DELAY = float(os.getenv("SIGNATURE_BATCH_DELAY", "0.002"))
+SIGNATURE_WORKERS = int(os.getenv("SIGNATURE_WORKERS", str(min(4, os.cpu_count() or 1))))
+SIGNATURE_CACHE_SIZE = int(os.getenv("SIGNATURE_CACHE_SIZE", "10000"))
+
+# Asynchronous decision jobs
+# Submitted decisions run on a bounded set of runners; finished jobs are kept for the retention window.
+DECISION_JOB_CONCURRENCY = int(os.getenv("DECISION_JOB_CONCURRENCY", str(max(DECISION_POOL_SIZE, 1))))
+DECISION_JOB_MAX_QUEUE = int(os.getenv("DECISION_JOB_MAX_QUEUE", "100"))
+DECISION_JOB_RETENTION = float(os.getenv("DECISION_JOB_RETENTION", "3600"))
+DECISION_JOB_MAX_WAIT = float(os.getenv("DECISION_JOB_MAX_WAIT", "60"))
+
+# Live debate streaming (Server-Sent Events)
+# Each subscriber gets a bounded buffer; a client that falls this far behind is disconnected.
+DEBATE_STREAM_BUFFER = int(os.getenv("DEBATE_STREAM_BUFFER", "64"))
+DEBATE_STREAM_HEARTBEAT = float(os.getenv("DEBATE_STREAM_HEARTBEAT", "15"))
+DEBATE_STREAM_RETENTION = int(os.getenv("DEBATE_STREAM_RETENTION", "20"))
+
+# Decision memoization
+# Identical decision requests within the TTL share one result (0 disables memoization).
+DECISION_MEMO_TTL = float(os.getenv("DECISION_MEMO_TTL", "300"))
+DECISION_MEMO_MAX_ENTRIES = int(os.getenv("DECISION_MEMO_MAX_ENTRIES", "512"))
+
+# Batch decisions
+# Default and maximum number of markets from one batch evaluated at the same time.
+DECISION_BATCH_PARALLELISM = int(os.getenv("DECISION_BATCH_PARALLELISM", str(max(DECISION_POOL_SIZE, 1))))
+DECISION_BATCH_MAX_PARALLELISM = int(os.getenv("DECISION_BATCH_MAX_PARALLELISM", "8"))
+DECISION_BATCH_MAX_ITEMS = int(os.getenv("DECISION_BATCH_MAX_ITEMS", "100"))
+
+# Circuit breaker around the TypeScript/Snowflake dashboard bridge
+# Opens after this many consecutive failures; after the reset timeout one probe call is let through.
+BRIDGE_BREAKER_FAILURE_THRESHOLD = int(os.getenv("BRIDGE_BREAKER_FAILURE_THRESHOLD", "3"))
+BRIDGE_BREAKER_RESET_TIMEOUT = float(os.getenv("BRIDGE_BREAKER_RESET_TIMEOUT", "30"))
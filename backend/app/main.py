@@ -6,9 +6,23 @@ All endpoints should be organized in separate router files.
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 # Import routers
 from routers import vault, users, positions, governance, agents, reports, agentDecision
+from services.decision_memo import decision_memo
+from services.decision_pool import decision_pool
+from services.dashboard import dashboard_cache, dashboard_breaker
+from services.dashboard_daemon import dashboard_daemon
+from services.debate_stream import debate_hub
+from services.decision_store import decision_store
+from services.proposal_index import proposal_index
+from services.response_cache import proposal_responses
+from services.signatures import signature_verifier, used_nonces
+from services.transcript_store import transcript_store
+from services.vote_ledger import vote_ledger
+from services.jobs import decision_jobs
+from services.metrics import CONTENT_TYPE, render_metrics
 
 app = FastAPI(
     title="Quack API",
@@ -50,6 +64,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination and versioning headers read by the frontend
+    expose_headers=["ETag", "X-Next-Cursor", "X-Positions-Version"],
 )
 
 # Register routers
@@ -71,7 +87,31 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "dashboard_cache": dashboard_cache.stats(),
+        "dashboard_breaker": dashboard_breaker.stats(),
+        "decision_store": decision_store.stats(),
+        "proposal_index": proposal_index.stats(),
+        "proposal_responses": proposal_responses.stats(),
+        "decision_jobs": decision_jobs.stats(),
+        "decision_memo": decision_memo.stats(),
+        "debate_stream": debate_hub.stats(),
+        "votes": vote_ledger.stats(),
+        "signatures": {**signature_verifier.stats(), "live_nonces": len(used_nonces)},
+        "transcripts": transcript_store.stats(),
+    }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
 
+
+@app.on_event("shutdown")
+async def shutdown_workers():
+    await decision_jobs.shutdown()
+    await decision_pool.shutdown()
+    await dashboard_daemon.shutdown()
+    await vote_ledger.close()
+    signature_verifier.shutdown()
@@ -0,0 +1,25 @@
+"""
+Base58 (Bitcoin alphabet), as Solana uses for addresses and signatures
+"""
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
+
+def b58decode(value: str) -> bytes:
+    number = 0
+    for char in value:
+        if char not in _BASE58_INDEX:
+            raise ValueError(f"Invalid base58 character: {char!r}")
+        number = number * 58 + _BASE58_INDEX[char]
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    # Each leading "1" is a leading zero byte
+    return b"\0" * (len(value) - len(value.lstrip("1"))) + body
+
+
+def b58encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, digit = divmod(number, 58)
+        encoded = BASE58_ALPHABET[digit] + encoded
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + encoded
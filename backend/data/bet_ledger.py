@@ -0,0 +1,285 @@
+"""
+Columnar bet ledger
+Stores bets one column per field (array module for numbers, small code tables
+for categorical fields) instead of a list of dicts. Filters are bitmasks held
+as Python ints, one bit per row: combining filters is a single AND, counting
+is a popcount, and date ranges are a bisect on the sorted timestamp column.
+Row dicts are only built for the rows actually returned.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import compress, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Categorical columns: row field -> ledger column name
+CATEGORICAL_FIELDS = {
+    "status": "status",
+    "betStatus": "bet_status",
+    "betResult": "result",
+    "vote": "vote",
+}
+
+# Maps the ASCII digits of bin() output to 0/1 bytes for itertools.compress
+_BITS_TABLE = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def parse_timestamp(timestamp: str) -> float:
+    """
+    Seconds since the epoch for an ISO timestamp with an optional trailing Z
+    """
+    return datetime.fromisoformat(timestamp.rstrip("Z")).timestamp()
+
+
+def _code_table(code: int) -> bytes:
+    # translate() table turning one code byte into "1" and every other byte into "0"
+    return bytes(49 if i == code else 48 for i in range(256))
+
+
+class CategoricalColumn:
+    """
+    One byte code per row, plus a bitmask of rows for every distinct value.
+    Masks are brought up to date lazily, so bulk appends stay linear.
+    """
+
+    MAX_VALUES = 256
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes = array("B")
+        self._code_of: Dict[Any, int] = {}
+        self._masks: List[int] = []
+        self._tables: List[bytes] = []
+        self._built = 0  # Rows already folded into _masks
+
+    def append(self, value: Any):
+        code = self._code_of.get(value)
+        if code is None:
+            if len(self.values) >= self.MAX_VALUES:
+                raise ValueError(f"Too many distinct values for a categorical column: {value!r}")
+            code = self._code_of[value] = len(self.values)
+            self.values.append(value)
+            self._masks.append(0)
+            self._tables.append(_code_table(code))
+        self.codes.append(code)
+
+    def _refresh(self):
+        if self._built == len(self.codes):
+            return
+        # Highest row first, so the "0"/"1" string reads as a binary number
+        segment = self.codes[self._built:].tobytes()[::-1]
+        for code, table in enumerate(self._tables):
+            self._masks[code] |= int(segment.translate(table), 2) << self._built
+        self._built = len(self.codes)
+
+    def mask(self, value: Any) -> int:
+        code = self._code_of.get(value)
+        if code is None:
+            return 0
+        self._refresh()
+        return self._masks[code]
+
+    @property
+    def masks(self) -> Dict[Any, int]:
+        self._refresh()
+        return dict(zip(self.values, self._masks))
+
+    def value(self, row: int) -> Any:
+        return self.values[self.codes[row]]
+
+
+class BetLedger:
+    """
+    Bets in columnar form, indexed by id.
+    Rows are expected in timestamp order (as generated); out-of-order appends
+    are supported but make date filters fall back to a scan.
+    """
+
+    def __init__(self, bets: Iterable[Dict[str, Any]] = ()):
+        self.ids: List[str] = []
+        self.descriptions: List[str] = []
+        self.timestamps: List[str] = []
+        self.times = array("d")
+        self.position_sizes = array("q")
+        self.risk_scores = array("d")
+        self.confidences = array("h")
+        self.closed_at: Dict[int, str] = {}  # Sparse: only closed bets carry a closedAt
+        self.columns = {name: CategoricalColumn() for name in CATEGORICAL_FIELDS.values()}
+        self._row_by_id: Dict[str, int] = {}
+        self._sorted = True
+        self.generation = 0  # Bumped on every append, for caches built from the ledger
+        for bet in bets:
+            self.append(bet)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def all(self) -> int:
+        """
+        Mask selecting every row
+        """
+        return (1 << len(self.ids)) - 1
+
+    def append(self, bet: Dict[str, Any]) -> int:
+        """
+        Add a bet and return its row number
+        """
+        row = len(self.ids)
+        time = parse_timestamp(bet["timestamp"])
+        if self.times and time < self.times[-1]:
+            self._sorted = False
+
+        self.ids.append(bet["id"])
+        self.descriptions.append(bet["betDescription"])
+        self.timestamps.append(bet["timestamp"])
+        self.times.append(time)
+        self.position_sizes.append(int(str(bet["positionSize"]).lstrip("$").replace(",", "")))
+        self.risk_scores.append(bet["riskScore"])
+        self.confidences.append(bet["confidence"])
+        if bet.get("closedAt"):
+            self.closed_at[row] = bet["closedAt"]
+        for field, name in CATEGORICAL_FIELDS.items():
+            self.columns[name].append(bet.get(field))
+        self._row_by_id[bet["id"]] = row
+        self.generation += 1
+        return row
+
+    def mask(
+        self,
+        status: Optional[str] = None,
+        bet_status: Optional[str] = None,
+        result: Optional[str] = None,
+        vote: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> int:
+        """
+        Bitmask of rows matching every given filter.
+        start/end are epoch seconds, inclusive.
+        """
+        selected = self.all
+        for name, value in (("status", status), ("bet_status", bet_status), ("result", result), ("vote", vote)):
+            if value is not None:
+                selected &= self.columns[name].mask(value)
+        if start is not None or end is not None:
+            selected &= self.time_mask(start, end)
+        return selected
+
+    def time_mask(self, start: Optional[float] = None, end: Optional[float] = None) -> int:
+        if not self._sorted:
+            selected = 0
+            for row, time in enumerate(self.times):
+                if (start is None or time >= start) and (end is None or time <= end):
+                    selected |= 1 << row
+            return selected
+        lo = bisect_left(self.times, start) if start is not None else 0
+        hi = bisect_right(self.times, end) if end is not None else len(self.times)
+        if hi <= lo:
+            return 0
+        return ((1 << hi) - 1) ^ ((1 << lo) - 1)
+
+    def before_mask(self, time: float, bet_id: str) -> int:
+        """
+        Mask of rows sorting before (time, id), for newest-first keyset pagination
+        """
+        if not self._sorted:
+            selected = 0
+            for row, row_time in enumerate(self.times):
+                if (row_time, self.ids[row]) < (time, bet_id):
+                    selected |= 1 << row
+            return selected
+        lo = bisect_left(self.times, time)
+        hi = bisect_right(self.times, time)
+        selected = (1 << lo) - 1
+        for row in range(lo, hi):
+            if self.ids[row] < bet_id:
+                selected |= 1 << row
+        return selected
+
+    def count(self, mask: Optional[int] = None, **filters) -> int:
+        """
+        Number of rows in mask (or matching the filters)
+        """
+        if mask is None:
+            mask = self.mask(**filters)
+        return bin(mask).count("1")
+
+    def counts_by(self, column: str, mask: Optional[int] = None) -> Dict[Any, int]:
+        """
+        Row count per value of a categorical column, within mask
+        """
+        mask = self.all if mask is None else mask
+        return {
+            value: bin(value_mask & mask).count("1")
+            for value, value_mask in self.columns[column].masks.items()
+        }
+
+    def _flags(self, mask: int) -> bytes:
+        # One 0/1 byte per row, row 0 first
+        flags = bin(mask)[:1:-1].encode().translate(_BITS_TABLE)
+        return flags + bytes(len(self.ids) - len(flags))
+
+    def select(self, column: str, mask: int) -> Iterator[Any]:
+        """
+        Values of a numeric column (position_sizes, risk_scores, confidences, times) within mask
+        """
+        return compress(getattr(self, column), self._flags(mask))
+
+    def sum(self, column: str, mask: Optional[int] = None) -> float:
+        return sum(self.select(column, self.all if mask is None else mask))
+
+    def row_numbers(self, mask: int, newest_first: bool = False) -> Iterator[int]:
+        """
+        Row numbers set in mask, in row order (or reversed)
+        """
+        if newest_first:
+            while mask:
+                row = mask.bit_length() - 1
+                yield row
+                mask ^= 1 << row
+        else:
+            while mask:
+                low_bit = mask & -mask
+                yield low_bit.bit_length() - 1
+                mask ^= low_bit
+
+    def rows(
+        self,
+        mask: Optional[int] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Materialize the rows in mask, stopping after limit.
+        Pages continue from a keyset mask (before_mask), not an offset.
+        """
+        mask = self.all if mask is None else mask
+        return [self.row(row) for row in islice(self.row_numbers(mask, newest_first), limit)]
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """
+        The bet at a row number, in the original dict shape
+        """
+        bet = {
+            "id": self.ids[row],
+            "betDescription": self.descriptions[row],
+            "status": self.columns["status"].value(row),
+            "betStatus": self.columns["bet_status"].value(row),
+            "betResult": self.columns["result"].value(row),
+            "timestamp": self.timestamps[row],
+            "vote": self.columns["vote"].value(row),
+            "positionSize": f"${self.position_sizes[row]:,}",
+            "riskScore": self.risk_scores[row],
+            "confidence": self.confidences[row],
+        }
+        if row in self.closed_at:
+            bet["closedAt"] = self.closed_at[row]
+        return bet
+
+    def get(self, bet_id: str) -> Optional[Dict[str, Any]]:
+        """
+        One bet by id, or None
+        """
+        row = self._row_by_id.get(bet_id)
+        return self.row(row) if row is not None else None
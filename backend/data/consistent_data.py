@@ -1,39 +1,47 @@
 """
 Consistent data generation for all endpoints
 Ensures data matches across vault stats, user stats, portfolio amount, etc.
+The bet dataset is generated on first use (see get_dataset), not at import time.
 """
-from datetime import datetime, timedelta
+from array import array
+from datetime import date, datetime, timedelta
+from functools import cached_property, lru_cache
+from typing import Dict
 import random
 
+from data.bet_ledger import BetLedger
+from data.downsampling import Method, downsample_indices
+from data.positions import PositionBook
+from data.reports import UNIT, NavSnapshot, ReportRollup, unix_day
+from data.wallet_ledger import WalletLedger
+
 # Fixed seed for reproducibility
-random.seed(42)
+SEED = 42
 
 # Vault constants
 TOTAL_VAULT_VALUE_USD = 2847392.45
 SOL_PRICE_USD = 150.0  # Current SOL price
 
+VAULT_TOTAL_SHARES = 1000000  # Assuming 1M shares total
+
 # User constants
 USER_DEPOSITED_SOL = 25.5
 USER_DEPOSITED_USD = USER_DEPOSITED_SOL * SOL_PRICE_USD  # 3825.0
+USER_DEPOSIT_TIMESTAMP = "2024-02-01T10:00:00Z"
 
 # Calculate vault ownership percentage
 VAULT_OWNERSHIP_PERCENT = (USER_DEPOSITED_USD / TOTAL_VAULT_VALUE_USD) * 100
-VAULT_SHARES = (USER_DEPOSITED_USD / TOTAL_VAULT_VALUE_USD) * 1000000  # Assuming 1M shares total
+VAULT_SHARES = (USER_DEPOSITED_USD / TOTAL_VAULT_VALUE_USD) * VAULT_TOTAL_SHARES
+
+# Wallet holding the generated user's deposit and bets. Until deposits are
+# indexed from chain, wallets with no account of their own see this one.
+DEMO_WALLET = "demo"
 
 # Generate 365 bets with consistent outcomes
 TOTAL_BETS = 365
 OPEN_BETS_COUNT = 10
 CLOSED_BETS_COUNT = TOTAL_BETS - OPEN_BETS_COUNT
 
-# Generate bet outcomes (80% win rate for approved bets)
-random.seed(42)  # Reset seed for consistent results
-WIN_COUNT = 0
-LOSE_COUNT = 0
-TOTAL_WIN_AMOUNT = 0.0
-
-# Generate all bets
-ALL_BETS = []
-BET_OUTCOMES = []  # Store outcomes with dates for portfolio history
 BET_DESCRIPTIONS = [
     "Will Trump say tariff",
     "Will BTC hit $100k by March",
@@ -52,190 +60,445 @@ BET_DESCRIPTIONS = [
     "Will Bitcoin halving cause price surge?",
 ]
 
-# Generate 365 bets over the past year
-start_date = datetime.now() - timedelta(days=365)
-for i in range(TOTAL_BETS):
-    bet_date = start_date + timedelta(days=i)
-    bet_id = f"prop-{i+1:03d}"
-    
-    # 80% approval rate
-    is_approved = random.random() < 0.8
-    
-    if is_approved:
-        # 80% win rate for approved bets
-        is_win = random.random() < 0.8
-        bet_status = "OPEN" if i >= (TOTAL_BETS - OPEN_BETS_COUNT) else "CLOSED"
-        
-        if bet_status == "CLOSED":
-            if is_win:
-                WIN_COUNT += 1
-                win_amount = random.uniform(100, 500)  # User's share of win
-                TOTAL_WIN_AMOUNT += win_amount
-                BET_OUTCOMES.append({
-                    "date": bet_date,
-                    "amount": win_amount,
-                    "type": "win"
-                })
+
+class BetDataset:
+    """
+    Generated bets and the user stats derived from them.
+    Bets live in a columnar BetLedger; row dicts are built only when asked for.
+    The user's deposit and settled bets are recorded in a WalletLedger under
+    DEMO_WALLET as they are generated.
+    rng continues the seeded sequence used for the bets, so derived data
+    (portfolio history, positions) stays reproducible without touching the
+    global random module.
+    """
+
+    def __init__(self):
+        self.rng = random.Random(SEED)
+        self.ledger = BetLedger()
+        self.wallets = WalletLedger()
+        self.wallets.deposit(
+            DEMO_WALLET,
+            USER_DEPOSITED_SOL,
+            USER_DEPOSITED_USD,
+            VAULT_SHARES,
+            USER_DEPOSIT_TIMESTAMP,
+            "5j7s...",
+        )
+        self.bet_outcomes = []  # Store outcomes with dates for portfolio history
+        self.win_count = 0
+        self.lose_count = 0
+        self.total_win_amount = 0.0
+        self._generate_bets()
+
+        # Get open bets (last 10 approved bets that are still open)
+        self.open_bets = self._latest(self.ledger.mask(status="APPROVED", bet_status="OPEN"), OPEN_BETS_COUNT)
+
+        # Get closed bets (for positions that have closed)
+        self.closed_bets = self._latest(self.ledger.mask(status="APPROVED", bet_status="CLOSED"), 10)
+
+    def _latest(self, mask: int, count: int) -> list:
+        # Last `count` rows of mask, oldest first
+        return self.ledger.rows(mask, limit=count, newest_first=True)[::-1]
+
+    @cached_property
+    def all_bets(self) -> list:
+        """
+        Every bet as a dict (materializes the whole ledger; prefer ledger queries)
+        """
+        return self.ledger.rows()
+
+    def _generate_bets(self):
+        rng = self.rng
+
+        # Generate 365 bets over the past year
+        start_date = datetime.now() - timedelta(days=365)
+        for i in range(TOTAL_BETS):
+            bet_date = start_date + timedelta(days=i)
+            bet_id = f"prop-{i+1:03d}"
+
+            # 80% approval rate
+            is_approved = rng.random() < 0.8
+
+            if is_approved:
+                # 80% win rate for approved bets
+                is_win = rng.random() < 0.8
+                bet_status = "OPEN" if i >= (TOTAL_BETS - OPEN_BETS_COUNT) else "CLOSED"
+
+                if bet_status == "CLOSED":
+                    if is_win:
+                        self.win_count += 1
+                        win_amount = rng.uniform(100, 500)  # User's share of win
+                        self.total_win_amount += win_amount
+                        self.wallets.settle(DEMO_WALLET, win_amount)
+                        self.bet_outcomes.append({
+                            "date": bet_date,
+                            "amount": win_amount,
+                            "type": "win"
+                        })
+                    else:
+                        self.lose_count += 1
+                        loss_amount = rng.uniform(50, 200)  # User's share of loss
+                        self.total_win_amount -= loss_amount
+                        self.wallets.settle(DEMO_WALLET, -loss_amount)
+                        self.bet_outcomes.append({
+                            "date": bet_date,
+                            "amount": -loss_amount,
+                            "type": "loss"
+                        })
+
+                status = "APPROVED"
+                bet_result = "WIN" if (bet_status == "CLOSED" and is_win) else ("LOSS" if (bet_status == "CLOSED" and not is_win) else None)
             else:
-                LOSE_COUNT += 1
-                loss_amount = random.uniform(50, 200)  # User's share of loss
-                TOTAL_WIN_AMOUNT -= loss_amount
-                BET_OUTCOMES.append({
-                    "date": bet_date,
-                    "amount": -loss_amount,
-                    "type": "loss"
-                })
-        else:
-            # Open bets - assume they'll win (for now)
-            pass
-        
-        status = "APPROVED"
-        bet_result = "WIN" if (bet_status == "CLOSED" and is_win) else ("LOSS" if (bet_status == "CLOSED" and not is_win) else None)
-    else:
-        status = "REJECTED"
-        bet_status = "CLOSED"
-        bet_result = None
-    
-    bet_description = BET_DESCRIPTIONS[i % len(BET_DESCRIPTIONS)]
-    vote = "YES" if random.random() < 0.7 else "NO"
-    
-    ALL_BETS.append({
-        "id": bet_id,
-        "betDescription": bet_description,
-        "status": status,
-        "betStatus": bet_status,
-        "betResult": bet_result,
-        "timestamp": bet_date.isoformat() + "Z",
-        "vote": vote,
-        "positionSize": f"${random.randint(100, 1000):,}",
-        "riskScore": round(random.uniform(4.0, 9.0), 1),
-        "confidence": random.randint(60, 90),
-    })
-
-# Calculate user stats
-USER_WIN_COUNT = WIN_COUNT
-USER_LOSE_COUNT = LOSE_COUNT
-USER_TOTAL_BETS = USER_WIN_COUNT + USER_LOSE_COUNT
-USER_WIN_RATE = (USER_WIN_COUNT / USER_TOTAL_BETS * 100) if USER_TOTAL_BETS > 0 else 0.0
-USER_WIN_AMOUNT = TOTAL_WIN_AMOUNT
-
-# Calculate final portfolio amount based on deposited + earnings
-FINAL_PORTFOLIO_AMOUNT = USER_DEPOSITED_USD + USER_WIN_AMOUNT
-
-# Get open bets (last 10 approved bets that are still open)
-OPEN_BETS = [bet for bet in ALL_BETS if bet["betStatus"] == "OPEN" and bet["status"] == "APPROVED"][-OPEN_BETS_COUNT:]
-
-# Get closed bets (for positions that have closed)
-CLOSED_BETS = [bet for bet in ALL_BETS if bet["betStatus"] == "CLOSED" and bet["status"] == "APPROVED"][-10:]
-
-def generate_portfolio_amount_history(days: int):
-    """
-    Generate portfolio amount history with realistic market trends.
-    1. Starts at USER_DEPOSITED_USD
-    2. Ends at FINAL_PORTFOLIO_AMOUNT
-    3. Follows basic market trend: up, down, up with realistic volatility
-    """
-    data = []
-    current_amount = USER_DEPOSITED_USD
-    start_amount = USER_DEPOSITED_USD
-    end_amount = FINAL_PORTFOLIO_AMOUNT
-    
-    # Calculate overall trend (needed to reach end amount)
-    total_growth = end_amount - start_amount
-    avg_daily_trend = total_growth / days if days > 0 else 0
-    
-    # Generate data points with market-like movements
-    start_date = datetime.now() - timedelta(days=days)
-    trend_direction = 1  # 1 for up, -1 for down
-    trend_duration = 0
-    trend_length = random.randint(15, 45)  # How long current trend lasts
-    
-    for i in range(days):
-        date = start_date + timedelta(days=i)
-        
-        # Change trend direction periodically (market cycles)
-        if trend_duration >= trend_length:
-            trend_direction *= -1  # Flip direction
-            trend_length = random.randint(10, 40)  # New trend duration
-            trend_duration = 0
-        
-        trend_duration += 1
-        
-        # Market movement: combination of trend and volatility
-        # Base trend (slight upward bias to reach target)
-        trend_component = avg_daily_trend * 0.3  # Small base trend
-        
-        # Market cycle (up/down movements)
-        cycle_component = trend_direction * random.uniform(0.005, 0.02) * current_amount
-        
-        # Daily volatility (random market fluctuations)
-        volatility = random.uniform(-0.015, 0.015) * current_amount
-        
-        # Combine all components
-        daily_change = trend_component + cycle_component + volatility
-        current_amount += daily_change
-        
-        # Ensure amount doesn't go negative and stays reasonable
-        current_amount = max(current_amount, start_amount * 0.5)
-        current_amount = min(current_amount, end_amount * 1.5)
-        
-        data.append({
-            "date": date.strftime("%b %d, %Y") if days > 30 else date.strftime("%b %d"),
-            "amount": round(current_amount, 2)
-        })
-    
-    # Smoothly adjust to end amount (last 10% of data points)
-    if len(data) > 10:
-        adjustment_start = int(len(data) * 0.9)
-        for i in range(adjustment_start, len(data)):
-            progress = (i - adjustment_start) / (len(data) - adjustment_start)
-            target_amount = start_amount + (total_growth * (i / len(data)))
-            current_amount = data[i]["amount"]
-            # Gradually move toward target
-            data[i]["amount"] = round(current_amount + (target_amount - current_amount) * 0.3, 2)
-    
-    # Ensure last value matches final amount exactly
-    if len(data) > 0:
-        data[-1]["amount"] = round(FINAL_PORTFOLIO_AMOUNT, 2)
-    
-    # Limit to ~200 points for performance
-    if len(data) > 200:
-        step = len(data) // 200
-        data = data[::step]
-        # Ensure last point is always included
-        if data[-1]["amount"] != round(FINAL_PORTFOLIO_AMOUNT, 2):
-            data[-1]["amount"] = round(FINAL_PORTFOLIO_AMOUNT, 2)
-    
-    return data
+                status = "REJECTED"
+                bet_status = "CLOSED"
+                bet_result = None
+
+            bet_description = BET_DESCRIPTIONS[i % len(BET_DESCRIPTIONS)]
+            vote = "YES" if rng.random() < 0.7 else "NO"
+
+            self.ledger.append({
+                "id": bet_id,
+                "betDescription": bet_description,
+                "status": status,
+                "betStatus": bet_status,
+                "betResult": bet_result,
+                "timestamp": bet_date.isoformat() + "Z",
+                "vote": vote,
+                "positionSize": f"${rng.randint(100, 1000):,}",
+                "riskScore": round(rng.uniform(4.0, 9.0), 1),
+                "confidence": rng.randint(60, 90),
+            })
+
+    @property
+    def user_total_bets(self) -> int:
+        return self.win_count + self.lose_count
+
+    @property
+    def user_win_rate(self) -> float:
+        return (self.win_count / self.user_total_bets * 100) if self.user_total_bets > 0 else 0.0
+
+    @property
+    def final_portfolio_amount(self) -> float:
+        # Final portfolio amount based on deposited + earnings
+        return USER_DEPOSITED_USD + self.total_win_amount
+
+
+@lru_cache(maxsize=None)
+def get_dataset() -> BetDataset:
+    """
+    The bet dataset, generated on first call and cached for the process
+    """
+    return BetDataset()
+
+
+def get_wallet_account(wallet: str) -> dict:
+    """
+    Running totals for a wallet (O(1) ledger read); zeroed for a wallet the ledger hasn't seen
+    """
+    wallets = get_dataset().wallets
+    return wallets.account(wallet) or wallets.empty_account(wallet)
+
+
+def get_wallet_deposits(wallet: str) -> list:
+    return get_dataset().wallets.deposits(wallet)
+
+
+# Names that used to be module constants, now resolved from the dataset on access
+_DATASET_ATTRIBUTES = {
+    "ALL_BETS": lambda d: d.all_bets,
+    "BET_OUTCOMES": lambda d: d.bet_outcomes,
+    "WIN_COUNT": lambda d: d.win_count,
+    "LOSE_COUNT": lambda d: d.lose_count,
+    "TOTAL_WIN_AMOUNT": lambda d: d.total_win_amount,
+    "USER_WIN_COUNT": lambda d: d.win_count,
+    "USER_LOSE_COUNT": lambda d: d.lose_count,
+    "USER_TOTAL_BETS": lambda d: d.user_total_bets,
+    "USER_WIN_RATE": lambda d: d.user_win_rate,
+    "USER_WIN_AMOUNT": lambda d: d.total_win_amount,
+    "FINAL_PORTFOLIO_AMOUNT": lambda d: d.final_portfolio_amount,
+    "OPEN_BETS": lambda d: d.open_bets,
+    "CLOSED_BETS": lambda d: d.closed_bets,
+}
+
+
+def __getattr__(name):
+    # PEP 562: `from data.consistent_data import ALL_BETS` generates the dataset on demand
+    if name in _DATASET_ATTRIBUTES:
+        return _DATASET_ATTRIBUTES[name](get_dataset())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Longest window served by the history endpoints, and default points per response
+HISTORY_MAX_DAYS = 1095
+HISTORY_MAX_POINTS = 200
+
+# Vault series end at the current vault stats
+TVL_START_USD = 2500000.0
+VAULT_SHARE_PRICE = 1.0847
+
+
+class DailySeries:
+    """
+    One full daily series ending yesterday, with both date label formats.
+    Every requested window is a slice of it, so shorter windows agree with longer ones.
+    """
+
+    def __init__(self, today: date, values: array):
+        self.values = values
+        start_date = datetime.combine(today, datetime.min.time()) - timedelta(days=len(values))
+        dates = [start_date + timedelta(days=i) for i in range(len(values))]
+        self.long_labels = [d.strftime("%b %d, %Y") for d in dates]
+        self.short_labels = [d.strftime("%b %d") for d in dates]
+
+    def window(self, days: int, max_points: int = HISTORY_MAX_POINTS, method: Method = "lttb") -> tuple:
+        """
+        (label, value) pairs for the last `days` days, downsampled to at most max_points.
+        The first and last points of the window are always kept.
+        """
+        days = min(days, len(self.values))
+        start = len(self.values) - days
+        labels = self.long_labels if days > 30 else self.short_labels
+        indices = downsample_indices(self.values[start:], max_points, method)
+        return tuple((labels[start + i], self.values[start + i]) for i in indices)
+
+
+class PortfolioSeries(DailySeries):
+    """
+    The user's portfolio amount, from the deposit to FINAL_PORTFOLIO_AMOUNT
+    """
+
+    def __init__(self, today: date, days: int = HISTORY_MAX_DAYS):
+        final_amount = get_dataset().final_portfolio_amount
+        self.final_amount = round(final_amount, 2)
+        super().__init__(today, self._random_walk(days, USER_DEPOSITED_USD, final_amount))
+
+    @staticmethod
+    def _random_walk(days: int, start_amount: float, end_amount: float) -> array:
+        """
+        Market-like walk from start_amount to end_amount: alternating up/down
+        trends with daily volatility, drawn from a private seeded generator
+        """
+        rng = random.Random(f"{SEED}:portfolio")
+        amounts = array("d")
+        current_amount = start_amount
+
+        # Calculate overall trend (needed to reach end amount)
+        total_growth = end_amount - start_amount
+        trend_component = total_growth / days * 0.3 if days > 0 else 0  # Small base trend
+        trend_direction = 1  # 1 for up, -1 for down
+        trend_duration = 0
+        trend_length = rng.randint(15, 45)  # How long current trend lasts
+
+        for _ in range(days):
+            # Change trend direction periodically (market cycles)
+            if trend_duration >= trend_length:
+                trend_direction *= -1
+                trend_length = rng.randint(10, 40)
+                trend_duration = 0
+            trend_duration += 1
+
+            # Market cycle (up/down movements) plus daily volatility
+            cycle_component = trend_direction * rng.uniform(0.005, 0.02) * current_amount
+            volatility = rng.uniform(-0.015, 0.015) * current_amount
+            current_amount += trend_component + cycle_component + volatility
+
+            # Ensure amount doesn't go negative and stays reasonable
+            current_amount = min(max(current_amount, start_amount * 0.5), end_amount * 1.5)
+            amounts.append(round(current_amount, 2))
+
+        # Smoothly adjust to end amount (last 10% of data points)
+        if days > 10:
+            adjustment_start = int(days * 0.9)
+            for i in range(adjustment_start, days):
+                target_amount = start_amount + (total_growth * (i / days))
+                amounts[i] = round(amounts[i] + (target_amount - amounts[i]) * 0.3, 2)
+
+        # Ensure last value matches final amount exactly
+        if days > 0:
+            amounts[-1] = round(end_amount, 2)
+        return amounts
+
+
+def _anchored_walk(rng: random.Random, days: int, start: float, end: float, low: float, high: float) -> array:
+    """
+    Compounding walk with daily returns in [low, high), tilted so it runs from start to end exactly
+    """
+    values = array("d")
+    value = start
+    for _ in range(days):
+        values.append(value)
+        value *= 1 + rng.uniform(low, high)
+    if days > 1:
+        # Spread the gap to the target evenly (geometrically) over the series
+        drift = (end / values[-1]) ** (1 / (days - 1))
+        for i in range(days):
+            values[i] *= drift ** i
+    return values
+
+
+@lru_cache(maxsize=2)
+def get_portfolio_series(today: date) -> PortfolioSeries:
+    """
+    The portfolio series for a given day (rebuilt once per day as the window moves)
+    """
+    return PortfolioSeries(today)
+
+
+@lru_cache(maxsize=2)
+def get_tvl_series(today: date) -> DailySeries:
+    """
+    Total value locked, growing to the current TOTAL_VAULT_VALUE_USD
+    """
+    rng = random.Random(f"{SEED}:tvl")
+    values = _anchored_walk(rng, HISTORY_MAX_DAYS, TVL_START_USD, TOTAL_VAULT_VALUE_USD, -0.02, 0.03)
+    return DailySeries(today, array("d", (round(v, 2) for v in values)))
+
+
+@lru_cache(maxsize=2)
+def get_nav_series(today: date) -> DailySeries:
+    """
+    NAV per vault share, from 1.0 to the current VAULT_SHARE_PRICE
+    """
+    rng = random.Random(f"{SEED}:nav")
+    values = _anchored_walk(rng, HISTORY_MAX_DAYS, 1.0, VAULT_SHARE_PRICE, -0.004, 0.0045)
+    return DailySeries(today, array("d", (round(v, 4) for v in values)))
+
+
+@lru_cache(maxsize=64)
+def _portfolio_window(today: date, days: int, max_points: int, method: Method) -> tuple:
+    return get_portfolio_series(today).window(days, max_points, method)
+
+
+@lru_cache(maxsize=64)
+def _tvl_window(today: date, days: int, max_points: int, method: Method) -> tuple:
+    return get_tvl_series(today).window(days, max_points, method)
+
+
+@lru_cache(maxsize=64)
+def _nav_window(today: date, days: int, max_points: int, method: Method) -> tuple:
+    return get_nav_series(today).window(days, max_points, method)
+
+
+def generate_portfolio_amount_history(days: int, max_points: int = HISTORY_MAX_POINTS, method: Method = "lttb"):
+    """
+    Portfolio amount history for the last `days` days.
+    1. Ends at FINAL_PORTFOLIO_AMOUNT
+    2. Follows basic market trend: up, down, up with realistic volatility
+    3. Is a window of one memoized series, so repeat loads only copy a list
+    4. Is downsampled to at most max_points, keeping the shape of the curve
+    """
+    return [
+        {"date": label, "amount": amount}
+        for label, amount in _portfolio_window(date.today(), days, max_points, method)
+    ]
+
+
+def generate_tvl_history(days: int, max_points: int = HISTORY_MAX_POINTS, method: Method = "lttb"):
+    """
+    TVL history for the last `days` days, ending at TOTAL_VAULT_VALUE_USD
+    """
+    return [
+        {"date": label, "value": value}
+        for label, value in _tvl_window(date.today(), days, max_points, method)
+    ]
+
+
+def generate_nav_history(days: int, max_points: int = HISTORY_MAX_POINTS, method: Method = "lttb"):
+    """
+    NAV history for the last `days` days, ending at VAULT_SHARE_PRICE
+    """
+    return [
+        {"date": label, "nav": nav}
+        for label, nav in _nav_window(date.today(), days, max_points, method)
+    ]
+
+
+class _PositionSchedule:
+    """
+    The position book and each position's close date, in days after the current day
+    """
+
+    def __init__(self, book: PositionBook, close_days: Dict[str, int], day: date):
+        self.book = book
+        self.close_days = close_days
+        self.day = day
+
+
+def _close_date(day: date, close_days: int) -> str:
+    return (day + timedelta(days=close_days)).strftime("%b %d, %Y")
+
+
+@lru_cache(maxsize=None)
+def _position_schedule() -> _PositionSchedule:
+    # Sized once from the dataset's seeded generator
+    dataset = get_dataset()
+    rng = dataset.rng
+    today = date.today()
+    book = PositionBook(USER_DEPOSITED_USD / TOTAL_VAULT_VALUE_USD)
+    close_days = {}
+    for bet in dataset.open_bets:
+        hedge_bet_amount = rng.uniform(50000, 300000)
+        hedge_win_amount = rng.uniform(hedge_bet_amount * 0.03, hedge_bet_amount * 0.15)
+
+        # Close date 7-30 days from the current day
+        close_days[bet["id"]] = rng.randint(7, 30)
+        book.open(bet, hedge_bet_amount, hedge_win_amount, _close_date(today, close_days[bet["id"]]))
+    return _PositionSchedule(book, close_days, today)
+
+
+def get_position_book() -> PositionBook:
+    """
+    Current positions from open bets. Close dates stay relative to the current
+    day: on the first request of a new day every position is repriced with its
+    close date moved forward, so /changes reports them.
+    """
+    schedule = _position_schedule()
+    today = date.today()
+    if schedule.day != today:
+        schedule.day = today
+        for bet_id, close_days in schedule.close_days.items():
+            schedule.book.reprice(bet_id, close_date=_close_date(today, close_days))
+    return schedule.book
+
 
 def generate_positions():
     """
-    Generate current positions from open bets.
-    """
-    positions = []
-    for bet in OPEN_BETS:
-        hedge_bet_amount = random.uniform(50000, 300000)
-        user_share = (USER_DEPOSITED_USD / TOTAL_VAULT_VALUE_USD) * hedge_bet_amount
-        hedge_win_amount = random.uniform(hedge_bet_amount * 0.03, hedge_bet_amount * 0.15)
-        user_win_amount = (USER_DEPOSITED_USD / TOTAL_VAULT_VALUE_USD) * hedge_win_amount
-        
-        # Determine side based on vote (YES = LONG, NO = SHORT)
-        side = "LONG" if bet["vote"] == "YES" else "SHORT"
-        
-        # Generate close date (7-30 days from now)
-        close_days = random.randint(7, 30)
-        close_date = (datetime.now() + timedelta(days=close_days)).strftime("%b %d, %Y")
-        
-        positions.append({
-            "market": "POLYMARKET",
-            "side": side,
-            "betDescription": bet["betDescription"],
-            "vote": bet["vote"],
-            "hedgeBetAmount": f"${hedge_bet_amount:,.2f}",
-            "myShare": f"${user_share:.2f}",
-            "hedgeWinAmount": f"+${hedge_win_amount:,.2f}",
-            "myWinAmount": f"+${user_win_amount:.2f}",
-            "closeDate": close_date,
-        })
-    
-    return positions
+    Current positions from open bets.
+    """
+    return get_position_book().positions()
+
+
+@lru_cache(maxsize=None)
+def _report_rollup() -> ReportRollup:
+    """
+    The report rollup, with the dataset's settled bets recorded (days are closed by get_reports)
+    """
+    dataset = get_dataset()
+    rollup = ReportRollup()
+    ledger = dataset.ledger
+    settled = ledger.rows(ledger.mask(status="APPROVED", bet_status="CLOSED"))
+    for bet, outcome in zip(settled, dataset.bet_outcomes):
+        rollup.record_bet(unix_day(outcome["date"].date()), outcome["amount"], outcome["type"] == "win", bet["betDescription"])
+    return rollup
+
+
+def get_reports() -> ReportRollup:
+    """
+    Daily reports up to yesterday. NAV snapshots come from the TVL and NAV-per-share
+    series (performance PnL, excluding deposit flows). Each call closes only the days
+    after the last closed one, as NavReports would arrive; closed days are kept.
+    """
+    today = date.today()
+    rollup = _report_rollup()
+    tvl = get_tvl_series(today).values
+    share_price = get_nav_series(today).values
+    first_day = unix_day(today) - len(tvl)
+    last_closed = rollup.stats()["last_closed"]
+    start = unix_day(date.fromisoformat(last_closed)) + 1 - first_day if last_closed else 0
+    for i in range(max(start, 0), len(tvl)):
+        # Share-price move on the previous day's shares
+        pnl = (share_price[i] - share_price[i - 1]) * tvl[i - 1] / share_price[i - 1] if i else 0.0
+        shares = tvl[i] / share_price[i]
+        rollup.close_day(NavSnapshot(first_day + i, round(tvl[i] * UNIT), round(shares * UNIT), round(pnl * UNIT)))
+    return rollup
+
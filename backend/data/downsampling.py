@@ -0,0 +1,91 @@
+"""
+Shape-preserving downsampling for chart time series
+Both methods run in linear time over an indexable series of values (list or
+array) spaced evenly in time, and return the indices of the points to keep, so
+callers only materialize the points they send. The first and last points are
+always kept.
+
+- lttb: Largest-Triangle-Three-Buckets, keeps the points that best preserve
+  the visual shape of the line.
+- minmax: keeps the lowest and highest point of every bucket, so no peak or
+  drawdown is ever dropped.
+"""
+from typing import List, Literal, Sequence
+
+Method = Literal["lttb", "minmax"]
+
+
+def lttb_indices(values: Sequence[float], max_points: int) -> List[int]:
+    n = len(values)
+    if max_points >= n:
+        return list(range(n))
+    if max_points <= 2:
+        return [0, n - 1][:max(max_points, 0)]
+
+    # Interior points are split into max_points - 2 buckets
+    every = (n - 2) / (max_points - 2)
+    indices = [0]
+    a = 0
+    for bucket in range(max_points - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+        next_count = next_end - next_start
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = sum(values[next_start:next_end]) / next_count
+
+        # Pick the point in this bucket forming the largest triangle with a and the average
+        ax, ay = a, values[a]
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        max_area = -1.0
+        chosen = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                chosen = j
+        indices.append(chosen)
+        a = chosen
+
+    indices.append(n - 1)
+    return indices
+
+
+def minmax_indices(values: Sequence[float], max_points: int) -> List[int]:
+    n = len(values)
+    if max_points >= n:
+        return list(range(n))
+    if max_points <= 2:
+        return [0, n - 1][:max(max_points, 0)]
+
+    # Each interior bucket contributes its min and max, in time order
+    buckets = (max_points - 2) // 2
+    if buckets == 0:
+        # Room for a single interior point only
+        return lttb_indices(values, max_points)
+    every = (n - 2) / buckets
+    indices = [0]
+    for bucket in range(buckets):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        if start >= end:
+            continue
+        low = high = start
+        for j in range(start + 1, end):
+            if values[j] < values[low]:
+                low = j
+            elif values[j] > values[high]:
+                high = j
+        indices.extend(sorted({low, high}))
+    indices.append(n - 1)
+    return indices
+
+
+def downsample_indices(values: Sequence[float], max_points: int, method: Method = "lttb") -> List[int]:
+    """
+    Indices of at most max_points points of values to keep
+    """
+    if method == "minmax":
+        return minmax_indices(values, max_points)
+    return lttb_indices(values, max_points)
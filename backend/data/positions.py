@@ -0,0 +1,124 @@
+"""
+Versioned positions snapshot
+Positions are computed once and then changed in place as they open or are
+repriced. Every change bumps a book-wide version and stamps it on the position,
+so clients holding version X can ask for just what changed since. Each
+position's JSON is encoded when it changes and the full response is stitched
+from those cached rows, so serving the snapshot does no formatting work.
+The book is seeded from the dataset's open bets and repriced as their close
+dates roll forward (see get_position_book). Nothing settles bets in the
+backend yet, so positions are never closed.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class PositionBook:
+    """
+    Open positions keyed by bet id, in opening order.
+    """
+
+    def __init__(self, user_share_ratio: float):
+        self.user_share_ratio = user_share_ratio
+        self.version = 0
+        self._positions: Dict[str, Dict[str, Any]] = {}  # Dicts keep opening order
+        self._inputs: Dict[str, Tuple[Dict[str, Any], float, float, str]] = {}  # What each row was built from
+        self._encoded: Dict[str, bytes] = {}
+        self._response: Optional[bytes] = None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, bet_id: str) -> bool:
+        return bet_id in self._positions
+
+    def _changed(self, bet: Dict[str, Any], hedge_bet_amount: float, hedge_win_amount: float, close_date: str):
+        # Rebuild one position's row and its encoding
+        self.version += 1
+        bet_id = bet["id"]
+        row = self._row(bet, hedge_bet_amount, hedge_win_amount, close_date)
+        row["version"] = self.version
+        self._positions[bet_id] = row
+        self._inputs[bet_id] = (bet, hedge_bet_amount, hedge_win_amount, close_date)
+        self._encoded[bet_id] = json.dumps(row, separators=(",", ":")).encode()
+        self._response = None
+
+    def _row(self, bet: Dict[str, Any], hedge_bet_amount: float, hedge_win_amount: float, close_date: str) -> Dict[str, Any]:
+        user_share = self.user_share_ratio * hedge_bet_amount
+        user_win_amount = self.user_share_ratio * hedge_win_amount
+        return {
+            "id": bet["id"],
+            "market": "POLYMARKET",
+            # Determine side based on vote (YES = LONG, NO = SHORT)
+            "side": "LONG" if bet["vote"] == "YES" else "SHORT",
+            "betDescription": bet["betDescription"],
+            "vote": bet["vote"],
+            "hedgeBetAmount": f"${hedge_bet_amount:,.2f}",
+            "myShare": f"${user_share:.2f}",
+            "hedgeWinAmount": f"+${hedge_win_amount:,.2f}",
+            "myWinAmount": f"+${user_win_amount:.2f}",
+            "closeDate": close_date,
+        }
+
+    def open(self, bet: Dict[str, Any], hedge_bet_amount: float, hedge_win_amount: float, close_date: str) -> int:
+        """
+        Open (or replace) the position on a bet; returns the new version
+        """
+        self._changed(bet, hedge_bet_amount, hedge_win_amount, close_date)
+        return self.version
+
+    def reprice(
+        self,
+        bet_id: str,
+        hedge_bet_amount: Optional[float] = None,
+        hedge_win_amount: Optional[float] = None,
+        close_date: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Change a position's amounts or close date; returns the new version, or None if it is not open
+        """
+        current = self._inputs.get(bet_id)
+        if current is None:
+            return None
+        bet, bet_amount, win_amount, current_close_date = current
+        self._changed(
+            bet,
+            bet_amount if hedge_bet_amount is None else hedge_bet_amount,
+            win_amount if hedge_win_amount is None else hedge_win_amount,
+            current_close_date if close_date is None else close_date,
+        )
+        return self.version
+
+    def response(self) -> bytes:
+        """
+        The full snapshot as a JSON array, stitched from the cached per-position encodings
+        """
+        if self._response is None:
+            self._response = b"[" + b",".join(self._encoded.values()) + b"]"
+        return self._response
+
+    def positions(self) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self._positions.values()]
+
+    def changes_since(self, version: int) -> Dict[str, Any]:
+        """
+        Positions opened or repriced after `version`.
+        reset is True when `version` is not from this book (e.g. from before a
+        restart); positions is then the full snapshot and the client should
+        replace its copy.
+        """
+        reset = version > self.version
+        return {
+            "version": self.version,
+            "reset": reset,
+            "positions": [
+                dict(row) for row in self._positions.values()
+                if reset or row["version"] > version
+            ],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "open": len(self._positions),
+        }
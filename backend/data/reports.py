@@ -0,0 +1,157 @@
+"""
+Daily report rollups
+Settled bets and daily NAV snapshots (the on-chain NavReport layout: day, nav,
+total_shares, pnl, in underlying units) are rolled up into one report row per
+day as that day closes. Summary aggregates are running totals updated at each
+close, so the summary is O(1) and a day's report is a dict lookup.
+A day closed again (a corrected NavReport, or bets settled after the close)
+replaces its row, and its old contribution is taken back out of the totals first.
+"""
+from bisect import insort
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+
+UNDERLYING_DECIMALS = 6  # USDC
+UNIT = 10 ** UNDERLYING_DECIMALS
+KEY_TRADES = 3  # Largest settled bets listed per report
+EPOCH = date(1970, 1, 1)
+
+
+def unix_day(value: date) -> int:
+    """
+    Day number as NavReport stores it: floor(timestamp / 86400)
+    """
+    return (value - EPOCH).days
+
+
+def day_date(day: int) -> date:
+    return EPOCH + timedelta(days=day)
+
+
+class NavSnapshot(NamedTuple):
+    day: int
+    nav: int  # Underlying units
+    total_shares: int
+    pnl: int  # Signed, underlying units
+
+
+class _DayBets:
+    # Settled bets of one day (kept after the close, so a re-close still has them)
+    __slots__ = ("trades", "wins", "key_trades")
+
+    def __init__(self):
+        self.trades = 0
+        self.wins = 0
+        self.key_trades = []  # (abs pnl, description), largest first, at most KEY_TRADES
+
+
+class _Contribution(NamedTuple):
+    # What a closed day added to the running totals
+    pnl: float
+    trades: int
+    win_rate: Optional[float]  # None when nothing settled that day
+
+
+def _signed(value: float, suffix: str = "") -> str:
+    return f"{'+' if value >= 0 else '-'}{abs(value):,.2f}{suffix}"
+
+
+class ReportRollup:
+    """
+    Per-day report rows keyed by date, with running summary totals.
+    """
+
+    def __init__(self):
+        self._bets: Dict[int, _DayBets] = {}
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._contributions: Dict[str, _Contribution] = {}
+        self._dates: List[str] = []  # Closed days, oldest first
+        self.total_pnl = 0.0
+        self.total_trades = 0
+        self.profitable_days = 0
+        self.win_rate_sum = 0.0
+        self.traded_days = 0
+
+    def record_bet(self, day: int, pnl: float, won: bool, description: str):
+        """
+        Add a settled bet to its day's rollup
+        """
+        bets = self._bets.get(day)
+        if bets is None:
+            bets = self._bets[day] = _DayBets()
+        bets.trades += 1
+        bets.wins += won
+        bets.key_trades.append((abs(pnl), f"Settled {description} ({'WIN' if won else 'LOSS'}, {_signed(pnl)})"))
+        bets.key_trades.sort(key=lambda trade: trade[0], reverse=True)
+        del bets.key_trades[KEY_TRADES:]
+
+    def close_day(self, snapshot: NavSnapshot) -> Dict[str, Any]:
+        """
+        Close a day with its NAV snapshot: build its report row and fold it into the totals
+        """
+        bets = self._bets.get(snapshot.day) or _DayBets()
+        key = day_date(snapshot.day).isoformat()
+        pnl = snapshot.pnl / UNIT
+        opening_nav = (snapshot.nav - snapshot.pnl) / UNIT
+        share_price = snapshot.nav / snapshot.total_shares if snapshot.total_shares else 0.0
+        win_rate = round(bets.wins / bets.trades * 100, 1) if bets.trades else None
+
+        if bets.trades:
+            notes = f"{bets.wins} of {bets.trades} settled bets won."
+        else:
+            notes = "No bets settled."
+        row = {
+            "date": key,
+            "pnl": _signed(pnl),
+            "pnlPercent": _signed(pnl / opening_nav * 100 if opening_nav else 0.0, "%"),
+            "trades": bets.trades,
+            "winRate": win_rate or 0.0,
+            "keyTrades": [description for _, description in bets.key_trades],
+            "agentNotes": f"{notes} NAV per share {share_price:.4f}.",
+            "ipfsReport": None,  # Reports are not pinned to IPFS yet
+        }
+
+        if key in self._rows:
+            self._apply(self._contributions[key], -1)
+        else:
+            insort(self._dates, key)
+        contribution = _Contribution(pnl, bets.trades, win_rate)
+        self._apply(contribution, 1)
+        self._rows[key] = row
+        self._contributions[key] = contribution
+        return row
+
+    def _apply(self, contribution: _Contribution, sign: int):
+        self.total_pnl += sign * contribution.pnl
+        self.total_trades += sign * contribution.trades
+        self.profitable_days += sign * (contribution.pnl > 0)
+        if contribution.win_rate is not None:
+            self.win_rate_sum += sign * contribution.win_rate
+            self.traded_days += sign
+
+    def get(self, day: str) -> Optional[Dict[str, Any]]:
+        return self._rows.get(day)
+
+    def daily(self, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Closed days, newest first
+        """
+        end = len(self._dates) - offset
+        start = max(0, end - limit)
+        return [self._rows[key] for key in reversed(self._dates[start:max(0, end)])]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "totalPnl": round(self.total_pnl, 2),
+            "averageWinRate": round(self.win_rate_sum / self.traded_days, 1) if self.traded_days else 0.0,
+            "totalTrades": self.total_trades,
+            "profitableDays": self.profitable_days,
+            "totalDays": len(self._dates),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "days": len(self._dates),
+            "bet_days": len(self._bets),
+            "last_closed": self._dates[-1] if self._dates else None,
+        }
@@ -0,0 +1,284 @@
+"""
+Scalable synthetic data for load testing
+Generates bets, wallets, per-wallet outcomes and portfolio history, and
+vault NAV/TVL series at production scale (millions of bets, thousands of
+wallets, multi-year series).
+
+- Deterministic: every bet and every wallet has its own RNG derived from the
+  seed, so bet N or wallet W is the same no matter how much else is generated
+  or in what order.
+- Streamed: everything is a generator, memory stays flat.
+- Consistent: a wallet's outcomes come from real (generated) closed bets, and
+  its portfolio history ends at deposit + winnings, as in consistent_data.
+
+Usage:
+    python -m data.synthetic --bets 1000000 --wallets 5000 --days 1095 --out synthetic/
+Writes bets/wallets/nav/tvl as gzipped JSON lines plus a manifest.json.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from data.consistent_data import BET_DESCRIPTIONS, SOL_PRICE_USD, USER_DEPOSITED_USD
+from data.base58 import BASE58_ALPHABET
+
+OPEN_BET_SHARE = 0.03  # Most recent bets are still open
+START_DATE = datetime(2023, 1, 1)
+
+
+def derive_seed(seed: int, *parts: Any) -> int:
+    """
+    Stable 64-bit seed for one entity, independent of Python's hash randomization
+    """
+    key = ":".join(str(part) for part in (seed,) + parts)
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+
+def entity_rng(seed: int, *parts: Any) -> random.Random:
+    return random.Random(derive_seed(seed, *parts))
+
+
+class BetSpace:
+    """
+    A fixed universe of `total` bets spread evenly over `days` days.
+    Any bet can be generated on its own by index.
+    """
+
+    def __init__(self, seed: int = 42, total: int = 1_000_000, days: int = 1095, start: datetime = START_DATE):
+        self.seed = seed
+        self.total = total
+        self.days = days
+        self.start = start
+        self.open_from = total - max(1, int(total * OPEN_BET_SHARE))
+        self._interval = days * 86400 / total
+
+    def timestamp(self, index: int) -> datetime:
+        return self.start + timedelta(seconds=index * self._interval)
+
+    def bet(self, index: int) -> Dict[str, Any]:
+        """
+        Bet number `index`, same shape as consistent_data bets
+        """
+        rng = entity_rng(self.seed, "bet", index)
+        is_approved = rng.random() < 0.8
+        is_win = rng.random() < 0.8
+        if is_approved:
+            status = "APPROVED"
+            bet_status = "OPEN" if index >= self.open_from else "CLOSED"
+            bet_result = None if bet_status == "OPEN" else ("WIN" if is_win else "LOSS")
+        else:
+            status = "REJECTED"
+            bet_status = "CLOSED"
+            bet_result = None
+
+        return {
+            "id": f"prop-{index + 1:03d}",
+            "betDescription": BET_DESCRIPTIONS[index % len(BET_DESCRIPTIONS)],
+            "status": status,
+            "betStatus": bet_status,
+            "betResult": bet_result,
+            "timestamp": self.timestamp(index).isoformat() + "Z",
+            "vote": "YES" if rng.random() < 0.7 else "NO",
+            "positionSize": f"${rng.randint(100, 1000):,}",
+            "riskScore": round(rng.uniform(4.0, 9.0), 1),
+            "confidence": rng.randint(60, 90),
+        }
+
+    def bets(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream bets [start, stop) in timestamp order
+        """
+        for index in range(start, self.total if stop is None else min(stop, self.total)):
+            yield self.bet(index)
+
+
+def wallet_address(seed: int, index: int) -> str:
+    """
+    Deterministic base58 wallet address (44 characters, like a Solana public key)
+    """
+    rng = entity_rng(seed, "address", index)
+    return "".join(rng.choice(BASE58_ALPHABET) for _ in range(44))
+
+
+def wallet(space: BetSpace, address: str) -> Dict[str, Any]:
+    """
+    A wallet's deposit and outcomes. Depends only on the seed, the bet space and the address.
+    """
+    rng = entity_rng(space.seed, "wallet", address)
+    deposited_sol = round(rng.uniform(0.5, 500.0), 2)
+    deposit_cents = round(deposited_sol * SOL_PRICE_USD * 100)
+    deposited_usd = deposit_cents / 100
+    # Win/loss sizes scale with the deposit, relative to the single mock user
+    scale = deposited_usd / USER_DEPOSITED_USD
+
+    participations = min(space.open_from, rng.randint(20, 400))
+    indexes = sorted(rng.sample(range(space.open_from), participations))
+    deposit_index = indexes[0] if indexes else 0
+
+    # Amounts are kept in whole cents so deposit + winnings adds up exactly
+    outcomes = []
+    total_cents = 0
+    win_count = lose_count = 0
+    for index in indexes:
+        bet = space.bet(index)
+        if bet["betResult"] == "WIN":
+            amount = rng.uniform(100, 500) * scale
+            win_count += 1
+        elif bet["betResult"] == "LOSS":
+            amount = -rng.uniform(50, 200) * scale
+            lose_count += 1
+        else:
+            continue
+        cents = round(amount * 100)
+        total_cents += cents
+        outcomes.append({"betId": bet["id"], "date": bet["timestamp"], "amount": cents / 100})
+
+    total_bets = win_count + lose_count
+    return {
+        "address": address,
+        "depositedSol": deposited_sol,
+        "depositedUsd": deposited_usd,
+        "depositDate": space.timestamp(deposit_index).isoformat() + "Z",
+        "winCount": win_count,
+        "loseCount": lose_count,
+        "totalBets": total_bets,
+        "winRate": (win_count / total_bets * 100) if total_bets > 0 else 0.0,
+        "winAmount": total_cents / 100,
+        "finalPortfolioAmount": (deposit_cents + total_cents) / 100,
+        "outcomes": outcomes,
+    }
+
+
+def wallets(space: BetSpace, count: int) -> Iterator[Dict[str, Any]]:
+    for index in range(count):
+        yield wallet(space, wallet_address(space.seed, index))
+
+
+def portfolio_history(wallet_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Daily portfolio amount for a wallet: deposit plus realized outcomes to date.
+    The last point is exactly deposit + winnings.
+    """
+    outcomes = wallet_data["outcomes"]
+    if not outcomes:
+        yield {"date": wallet_data["depositDate"][:10], "amount": wallet_data["depositedUsd"]}
+        return
+
+    cents = round(wallet_data["depositedUsd"] * 100)
+    day = outcomes[0]["date"][:10]
+    for outcome in outcomes:
+        if outcome["date"][:10] != day:
+            yield {"date": day, "amount": cents / 100}
+            day = outcome["date"][:10]
+        cents += round(outcome["amount"] * 100)
+    yield {"date": day, "amount": cents / 100}
+
+
+def nav_series(seed: int = 42, days: int = 1095, start: datetime = START_DATE) -> Iterator[Dict[str, Any]]:
+    """
+    Daily vault NAV per share: a random walk with slight positive drift, starting at 1.0
+    """
+    rng = entity_rng(seed, "nav")
+    nav = 1.0
+    for day in range(days):
+        yield {"date": (start + timedelta(days=day)).strftime("%Y-%m-%d"), "nav": round(nav, 6)}
+        nav *= math.exp(rng.gauss(0.0003, 0.008))
+
+
+def tvl_series(seed: int = 42, days: int = 1095, start: datetime = START_DATE, base: float = 2500000.0) -> Iterator[Dict[str, Any]]:
+    """
+    Daily total value locked: growth with net deposit flows and daily noise
+    """
+    rng = entity_rng(seed, "tvl")
+    tvl = base
+    for day in range(days):
+        yield {"date": (start + timedelta(days=day)).strftime("%Y-%m-%d"), "tvl": round(tvl, 2)}
+        tvl = max(tvl * (1 + rng.uniform(-0.02, 0.03)) + rng.uniform(-5000, 10000), base * 0.1)
+
+
+def write_jsonl(path: Path, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Stream records to a JSON lines file (gzipped if the name ends in .gz); returns the count
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    count = 0
+    with opener(path, "wt", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records back from a file written by write_jsonl
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_dataset(out_dir: Path, seed: int, bets: int, wallet_count: int, days: int) -> Dict[str, Any]:
+    """
+    Write a full synthetic dataset to out_dir and return its manifest
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    space = BetSpace(seed=seed, total=bets, days=days)
+    started = time.perf_counter()
+
+    violations = []
+
+    def checked_wallets():
+        # Invariant from consistent_data: the portfolio ends at deposit + winnings
+        for wallet_data in wallets(space, wallet_count):
+            last = None
+            for last in portfolio_history(wallet_data):
+                pass
+            if last["amount"] != wallet_data["finalPortfolioAmount"]:
+                violations.append(wallet_data["address"])
+            yield wallet_data
+
+    counts = {
+        "bets": write_jsonl(out_dir / "bets.jsonl.gz", space.bets()),
+        "wallets": write_jsonl(out_dir / "wallets.jsonl.gz", checked_wallets()),
+        "nav": write_jsonl(out_dir / "nav.jsonl.gz", nav_series(seed, days)),
+        "tvl": write_jsonl(out_dir / "tvl.jsonl.gz", tvl_series(seed, days)),
+    }
+
+    manifest = {
+        "seed": seed,
+        "days": days,
+        "start": START_DATE.isoformat(),
+        "counts": counts,
+        "invariantViolations": len(violations),
+        "generatedIn": round(time.perf_counter() - started, 2),
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset for load testing")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--bets", type=int, default=1_000_000)
+    parser.add_argument("--wallets", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=1095)
+    parser.add_argument("--out", type=Path, default=Path("synthetic"))
+    args = parser.parse_args()
+
+    manifest = write_dataset(args.out, args.seed, args.bets, args.wallets, args.days)
+    print(json.dumps(manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Per-wallet ledger
+One row per depositor, hash-indexed by wallet address, with running totals
+(deposits, vault shares, win/loss counts, realized PnL) kept in array-module
+columns. Deposits and bet settlements update the totals as they happen, so
+every per-wallet stat is an O(1) read. Deposit history is a columnar log with
+a per-wallet linked list through it, so tens of thousands of wallets cost a
+few dozen bytes each rather than a dict apiece.
+"""
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from data.bet_ledger import CategoricalColumn, parse_timestamp
+
+NO_ROW = -1
+
+
+class WalletLedger:
+    """
+    Wallet accounts in columnar form, indexed by address.
+    """
+
+    def __init__(self):
+        # Accounts, one row per wallet
+        self.addresses: List[str] = []
+        self.deposited_sol = array("d")
+        self.deposited_usd = array("d")
+        self.shares = array("d")
+        self.win_counts = array("l")
+        self.lose_counts = array("l")
+        self.realized_pnl = array("d")
+        self.first_deposit = array("l")  # Deposit log row, NO_ROW until the first deposit
+        self.last_deposit = array("l")
+        self._row_by_address: Dict[str, int] = {}
+
+        # Deposit log, one row per deposit
+        self.deposit_ids: List[str] = []
+        self.deposit_wallets = array("l")
+        self.deposit_amounts = array("d")
+        self.deposit_times = array("d")
+        self.deposit_timestamps: List[str] = []
+        self.deposit_hashes: List[str] = []
+        self.deposit_status = CategoricalColumn()
+        self.deposit_next = array("l")  # Next deposit of the same wallet, or NO_ROW
+
+        # Vault-wide totals
+        self.total_shares = 0.0
+        self.total_deposited_usd = 0.0
+        self.settlements = 0
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._row_by_address
+
+    def _row(self, address: str) -> int:
+        # Row for address, opening an empty account on first sight
+        row = self._row_by_address.get(address)
+        if row is None:
+            row = self._row_by_address[address] = len(self.addresses)
+            self.addresses.append(address)
+            for column in (self.deposited_sol, self.deposited_usd, self.shares, self.realized_pnl):
+                column.append(0.0)
+            for column in (self.win_counts, self.lose_counts):
+                column.append(0)
+            self.first_deposit.append(NO_ROW)
+            self.last_deposit.append(NO_ROW)
+        return row
+
+    def deposit(
+        self,
+        address: str,
+        amount_sol: float,
+        amount_usd: float,
+        shares: float,
+        timestamp: str,
+        transaction_hash: str,
+        status: str = "confirmed",
+        deposit_id: Optional[str] = None,
+    ) -> str:
+        """
+        Record a deposit and credit its shares; returns the deposit id
+        """
+        row = self._row(address)
+        entry = len(self.deposit_ids)
+        deposit_id = deposit_id or f"deposit-{entry + 1:03d}"
+
+        self.deposit_ids.append(deposit_id)
+        self.deposit_wallets.append(row)
+        self.deposit_amounts.append(amount_sol)
+        self.deposit_times.append(parse_timestamp(timestamp))
+        self.deposit_timestamps.append(timestamp)
+        self.deposit_hashes.append(transaction_hash)
+        self.deposit_status.append(status)
+        self.deposit_next.append(NO_ROW)
+        if self.last_deposit[row] == NO_ROW:
+            self.first_deposit[row] = entry
+        else:
+            self.deposit_next[self.last_deposit[row]] = entry
+        self.last_deposit[row] = entry
+
+        self.deposited_sol[row] += amount_sol
+        self.deposited_usd[row] += amount_usd
+        self.shares[row] += shares
+        self.total_shares += shares
+        self.total_deposited_usd += amount_usd
+        return deposit_id
+
+    def settle(self, address: str, pnl: float):
+        """
+        Apply a settled bet's outcome to a wallet: a gain counts as a win, a loss
+        as a loss, and a break-even bet as neither
+        """
+        row = self._row(address)
+        if pnl > 0:
+            self.win_counts[row] += 1
+        elif pnl < 0:
+            self.lose_counts[row] += 1
+        self.realized_pnl[row] += pnl
+        self.settlements += 1
+
+    def account(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        A wallet's running totals, or None for an unknown wallet
+        """
+        row = self._row_by_address.get(address)
+        if row is None:
+            return None
+        wins = self.win_counts[row]
+        total_bets = wins + self.lose_counts[row]
+        first = self.first_deposit[row]
+        return {
+            "address": address,
+            "depositedSol": self.deposited_sol[row],
+            "depositedUsd": self.deposited_usd[row],
+            "shares": self.shares[row],
+            "winCount": wins,
+            "loseCount": self.lose_counts[row],
+            "totalBets": total_bets,
+            "winRate": (wins / total_bets * 100) if total_bets > 0 else 0.0,
+            "realizedPnl": self.realized_pnl[row],
+            "firstDepositAt": datetime.fromtimestamp(self.deposit_times[first]) if first != NO_ROW else None,
+        }
+
+    @staticmethod
+    def empty_account(address: str) -> Dict[str, Any]:
+        """
+        Zeroed totals, in the account() shape, for a wallet with no ledger row
+        """
+        return {
+            "address": address,
+            "depositedSol": 0.0,
+            "depositedUsd": 0.0,
+            "shares": 0.0,
+            "winCount": 0,
+            "loseCount": 0,
+            "totalBets": 0,
+            "winRate": 0.0,
+            "realizedPnl": 0.0,
+            "firstDepositAt": None,
+        }
+
+    def _deposit_rows(self, row: int) -> Iterator[int]:
+        entry = self.first_deposit[row]
+        while entry != NO_ROW:
+            yield entry
+            entry = self.deposit_next[entry]
+
+    def deposits(self, address: str) -> List[Dict[str, Any]]:
+        """
+        A wallet's deposits, oldest first
+        """
+        row = self._row_by_address.get(address)
+        if row is None:
+            return []
+        return [
+            {
+                "id": self.deposit_ids[entry],
+                "amount": self.deposit_amounts[entry],
+                "timestamp": self.deposit_timestamps[entry],
+                "transactionHash": self.deposit_hashes[entry],
+                "status": self.deposit_status.value(entry),
+            }
+            for entry in self._deposit_rows(row)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "wallets": len(self.addresses),
+            "deposits": len(self.deposit_ids),
+            "settlements": self.settlements,
+            "total_shares": round(self.total_shares, 4),
+            "total_deposited_usd": round(self.total_deposited_usd, 2),
+        }
@@ -2,14 +2,28 @@
 Agent decision endpoint
 Calls the TypeScript decision engine
 """
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Literal, Optional
-import subprocess
+import asyncio
 import json
-import os
-import sys
+import uuid
 from pathlib import Path
+from app.config import (
+    TS_DECISION_TIMEOUT,
+    DECISION_JOB_MAX_WAIT,
+    DECISION_BATCH_PARALLELISM,
+    DECISION_BATCH_MAX_PARALLELISM,
+    DECISION_BATCH_MAX_ITEMS,
+)
+from services.debate_stream import debate_hub, messages_from_result
+from services.decision_memo import decision_memo
+from services.decision_pool import decision_pool, WorkerStartError
+from services.jobs import decision_jobs, Job, QueueFull
+from services.metrics import bridge_fallbacks
+from services.transcript_store import transcript_from_result, transcript_store
+from services.ts_bridge import run_process, parse_json_output, BridgeError, BridgeTimeout
 
 router = APIRouter()
 
@@ -39,6 +53,12 @@ class DecisionRequest(BaseModel):
     data: Optional[AgentData] = None
 
 
+class BatchDecisionRequest(BaseModel):
+    markets: List[MarketData] = Field(..., min_length=1, max_length=DECISION_BATCH_MAX_ITEMS)
+    data: Optional[AgentData] = None  # Shared by every market in the batch
+    parallelism: Optional[int] = Field(None, ge=1, le=DECISION_BATCH_MAX_PARALLELISM)
+
+
 class AgentDecision(BaseModel):
     direction: Literal["YES", "NO"]
     confidence: float
@@ -85,9 +105,28 @@ class DecisionResponse(BaseModel):
     error: Optional[str] = None
 
 
-def call_typescript_service(request_data: Dict[str, Any]) -> Dict[str, Any]:
+class BatchDecisionItem(BaseModel):
+    index: int  # Position of the market in the request
+    status: Literal["ok", "error"]
+    market: Optional[MarketData] = None
+    result: Optional[DecisionResponse] = None
+    error: Optional[str] = None
+
+
+class DecisionJobResponse(BaseModel):
+    jobId: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    createdAt: float
+    startedAt: Optional[float] = None
+    finishedAt: Optional[float] = None
+    queueDepth: int
+    result: Optional[DecisionResponse] = None
+    error: Optional[str] = None
+
+
+async def call_typescript_service(request_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Call the TypeScript decision service
+    Call the TypeScript decision service in a one-off process
     Tries compiled JS first, then falls back to ts-node
     """
     request_json = json.dumps(request_data)
@@ -95,67 +134,163 @@ def call_typescript_service(request_data: Dict[str, Any]) -> Dict[str, Any]:
     # Try compiled JavaScript first
     if TS_SERVICE_JS.exists():
         try:
-            result = subprocess.run(
+            result = await run_process(
                 ["node", str(TS_SERVICE_JS)],
-                input=request_json,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(BACKEND_DIR)
+                input_data=request_json,
+                timeout=TS_DECISION_TIMEOUT,
+                label="decision",
+                kind="decision",
             )
             if result.returncode == 0:
-                return json.loads(result.stdout)
-        except Exception as e:
+                return parse_json_output(result.stdout, label="decision")
+        except BridgeTimeout:
+            raise Exception(f"TypeScript service timed out after {TS_DECISION_TIMEOUT:g} seconds")
+        except BridgeError as e:
             print(f"Error running compiled JS: {e}")
+        bridge_fallbacks.inc(function="decision", reason="compiled_js_failed")
     
     # Fall back to ts-node
     try:
-        result = subprocess.run(
+        result = await run_process(
             ["npx", "ts-node", "--project", "tsconfig.json", str(TS_SERVICE)],
-            input=request_json,
-            capture_output=True,
-            text=True,
-            timeout=120,  # Increased timeout for full pipeline
-            cwd=str(BACKEND_DIR)
+            input_data=request_json,
+            timeout=TS_DECISION_TIMEOUT,  # Full pipeline
+            label="decision",
+            kind="decision",
         )
-        if result.returncode == 0:
-            # Log stderr for debugging (contains console.log output)
-            if result.stderr:
-                print(f"[TypeScript] Logs: {result.stderr[:500]}")  # First 500 chars of logs
-            
-            # Parse JSON from stdout (should be clean JSON now)
-            stdout_lines = result.stdout.strip().split('\n')
-            # Find the last line that looks like JSON (in case there are any stray logs)
-            json_line = None
-            for line in reversed(stdout_lines):
-                line = line.strip()
-                if line and (line.startswith('{') or line.startswith('[')):
-                    json_line = line
-                    break
-            
-            if json_line:
-                return json.loads(json_line)
-            else:
-                # Fallback: try parsing entire stdout
-                return json.loads(result.stdout.strip())
-        else:
-            error_msg = result.stderr or result.stdout or "Unknown error"
-            raise Exception(f"ts-node error: {error_msg}")
-    except FileNotFoundError:
+    except BridgeTimeout:
+        raise Exception(f"TypeScript service timed out after {TS_DECISION_TIMEOUT:g} seconds")
+    except BridgeError:
         raise Exception(
             "TypeScript service not available. Please install dependencies:\n"
             "  cd backend && npm install\n"
             "Then either compile: npm run build\n"
             "Or ensure ts-node is available: npm install -g ts-node"
         )
-    except json.JSONDecodeError as e:
-        raise Exception(f"Invalid response from TypeScript service: {e}")
-    except subprocess.TimeoutExpired:
-        raise Exception("TypeScript service timed out after 60 seconds")
+
+    if result.returncode != 0:
+        error_msg = result.stderr or result.stdout or "Unknown error"
+        raise Exception(f"ts-node error: {error_msg}")
+
+    # Log stderr for debugging (contains console.log output)
+    if result.stderr:
+        print(f"[TypeScript] Logs: {result.stderr[:500]}")  # First 500 chars of logs
+
+    # stdout should be clean JSON, but skip any stray log lines
+    return parse_json_output(result.stdout, label="decision")
+
+
+async def run_decision(request_data: Dict[str, Any], debate_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a decision on the persistent worker pool.
+    Falls back to a one-off process when the pool is disabled or cannot start a worker.
+    Debate messages are published to the live debate stream under debate_id as they arrive.
+    """
+    debate_id = debate_id or str(uuid.uuid4())
+    debate_hub.start(debate_id)
+    try:
+        result = None
+        if decision_pool.enabled:
+            try:
+                result = await decision_pool.run_decision(
+                    request_data,
+                    on_event=lambda event: debate_hub.publish(debate_id, event),
+                )
+            except WorkerStartError as e:
+                print(f"Decision worker pool unavailable, spawning one-off process: {e}")
+                bridge_fallbacks.inc(function="decision", reason="worker_unavailable")
+
+        if result is None:
+            # One-off processes only report at the end, so publish the whole transcript at once
+            result = await call_typescript_service(request_data)
+            for message in messages_from_result(result):
+                debate_hub.publish(debate_id, message)
+
+        # Keep the transcript under the stored decision's id for detail pages;
+        # failing to store it doesn't fail the decision
+        if result.get("decision_id"):
+            await transcript_store.keep(result["decision_id"], transcript_from_result(result))
+        return result
+    finally:
+        debate_hub.finish(debate_id)
+
+
+async def decide(
+    request_data: Dict[str, Any],
+    debate_id: Optional[str] = None,
+    fresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run a decision through the memo cache.
+    Identical requests within the memo TTL reuse the last result (and its transcript);
+    auto-select requests (no market) only share a run already in flight.
+    fresh=True skips the memo and replaces its entry.
+    """
+    ran = False
+
+    async def run():
+        nonlocal ran
+        ran = True
+        return await run_decision(request_data, debate_id=debate_id)
+
+    result = await decision_memo.get(request_data, run, fresh=fresh)
+    if not ran and debate_id:
+        # Reused result: replay its transcript for anyone following this debate
+        debate_hub.open(debate_id)
+        for message in messages_from_result(result):
+            debate_hub.publish(debate_id, message)
+        debate_hub.finish(debate_id)
+    return result
+
+
+def build_request_data(request: DecisionRequest) -> Dict[str, Any]:
+    """
+    Convert a DecisionRequest to the dict sent to the TypeScript service,
+    handling None/empty cases
+    """
+    request_data = {}
+    
+    if request.market:
+        market_dict = request.market.dict(exclude_none=True)
+        # If market is empty or missing required fields, pass empty dict for auto-selection
+        if not market_dict or (not market_dict.get("symbol") and not market_dict.get("question")):
+            request_data["market"] = {}
+        else:
+            request_data["market"] = market_dict
+    else:
+        request_data["market"] = {}
+    
+    if request.data:
+        request_data["data"] = request.data.dict(exclude_none=True)
+    else:
+        request_data["data"] = {}
+    
+    return request_data
+
+
+def to_decision_response(result: Dict[str, Any]) -> DecisionResponse:
+    """
+    Map the enhanced TypeScript response to DecisionResponse
+    """
+    return DecisionResponse(
+        status=result.get("status", "ok"),
+        decision_id=result.get("decision_id"),
+        investment_decision=result.get("investment_decision"),
+        agent_analysis=result.get("agent_analysis"),
+        conversation_logs=result.get("conversation_logs"),
+        market_info=result.get("market_info"),
+        # Legacy fields for backward compatibility
+        decision=result.get("decision"),
+        agents=result.get("agents"),
+        error=result.get("error")
+    )
 
 
 @router.post("/decision", response_model=DecisionResponse)
-async def get_agent_decision(request: DecisionRequest):
+async def get_agent_decision(
+    request: DecisionRequest,
+    fresh: bool = Query(False, description="Skip the decision memo and run a new debate")
+):
     """
     Run the 5-agent Gemini decision engine and return enhanced consensus.
     This endpoint calls the TypeScript decision engine and returns:
@@ -163,44 +298,12 @@ async def get_agent_decision(request: DecisionRequest):
     - Agent analysis with 4-sentence reasoning from each agent
     - Full conversation logs (initial, debate, final)
     - Market information
+    Identical requests within the memo TTL return the same decision unless fresh=true.
     """
     try:
-        # Convert request to dict, handling None/empty cases
-        request_data = {}
-        
-        if request.market:
-            market_dict = request.market.dict(exclude_none=True)
-            # If market is empty or missing required fields, pass empty dict for auto-selection
-            if not market_dict or (not market_dict.get("symbol") and not market_dict.get("question")):
-                request_data["market"] = {}
-            else:
-                request_data["market"] = market_dict
-        else:
-            request_data["market"] = {}
-        
-        if request.data:
-            request_data["data"] = request.data.dict(exclude_none=True)
-        else:
-            request_data["data"] = {}
-        
         # Call TypeScript service
-        result = call_typescript_service(request_data)
-        
-        # Map enhanced response to DecisionResponse
-        response = DecisionResponse(
-            status=result.get("status", "ok"),
-            decision_id=result.get("decision_id"),
-            investment_decision=result.get("investment_decision"),
-            agent_analysis=result.get("agent_analysis"),
-            conversation_logs=result.get("conversation_logs"),
-            market_info=result.get("market_info"),
-            # Legacy fields for backward compatibility
-            decision=result.get("decision"),
-            agents=result.get("agents"),
-            error=result.get("error")
-        )
-        
-        return response
+        result = await decide(build_request_data(request), fresh=fresh)
+        return to_decision_response(result)
         
     except Exception as e:
         raise HTTPException(
@@ -208,3 +311,95 @@ async def get_agent_decision(request: DecisionRequest):
             detail=f"Error processing decision: {str(e)}"
         )
 
+
+async def run_batch(request: BatchDecisionRequest, fresh: bool):
+    """
+    Evaluate every market in the batch, at most `parallelism` at a time,
+    yielding one NDJSON line per market as soon as it finishes
+    """
+    semaphore = asyncio.Semaphore(request.parallelism or DECISION_BATCH_PARALLELISM)
+
+    async def evaluate(index: int, market: MarketData) -> BatchDecisionItem:
+        async with semaphore:
+            try:
+                request_data = build_request_data(DecisionRequest(market=market, data=request.data))
+                result = to_decision_response(await decide(request_data, fresh=fresh))
+            except Exception as e:
+                return BatchDecisionItem(index=index, status="error", market=market, error=str(e))
+        status = "error" if result.status == "error" else "ok"
+        return BatchDecisionItem(index=index, status=status, market=market, result=result, error=result.error)
+
+    tasks = [asyncio.ensure_future(evaluate(i, market)) for i, market in enumerate(request.markets)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            item = await next_done
+            yield json.dumps(item.dict()) + "\n"
+    finally:
+        # Client went away: stop evaluating the rest of the batch
+        for task in tasks:
+            task.cancel()
+
+
+@router.post("/decision/batch")
+async def batch_agent_decisions(
+    request: BatchDecisionRequest,
+    fresh: bool = Query(False, description="Skip the decision memo and run new debates")
+):
+    """
+    Run decisions for a slate of markets sharing the same AgentData.
+    Streams newline-delimited JSON, one BatchDecisionItem per market in completion order.
+    A failed market is reported in its own item and does not fail the batch.
+    """
+    return StreamingResponse(run_batch(request, fresh), media_type="application/x-ndjson")
+
+
+def to_job_response(job: Job) -> DecisionJobResponse:
+    return DecisionJobResponse(
+        jobId=job.id,
+        status=job.status,
+        createdAt=job.created_at,
+        startedAt=job.started_at,
+        finishedAt=job.finished_at,
+        queueDepth=decision_jobs.queue_depth,
+        result=to_decision_response(job.result) if job.result is not None else None,
+        error=job.error,
+    )
+
+
+@router.post("/decision/jobs", response_model=DecisionJobResponse, status_code=202)
+async def submit_decision_job(
+    request: DecisionRequest,
+    fresh: bool = Query(False, description="Skip the decision memo and run a new debate")
+):
+    """
+    Queue a decision and return a job id immediately.
+    Poll GET /decision/jobs/{job_id} (optionally with ?wait=N to long-poll) for the result,
+    or follow the debate live at GET /api/agents/debate/{job_id}/stream.
+    """
+    request_data = build_request_data(request)
+    try:
+        # The job id doubles as the debate id; `job` is bound before the runner calls this
+        job = decision_jobs.submit(lambda: decide(request_data, debate_id=job.id, fresh=fresh))
+    except QueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    debate_hub.open(job.id)
+    return to_job_response(job)
+
+
+@router.get("/decision/jobs/{job_id}", response_model=DecisionJobResponse)
+async def get_decision_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=DECISION_JOB_MAX_WAIT, description="Seconds to wait for the job to finish")
+):
+    """
+    Get the status of a decision job, including its result once finished.
+    Jobs are kept for the retention window after they finish.
+    """
+    job = decision_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if wait and not job.finished:
+        await job.wait(wait)
+    
+    return to_job_response(job)
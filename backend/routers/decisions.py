@@ -5,57 +5,11 @@ Fetches decisions from Snowflake database
 from fastapi import APIRouter, Query, HTTPException
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-import subprocess
 import json
-from pathlib import Path
+from services.decision_store import decision_store
 
 router = APIRouter()
 
-# Path to the TypeScript dashboard service
-BACKEND_DIR = Path(__file__).parent.parent
-TS_DASHBOARD = BACKEND_DIR / "src" / "services" / "snowflake" / "dashboard.ts"
-
-
-def call_typescript_dashboard(function_name: str, *args) -> Any:
-    """
-    Call TypeScript dashboard functions via ts-node
-    """
-    # Create a temporary script to call the function
-    script_content = f"""
-import {{ {function_name} }} from './src/services/snowflake/dashboard';
-import {{ initSnowflake }} from './src/database/snowflake';
-
-async function run() {{
-  try {{
-    await initSnowflake();
-    const result = await {function_name}({', '.join(map(str, args))});
-    console.log(JSON.stringify(result));
-  }} catch (error) {{
-    console.error(JSON.stringify({{ error: str(error) }}));
-    process.exit(1);
-  }}
-}}
-
-run();
-"""
-    
-    try:
-        result = subprocess.run(
-            ["npx", "ts-node", "-e", script_content],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(BACKEND_DIR)
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        else:
-            raise Exception(f"ts-node error: {result.stderr}")
-    except Exception as e:
-        # Fallback: return empty array on error
-        print(f"Error calling TypeScript dashboard: {e}")
-        return []
-
 
 @router.get("/decisions")
 async def get_decisions(
@@ -66,7 +20,7 @@ async def get_decisions(
     Returns decisions with full agent analysis and conversation logs.
     """
     try:
-        decisions = call_typescript_dashboard("getLatestDecisions", limit)
+        decisions = await decision_store.latest(limit)
         
         # Transform to frontend format
         proposals = []
@@ -134,9 +88,8 @@ async def get_decision(decision_id: str):
     Get a specific decision by ID.
     """
     try:
-        # For now, get all and filter (inefficient but works)
-        decisions = call_typescript_dashboard("getLatestDecisions", 100)
-        decision = next((d for d in decisions if d.get("id") == decision_id), None)
+        # Indexed lookup; unknown ids become a single-row query
+        decision = await decision_store.get(decision_id)
         
         if not decision:
             raise HTTPException(status_code=404, detail="Decision not found")
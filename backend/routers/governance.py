@@ -2,163 +2,264 @@
 Governance-related endpoints
 Handles AI proposals, voting, and agent reasoning
 """
-from fastapi import APIRouter, Path, Query, HTTPException
-from typing import Optional
+from fastapi import APIRouter, Path, Query, HTTPException, Request, Response
+from pydantic import TypeAdapter
+from typing import Callable, Optional, Tuple
+import base64
 import random
 from datetime import datetime
-import subprocess
 import json
-from pathlib import Path as PathLib
 from schemas.governance import (
     ProposalsResponse,
     ProposalResponse,
     ProposalReasoningResponse,
     VoteRequest,
-    VoteResponse
+    VoteResponse,
+    VoteTallyResponse
 )
-from data.consistent_data import ALL_BETS
+from data.bet_ledger import parse_timestamp
+from data.consistent_data import get_dataset
+from services.decision_store import decision_store
+from services.proposal_index import proposal_index
+from services.response_cache import proposal_responses
+from services.signatures import require_signature, vote_message
+from services.transcript_store import DEFAULT_TRANSCRIPT, transcript_from_result, transcript_store
+from services.vote_ledger import DuplicateVote, vote_ledger
 
 router = APIRouter()
 
-# Path to the TypeScript dashboard service
-BACKEND_DIR = PathLib(__file__).parent.parent
-TS_DASHBOARD = BACKEND_DIR / "src" / "services" / "snowflake" / "dashboard.ts"
+PROPOSALS_ADAPTER = TypeAdapter(ProposalsResponse)
 
 
-def call_typescript_dashboard(function_name: str, *args):
+def decision_to_proposal(decision: dict) -> dict:
     """
-    Call TypeScript dashboard functions via ts-node
+    Map a Snowflake decision record to the Proposal shape
     """
-    script_content = f"""
-import {{ {function_name} }} from './src/services/snowflake/dashboard';
-import {{ initSnowflake }} from './src/database/snowflake';
-
-async function run() {{
-  try {{
-    await initSnowflake();
-    const result = await {function_name}({', '.join(map(str, args))});
-    console.log(JSON.stringify(result));
-  }} catch (error) {{
-    console.error(JSON.stringify({{ error: str(error) }}));
-    process.exit(1);
-  }}
-}}
-
-run();
-"""
+    # Extract agent outputs
+    agent_outputs = decision.get("agent_outputs", [])
+    if isinstance(agent_outputs, str):
+        try:
+            agent_outputs = json.loads(agent_outputs)
+        except:
+            agent_outputs = []
     
-    try:
-        result = subprocess.run(
-            ["npx", "ts-node", "-e", script_content],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(BACKEND_DIR)
+    # Calculate average confidence
+    if agent_outputs:
+        total_confidence = sum(
+            agent.get("decision", {}).get("confidence", 0) 
+            for agent in agent_outputs
         )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        else:
+        avg_confidence = total_confidence / len(agent_outputs) if agent_outputs else 0
+    else:
+        avg_confidence = 0
+    
+    # Determine status
+    direction = decision.get("final_direction", "NO")
+    decision_status = "APPROVED" if direction == "YES" else "REJECTED"
+    
+    reasoning = decision.get("consensus_reasoning") or ""
+    
+    return {
+        "id": decision.get("id", ""),
+        "market": decision.get("market_question", decision.get("market_id", "Unknown Market")),
+        "direction": "LONG" if direction == "YES" else "SHORT",
+        "positionSize": f"${decision.get('final_size', 0):,.0f}",
+        "riskScore": 5.0,  # Could be calculated from agent outputs
+        "confidence": int(avg_confidence),
+        "status": decision_status,
+        "summary": reasoning[:200] + "..." if len(reasoning) > 200 else reasoning,
+        "timestamp": decision.get("created_at", datetime.now().isoformat()),
+        "dataSources": [f"https://polymarket.com/event/{decision.get('market_id', '')}"],
+        "betStatus": "OPEN",
+        "betResult": None,
+        "closedAt": None,
+        "vote": direction
+    }
+
+
+def bet_to_proposal(bet: dict) -> dict:
+    """
+    Map a mock bet from the ledger to the Proposal shape
+    """
+    return {
+        "id": bet["id"],
+        "market": bet["betDescription"],  # Use betDescription as market (Polymarket bet)
+        "direction": "LONG" if bet["vote"] == "YES" else "SHORT",
+        "positionSize": bet["positionSize"],
+        "riskScore": bet["riskScore"],
+        "confidence": bet["confidence"],
+        "status": bet["status"],
+        "summary": bet["betDescription"],  # Use betDescription as summary
+        "timestamp": bet["timestamp"],
+        "dataSources": [f"https://polymarket.com/bet/{bet['id']}"],
+        "betStatus": bet["betStatus"],
+        "betResult": bet["betResult"],
+        "closedAt": bet.get("closedAt"),
+        "vote": bet["vote"]  # YES or NO
+    }
+
+
+# Proposal status -> decision final_direction, for pushing status filters down to Snowflake
+STATUS_DIRECTIONS = {"APPROVED": "YES", "REJECTED": "NO"}
+
+
+def encode_cursor(proposal: dict) -> str:
+    """
+    Opaque keyset cursor pointing just past a proposal: its (timestamp, id)
+    """
+    raw = json.dumps([str(proposal["timestamp"]), proposal["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        timestamp, proposal_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return str(timestamp), str(proposal_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def fetch_decisions_page(
+    status: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    after: Optional[Tuple[str, str]],
+    limit: int,
+) -> list:
+    """
+    One page of Snowflake decisions, newest first, filtered in the query
+    """
+    query = {"limit": limit}
+    if status:
+        if status not in STATUS_DIRECTIONS:
             return []
-    except Exception as e:
-        print(f"Error calling TypeScript dashboard: {e}")
-        return []
+        query["direction"] = STATUS_DIRECTIONS[status]
+    if start:
+        query["from"] = start.isoformat()
+    if end:
+        query["to"] = end.isoformat()
+    if after:
+        query["after"] = {"created_at": after[0], "id": after[1]}
+    return await decision_store.page(query)
+
+
+def decision_proposals(decisions: list) -> list:
+    proposals = [decision_to_proposal(decision) for decision in decisions]
+    proposal_index.index(proposals)
+    return proposals
+
+
+def bet_proposals_page(
+    status: Optional[str],
+    start: Optional[datetime],
+    end: Optional[datetime],
+    after: Optional[Tuple[str, str]],
+    limit: int,
+) -> list:
+    """
+    One page of mock proposals, newest first (like the Snowflake pages), filtered in the columnar ledger
+    """
+    ledger = get_dataset().ledger
+    mask = ledger.mask(
+        status=status,
+        start=start.timestamp() if start else None,
+        end=end.timestamp() if end else None,
+    )
+    if after:
+        try:
+            mask &= ledger.before_mask(parse_timestamp(after[0]), after[1])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Only the returned rows are materialized
+    return [bet_to_proposal(bet) for bet in ledger.rows(mask, limit=limit, newest_first=True)]
+
+
+def serve_page(request: Request, key: tuple, version, build: Callable[[], list], limit: int) -> Response:
+    """
+    Serve a proposals page from its encoded form, building, validating and
+    encoding it only when the data version changed since it was last served
+    """
+    encoded = proposal_responses.get(key, version)
+    if encoded is None:
+        proposals = build()
+        headers = {}
+        if len(proposals) > limit:
+            proposals = proposals[:limit]
+            headers["X-Next-Cursor"] = encode_cursor(proposals[-1])
+        body = PROPOSALS_ADAPTER.dump_json(PROPOSALS_ADAPTER.validate_python(proposals))
+        encoded = proposal_responses.put(key, version, body, headers)
+    return proposal_responses.respond(request, encoded)
 
 
 @router.get("/proposals", response_model=ProposalsResponse)
 async def get_proposals(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by status"),
+    start: Optional[datetime] = Query(None, alias="from", description="Only proposals at or after this time"),
+    end: Optional[datetime] = Query(None, alias="to", description="Only proposals at or before this time"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
     limit: int = Query(50, ge=1, le=100),
     use_real_data: bool = Query(True, description="Use real decisions from Snowflake")
 ):
     """
-    Get all governance proposals.
+    Get governance proposals, one page at a time.
     If use_real_data=True, fetches from Snowflake decisions.
     Otherwise, uses mock data from consistent_data.py
+    Proposals come newest first from either source, and filters are applied at
+    the source. When more proposals follow, the X-Next-Cursor response header
+    holds the cursor for the next page.
+    Pages carry a strong ETag; If-None-Match gets a 304 while the data is unchanged.
     """
-    proposals = []
+    status = status.upper() if status else None
+    after = decode_cursor(cursor) if cursor else None
+    # One extra row tells us whether another page follows
+    shape = (status, start, end, after, limit)
     
     if use_real_data:
-        # Fetch real decisions from Snowflake
+        # Fetch real decisions from Snowflake. An empty page is a real answer
+        # (nothing matches); only a failed fetch falls back to the mock source.
+        decisions = None
         try:
-            decisions = call_typescript_dashboard("getLatestDecisions", limit * 2)  # Get more to filter
-            
-            for decision in decisions:
-                # Extract agent outputs
-                agent_outputs = decision.get("agent_outputs", [])
-                if isinstance(agent_outputs, str):
-                    try:
-                        agent_outputs = json.loads(agent_outputs)
-                    except:
-                        agent_outputs = []
-                
-                # Calculate average confidence
-                if agent_outputs:
-                    total_confidence = sum(
-                        agent.get("decision", {}).get("confidence", 0) 
-                        for agent in agent_outputs
-                    )
-                    avg_confidence = total_confidence / len(agent_outputs) if agent_outputs else 0
-                else:
-                    avg_confidence = 0
-                
-                # Determine status
-                direction = decision.get("final_direction", "NO")
-                decision_status = "APPROVED" if direction == "YES" else "REJECTED"
-                
-                # Extract market data
-                market_data = decision.get("raw_market_data", {})
-                if isinstance(market_data, str):
-                    try:
-                        market_data = json.loads(market_data)
-                    except:
-                        market_data = {}
-                
-                proposal = {
-                    "id": decision.get("id", ""),
-                    "market": decision.get("market_question", decision.get("market_id", "Unknown Market")),
-                    "direction": "LONG" if direction == "YES" else "SHORT",
-                    "positionSize": f"${decision.get('final_size', 0):,.0f}",
-                    "riskScore": 5.0,  # Could be calculated from agent outputs
-                    "confidence": int(avg_confidence),
-                    "status": decision_status,
-                    "summary": decision.get("consensus_reasoning", "")[:200] + "..." if len(decision.get("consensus_reasoning", "")) > 200 else decision.get("consensus_reasoning", ""),
-                    "timestamp": decision.get("created_at", datetime.now().isoformat()),
-                    "dataSources": [f"https://polymarket.com/event/{decision.get('market_id', '')}"],
-                    "betStatus": "OPEN",
-                    "betResult": None,
-                    "closedAt": None,
-                    "vote": direction
-                }
-                proposals.append(proposal)
+            decisions = await fetch_decisions_page(status, start, end, after, limit + 1)
         except Exception as e:
             print(f"Error fetching real decisions: {e}, falling back to mock data")
-            use_real_data = False
-    
-    # Fallback to mock data if real data fetch failed or use_real_data=False
-    if not use_real_data or not proposals:
-        for bet in ALL_BETS:
-            proposal = {
-                "id": bet["id"],
-                "market": bet["betDescription"],
-                "direction": "LONG" if bet["vote"] == "YES" else "SHORT",
-                "positionSize": bet["positionSize"],
-                "riskScore": bet["riskScore"],
-                "confidence": bet["confidence"],
-                "status": bet["status"],
-                "summary": bet["betDescription"],
-                "timestamp": bet["timestamp"],
-                "dataSources": [f"https://polymarket.com/bet/{bet['id']}"],
-                "betStatus": bet["betStatus"],
-                "betResult": bet["betResult"],
-                "closedAt": bet.get("closedAt"),
-                "vote": bet["vote"]
-            }
-            proposals.append(proposal)
+        if decisions is not None:
+            # Decisions are immutable once written, so their ids identify the page's content
+            version = tuple(decision.get("id") for decision in decisions)
+            return serve_page(request, ("decisions",) + shape, version, lambda: decision_proposals(decisions), limit)
     
-    if status:
-        proposals = [p for p in proposals if p["status"] == status.upper()]
+    # Mock data if the Snowflake fetch failed or use_real_data=False
+    version = get_dataset().ledger.generation
+    return serve_page(
+        request, ("bets",) + shape, version,
+        lambda: bet_proposals_page(status, start, end, after, limit + 1), limit,
+    )
+
+
+async def find_proposal(proposal_id: str) -> Optional[dict]:
+    """
+    A proposal by id from the mock bet ledger, the proposal index or a by-id
+    Snowflake lookup; None if no source has it
+    """
+    # Find the proposal in the mock bet ledger (by-id index)
+    bet = get_dataset().ledger.get(proposal_id)
+    if bet:
+        return bet_to_proposal(bet)
     
-    return proposals[:limit]
+    proposal = proposal_index.get(proposal_id)
+    if proposal:
+        return proposal
+    # Real proposals come from Snowflake decisions (single-row lookup)
+    try:
+        decision = await decision_store.get(proposal_id)
+    except Exception as e:
+        print(f"Error fetching decision {proposal_id}: {e}")
+        return None
+    if not decision:
+        return None
+    proposal = decision_to_proposal(decision)
+    proposal_index.add(proposal)
+    return proposal
 
 
 @router.get("/proposals/{proposal_id}", response_model=ProposalResponse)
@@ -166,28 +267,10 @@ async def get_proposal(proposal_id: str = Path(..., description="Proposal ID")):
     """
     Get details for a single proposal.
     """
-    # Find the proposal in ALL_BETS
-    bet = next((b for b in ALL_BETS if b["id"] == proposal_id), None)
-    
-    if not bet:
+    proposal = await find_proposal(proposal_id)
+    if proposal is None:
         raise HTTPException(status_code=404, detail="Proposal not found")
-    
-    return {
-        "id": bet["id"],
-        "market": bet["betDescription"],  # Use betDescription as market (Polymarket bet)
-        "direction": "LONG" if bet["vote"] == "YES" else "SHORT",
-        "positionSize": bet["positionSize"],
-        "riskScore": bet["riskScore"],
-        "confidence": bet["confidence"],
-        "status": bet["status"],
-        "summary": bet["betDescription"],  # Use betDescription as summary
-        "timestamp": bet["timestamp"],
-        "dataSources": [f"https://polymarket.com/bet/{bet['id']}"],
-        "betStatus": bet["betStatus"],
-        "betResult": bet["betResult"],
-        "closedAt": bet.get("closedAt"),
-        "vote": bet["vote"]  # YES or NO
-    }
+    return proposal
 
 
 @router.get("/proposals/{proposal_id}/reasoning", response_model=ProposalReasoningResponse)
@@ -196,36 +279,32 @@ async def get_proposal_reasoning(proposal_id: str = Path(..., description="Propo
     Get agent reasoning for a proposal.
     Returns all 5 agents with their full reasoning and votes.
     """
-    # TODO: Replace with real database query
-    # Example: SELECT * FROM proposal_reasoning WHERE proposal_id = proposal_id
+    transcript = await transcript_store.get(proposal_id)
+    if transcript and transcript.get("reasoning"):
+        return transcript["reasoning"]
+    
+    # Conversation logs from Snowflake (proposal id = DECISION_ID)
+    try:
+        logs = await decision_store.conversation_logs(proposal_id)
+        if logs:
+            transcript = transcript_from_result({"conversation_logs": logs})
+            if transcript["reasoning"]:
+                await transcript_store.keep(proposal_id, transcript)
+                return transcript["reasoning"]
+    except Exception as e:
+        print(f"Error fetching reasoning from Snowflake: {e}")
     
-    return [
-        {
-            "agent": "Quant Analyst",
-            "vote": "YES",
-            "rationale": "Bollinger bands squeezing with RSI at 68 indicates strong momentum building. The 20-day moving average has crossed above the 50-day, forming a golden cross pattern. Volume profile shows increasing accumulation over the past 48 hours, with large buy orders at $98.50 support level. MACD histogram is positive and expanding, suggesting continued upward momentum. Fibonacci retracement from recent swing high shows we're at 61.8% level, which historically acts as strong support before continuation moves. My technical analysis suggests a 78% probability of reaching $105 target within 7 days based on similar historical patterns."
-        },
-        {
-            "agent": "Risk Manager",
-            "vote": "YES",
-            "rationale": "Portfolio heat check: currently at 42%, sufficient room for this $150k position which would bring us to 58% - still well within our 75% threshold. Correlation analysis shows SOL-PERP has 0.72 correlation with our existing JTO long position, which is manageable. Maximum drawdown scenario: if SOL drops 15% (worst case), our portfolio would see 3.2% drawdown, well within our 5% daily limit. Position sizing is appropriate at 5.3% of portfolio. Risk-adjusted return calculation shows Sharpe ratio improvement of 0.12 if this trade executes. I approve with the condition that we set a stop-loss at $95.50 (3% below entry) to limit downside exposure."
-        },
-        {
-            "agent": "Market Maker",
-            "vote": "YES",
-            "rationale": "Order book depth analysis shows strong liquidity on both sides. Bid-ask spread is currently 0.08% which is tight for SOL-PERP, indicating healthy market conditions. Large limit orders visible at $98.00-$98.50 range provide natural support. Order flow data from the past 2 hours shows 65% buy volume vs 35% sell volume, indicating institutional accumulation. Market depth at current price level can absorb our $150k position without significant slippage (estimated 0.12% slippage). Liquidity providers are active, and we should be able to enter and exit efficiently. The market microstructure supports this trade execution."
-        },
-        {
-            "agent": "News Analyst",
-            "vote": "NO",
-            "rationale": "Sentiment analysis from social media shows mixed signals. Twitter/X sentiment score is 52/100 (neutral), with recent mentions showing some concern about regulatory developments. News flow in the past 24 hours includes: (1) SEC comments on crypto regulation (slightly negative), (2) Solana Foundation partnership announcement (positive), (3) Major exchange listing rumors (positive). However, the regulatory uncertainty creates headwinds. On-chain metrics show whale accumulation (positive), but retail sentiment is cooling. My sentiment model gives this trade a 45% probability of success based on news catalysts. I recommend waiting 24-48 hours for clearer regulatory signals before entering this position."
-        },
-        {
-            "agent": "Arbitrage Analyst",
-            "vote": "YES",
-            "rationale": "Cross-market analysis reveals SOL is trading at a 0.8% premium on perpetual futures vs spot markets, which is within normal range but suggests slight bullish bias. Funding rate is positive at 0.012% per 8 hours, indicating long interest. Options market shows put-call ratio of 0.65, suggesting bullish sentiment. The SOL/BTC ratio has been strengthening, indicating SOL outperformance. Statistical arbitrage opportunities are limited currently, but the directional trade has merit. I've identified that if we enter this position, we can hedge with a small BTC short to capture the ratio spread, improving our risk-adjusted returns. The arbitrage landscape supports this trade with additional hedging opportunities available."
-        },
-    ]
+    # Fallback to mock data
+    default = await transcript_store.get(DEFAULT_TRANSCRIPT)
+    return default["reasoning"] if default else []
+
+
+def vote_weight(wallet: str) -> int:
+    """
+    Voting weight: the wallet's vault shares (at least 1), as the on-chain LP-share snapshot
+    """
+    account = get_dataset().wallets.account(wallet)
+    return max(1, round(account["shares"])) if account else 1
 
 
 @router.post("/proposals/{proposal_id}/vote", response_model=VoteResponse)
@@ -235,16 +314,34 @@ async def vote_on_proposal(
 ):
     """
     Submit a vote on a proposal.
+    The signature must sign the vote message described on VoteRequest; a bad,
+    stale or replayed one gets a 401.
+    One vote per wallet per proposal; a second vote gets a 409.
+    Votes on unknown proposals get a 404, so tallies only exist for real ones.
+    Unsigned votes (only accepted with SIGNATURE_REQUIRED=0) are not counted:
+    anyone can claim a wallet address, so they carry no weight and don't take
+    the wallet's vote.
     """
-    # TODO: Implement voting logic
-    # 1. Verify wallet signature
-    # 2. Check if user has already voted
-    # 3. Record vote in database
-    # 4. Update proposal vote count
-    
     if vote_data.vote not in ["YES", "NO"]:
         raise HTTPException(status_code=400, detail="Vote must be 'YES' or 'NO'")
     
+    if await find_proposal(proposal_id) is None:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    
+    message = vote_message(
+        proposal_id, vote_data.vote, vote_data.walletAddress, vote_data.nonce, vote_data.signedAt
+    )
+    signed = await require_signature(
+        vote_data.walletAddress, message, vote_data.signature, vote_data.nonce, vote_data.signedAt
+    )
+    if not signed:
+        return {"success": False, "message": "Unsigned vote not counted"}
+    
+    try:
+        vote_ledger.cast(proposal_id, vote_data.walletAddress, vote_data.vote, vote_weight(vote_data.walletAddress))
+    except DuplicateVote as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
     return {
         "success": True,
         "message": "Vote recorded",
@@ -252,6 +349,14 @@ async def vote_on_proposal(
     }
 
 
+@router.get("/proposals/{proposal_id}/votes", response_model=VoteTallyResponse)
+async def get_proposal_votes(proposal_id: str = Path(..., description="Proposal ID")):
+    """
+    Get the running YES/NO vote tally for a proposal.
+    """
+    return vote_ledger.tally(proposal_id)
+
+
 @router.get("/random-bet", response_model=ProposalResponse)
 async def get_random_polymarket_bet():
     """
@@ -259,11 +364,12 @@ async def get_random_polymarket_bet():
     Returns a JSON object matching the Proposal interface.
     This endpoint is designed for AI systems to pull random bets with a side (YES/NO).
     """
-    # Select a random bet from ALL_BETS
-    if not ALL_BETS:
+    # Select a random bet from the ledger
+    ledger = get_dataset().ledger
+    if not len(ledger):
         raise HTTPException(status_code=404, detail="No bets available")
     
-    bet = random.choice(ALL_BETS)
+    bet = ledger.row(random.randrange(len(ledger)))
     
     # Generate a Polymarket URL (using the bet ID or slug)
     # In production, you would fetch this from Polymarket API
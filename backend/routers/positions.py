@@ -2,8 +2,8 @@
 Position-related endpoints
 Handles current open trading positions
 """
-from fastapi import APIRouter
-from schemas.positions import PositionsResponse
+from fastapi import APIRouter, Query, Response
+from schemas.positions import PositionsResponse, PositionChangesResponse
 
 router = APIRouter()
 
@@ -12,8 +12,23 @@ router = APIRouter()
 async def get_current_positions():
     """
     Get all currently open trading positions.
+    Served from the prebuilt snapshot; X-Positions-Version is the version to pass to /changes.
     """
-    from data.consistent_data import generate_positions
+    from data.consistent_data import get_position_book
     
-    return generate_positions()
+    book = get_position_book()
+    return Response(
+        content=book.response(),
+        media_type="application/json",
+        headers={"X-Positions-Version": str(book.version)},
+    )
 
+
+@router.get("/changes", response_model=PositionChangesResponse)
+async def get_position_changes(since: int = Query(0, ge=0, description="Last version the client has")):
+    """
+    Get positions opened or repriced since a version.
+    """
+    from data.consistent_data import get_position_book
+    
+    return get_position_book().changes_since(since)
@@ -2,7 +2,8 @@
 Report-related endpoints
 Handles daily performance reports and summaries
 """
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query
+from data.consistent_data import get_reports
 from schemas.reports import (
     DailyReportsResponse,
     DailyReportResponse,
@@ -18,35 +19,9 @@ async def get_daily_reports(
     offset: int = Query(0, ge=0)
 ):
     """
-    Get list of daily performance reports.
+    Get list of daily performance reports, newest first.
     """
-    # TODO: Replace with real database query
-    # Example: SELECT * FROM daily_reports ORDER BY date DESC LIMIT limit OFFSET offset
-    
-    reports = [
-        {
-            "date": "2024-02-19",
-            "pnl": "+14,293.67",
-            "pnlPercent": "+0.52%",
-            "trades": 7,
-            "winRate": 71.4,
-            "keyTrades": ["Opened SOL-PERP LONG $142k @ $98.45"],
-            "agentNotes": "Strong risk-adjusted returns today...",
-            "ipfsReport": "ipfs://QmX7Ry4KjQz8hN3vM2wP9sA1bT5cU6dE8fG9hI0jK1lM2n"
-        },
-        {
-            "date": "2024-02-18",
-            "pnl": "+8,127.34",
-            "pnlPercent": "+0.29%",
-            "trades": 5,
-            "winRate": 80.0,
-            "keyTrades": ["Closed RAY-PERP LONG $98k @ $1.92 (+2.67%)"],
-            "agentNotes": "Consistent execution across multiple markets...",
-            "ipfsReport": "ipfs://QmY8Sz5LkRz9iO4wN3xQ0rB2cV7dF9gI1kL3mN4oP5qR6s"
-        },
-    ]
-    
-    return reports[offset:offset+limit]
+    return get_reports().daily(limit, offset)
 
 
 @router.get("/daily/{date}", response_model=DailyReportResponse)
@@ -54,34 +29,16 @@ async def get_daily_report(date: str = Path(..., description="Date in YYYY-MM-DD
     """
     Get a specific daily report by date.
     """
-    # TODO: Replace with real database query
-    # Example: SELECT * FROM daily_reports WHERE date = date
-    
-    return {
-        "date": date,
-        "pnl": "+14,293.67",
-        "pnlPercent": "+0.52%",
-        "trades": 7,
-        "winRate": 71.4,
-        "keyTrades": ["Opened SOL-PERP LONG $142k @ $98.45"],
-        "agentNotes": "Strong risk-adjusted returns today...",
-        "ipfsReport": "ipfs://QmX7Ry4KjQz8hN3vM2wP9sA1bT5cU6dE8fG9hI0jK1lM2n"
-    }
+    report = get_reports().get(date)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return report
 
 
 @router.get("/summary", response_model=ReportSummaryResponse)
 async def get_report_summary():
     """
     Get summary statistics across all reports.
+    Totals are kept up to date as each day closes, so this does not scan history.
     """
-    # TODO: Replace with real database query
-    # Example: SELECT SUM(pnl), AVG(win_rate), COUNT(*), COUNT(CASE WHEN pnl > 0 THEN 1 END) FROM daily_reports
-    
-    return {
-        "totalPnl": 53450.08,
-        "averageWinRate": 72.1,
-        "totalTrades": 33,
-        "profitableDays": 4,
-        "totalDays": 5
-    }
-
+    return get_reports().summary()
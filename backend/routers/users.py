@@ -23,22 +23,23 @@ async def get_user_profile(wallet: str = Query(..., description="Wallet address"
     if not wallet:
         raise HTTPException(status_code=400, detail="Wallet address is required")
     
-    from data.consistent_data import (
-        USER_DEPOSITED_SOL, VAULT_OWNERSHIP_PERCENT, VAULT_SHARES
-    )
+    from data.consistent_data import VAULT_SHARE_PRICE, VAULT_TOTAL_SHARES, get_wallet_account
+    account = get_wallet_account(wallet)
     
     # Calculate days in vault (from deposit date to now)
-    deposit_date = datetime(2024, 2, 1)
-    days_in_vault = (datetime.now() - deposit_date).days
+    # A wallet opened by a settlement alone has no deposit yet
+    deposit_date = account["firstDepositAt"]
+    days_in_vault = (datetime.now() - deposit_date).days if deposit_date else 0
+    yield_rate = VAULT_SHARE_PRICE - 1
     
     return {
-        "totalDeposited": USER_DEPOSITED_SOL,
-        "depositDate": "Feb 1, 2024",
+        "totalDeposited": account["depositedSol"],
+        "depositDate": f"{deposit_date:%b} {deposit_date.day}, {deposit_date.year}" if deposit_date else "",
         "daysInVault": days_in_vault,
-        "vaultSharePercent": round(VAULT_OWNERSHIP_PERCENT, 2),
-        "vaultShares": round(VAULT_SHARES, 4),
-        "estimatedYieldPercent": 8.47,
-        "estimatedYieldSOL": 2.16,
+        "vaultSharePercent": round(account["shares"] / VAULT_TOTAL_SHARES * 100, 2),
+        "vaultShares": round(account["shares"], 4),
+        "estimatedYieldPercent": round(yield_rate * 100, 2),
+        "estimatedYieldSOL": round(account["depositedSol"] * yield_rate, 2),
     }
 
 
@@ -68,24 +69,25 @@ async def get_user_commentary(wallet: str = Query(..., description="Wallet addre
     if not wallet:
         raise HTTPException(status_code=400, detail="Wallet address is required")
     
-    from data.consistent_data import (
-        USER_WIN_COUNT, USER_LOSE_COUNT, USER_TOTAL_BETS, 
-        USER_WIN_RATE, USER_WIN_AMOUNT
-    )
+    from data.consistent_data import get_wallet_account
+    account = get_wallet_account(wallet)
+    win_count = account["winCount"]
+    lose_count = account["loseCount"]
+    win_amount = account["realizedPnl"]
     
     # Generate commentary based on consistent user stats
-    win_loss_text = "wins" if USER_WIN_COUNT == 1 else "wins"
-    loss_text = "loss" if USER_LOSE_COUNT == 1 else "losses"
-    performance_text = "loss" if USER_WIN_AMOUNT < 0 else "gain"
-    amount_text = f"${abs(USER_WIN_AMOUNT):,.2f}"
+    win_loss_text = "wins" if win_count == 1 else "wins"
+    loss_text = "loss" if lose_count == 1 else "losses"
+    performance_text = "loss" if win_amount < 0 else "gain"
+    amount_text = f"${abs(win_amount):,.2f}"
     
     message = (
-        f"Summary of all your bets: You've participated in {USER_TOTAL_BETS} total bets "
-        f"with {USER_WIN_COUNT} {win_loss_text} and {USER_LOSE_COUNT} {loss_text}, "
-        f"resulting in a {USER_WIN_RATE:.1f}% win rate. "
+        f"Summary of all your bets: You've participated in {account['totalBets']} total bets "
+        f"with {win_count} {win_loss_text} and {lose_count} {loss_text}, "
+        f"resulting in a {account['winRate']:.1f}% win rate. "
     )
     
-    if USER_WIN_AMOUNT < 0:
+    if win_amount < 0:
         message += (
             f"Your losing bets have resulted in a total loss of {amount_text}. "
             f"Your risk management needs improvement, and you may want to reconsider "
@@ -113,17 +115,8 @@ async def get_user_deposits(wallet: str = Query(..., description="Wallet address
     if not wallet:
         raise HTTPException(status_code=400, detail="Wallet address is required")
     
-    from data.consistent_data import USER_DEPOSITED_SOL
-    
-    return [
-        {
-            "id": "deposit-001",
-            "amount": USER_DEPOSITED_SOL,
-            "timestamp": "2024-02-01T10:00:00Z",
-            "transactionHash": "5j7s...",
-            "status": "confirmed"
-        }
-    ]
+    from data.consistent_data import get_wallet_deposits
+    return get_wallet_deposits(wallet)
 
 
 # Additional endpoint for frontend compatibility
@@ -4,6 +4,14 @@ Handles vault statistics, NAV, TVL, allocations, and deposits
 """
 from fastapi import APIRouter, Query
 from typing import Optional
+from data.consistent_data import (
+    HISTORY_MAX_DAYS,
+    HISTORY_MAX_POINTS,
+    VAULT_SHARE_PRICE,
+    generate_nav_history,
+    generate_portfolio_amount_history,
+    generate_tvl_history,
+)
 from schemas.vault import (
     VaultStatsResponse,
     NavHistoryResponse,
@@ -13,6 +21,8 @@ from schemas.vault import (
     DepositRequest,
     DepositResponse
 )
+from data.downsampling import Method
+from services.signatures import deposit_message, require_signature
 
 router = APIRouter()
 
@@ -23,85 +33,70 @@ async def get_vault_stats(wallet: Optional[str] = Query(None)):
     Get vault-wide statistics.
     If wallet address is provided, includes user-specific data.
     """
-    from data.consistent_data import (
-        TOTAL_VAULT_VALUE_USD, USER_DEPOSITED_USD, USER_WIN_COUNT, USER_LOSE_COUNT, 
-        USER_WIN_RATE, USER_WIN_AMOUNT, VAULT_OWNERSHIP_PERCENT, VAULT_SHARES
-    )
+    from data.consistent_data import TOTAL_VAULT_VALUE_USD
     
     stats = {
         "totalValueLocked": TOTAL_VAULT_VALUE_USD,
         "winUserCount": 912,
         "loseUserCount": 335,
         "winPercent": 73.1,
-        "vaultSharePrice": 1.0847,
+        "vaultSharePrice": VAULT_SHARE_PRICE,
     }
     
     if wallet:
-        # Use consistent user data
-        stats["userDepositedAmount"] = USER_DEPOSITED_USD
-        stats["userVaultShares"] = round(VAULT_SHARES, 4)
-        stats["userWinCount"] = USER_WIN_COUNT
-        stats["userLoseCount"] = USER_LOSE_COUNT
-        stats["userWinRate"] = USER_WIN_RATE
-        stats["userWinAmount"] = USER_WIN_AMOUNT
+        # Per-wallet running totals (generates the bet dataset on first use)
+        from data.consistent_data import get_wallet_account
+        account = get_wallet_account(wallet)
+        stats["userDepositedAmount"] = account["depositedUsd"]
+        stats["userVaultShares"] = round(account["shares"], 4)
+        stats["userWinCount"] = account["winCount"]
+        stats["userLoseCount"] = account["loseCount"]
+        stats["userWinRate"] = account["winRate"]
+        stats["userWinAmount"] = account["realizedPnl"]
     
     return stats
 
 
 @router.get("/nav/history", response_model=NavHistoryResponse)
-async def get_nav_history(days: int = Query(30, ge=1, le=365)):
+async def get_nav_history(
+    days: int = Query(30, ge=1, le=365),
+    max_points: int = Query(HISTORY_MAX_POINTS, ge=2, le=HISTORY_MAX_DAYS),
+    method: Method = Query("lttb"),
+):
     """
     Get NAV (Net Asset Value) history over time.
+    Downsampled to at most max_points (lttb keeps the curve's shape, minmax keeps every peak and trough).
     """
     # TODO: Replace with real database query
     # Example: SELECT date, nav FROM nav_history WHERE date >= NOW() - INTERVAL '{days} days'
-    return [
-        {"date": "Jan 1", "nav": 1.0000},
-        {"date": "Jan 8", "nav": 1.0124},
-        {"date": "Jan 15", "nav": 1.0287},
-    ]
+    return generate_nav_history(days, max_points, method)
 
 
 @router.get("/tvl/history", response_model=TvlHistoryResponse)
-async def get_tvl_history(days: int = Query(30, ge=1, le=1095)):
+async def get_tvl_history(
+    days: int = Query(30, ge=1, le=1095),
+    max_points: int = Query(HISTORY_MAX_POINTS, ge=2, le=HISTORY_MAX_DAYS),
+    method: Method = Query("lttb"),
+):
     """
     Get Total Value Locked (TVL) history over time.
+    Downsampled to at most max_points (lttb keeps the curve's shape, minmax keeps every peak and trough).
     """
     # TODO: Replace with real database query
-    from datetime import datetime, timedelta
-    import random
-    
-    # Generate data points for the requested days
-    data = []
-    base_value = 2500000.0
-    random.seed(42)  # For consistent data
-    
-    for i in range(days):
-        date = datetime.now() - timedelta(days=days - i - 1)
-        # Generate realistic TVL with some volatility
-        change = random.uniform(-0.02, 0.03)
-        base_value *= (1 + change)
-        data.append({
-            "date": date.strftime("%b %d, %Y") if days > 30 else date.strftime("%b %d"),
-            "value": round(base_value, 2)
-        })
-    
-    # Limit to ~200 points for performance
-    if len(data) > 200:
-        step = len(data) // 200
-        data = data[::step]
-    
-    return data
+    return generate_tvl_history(days, max_points, method)
 
 
 @router.get("/portfolio/amount", response_model=PortfolioAmountResponse)
-async def get_portfolio_amount_history(days: int = Query(30, ge=1, le=1095)):
+async def get_portfolio_amount_history(
+    days: int = Query(30, ge=1, le=1095),
+    max_points: int = Query(HISTORY_MAX_POINTS, ge=2, le=HISTORY_MAX_DAYS),
+    method: Method = Query("lttb"),
+):
     """
     Get portfolio amount history over time.
     Uses consistent data that matches user stats.
     """
-    from data.consistent_data import generate_portfolio_amount_history
-    return generate_portfolio_amount_history(days)
+    return generate_portfolio_amount_history(days, max_points, method)
 
 
 @router.get("/allocations", response_model=MarketAllocationResponse)
@@ -122,12 +117,16 @@ async def get_market_allocations():
 async def create_deposit(deposit: DepositRequest):
     """
     Create a new deposit transaction.
+    The signature must sign the deposit message described on DepositRequest; a bad,
+    stale or replayed one gets a 401.
     """
+    message = deposit_message(deposit.walletAddress, deposit.amount, deposit.nonce, deposit.signedAt)
+    await require_signature(deposit.walletAddress, message, deposit.signature, deposit.nonce, deposit.signedAt)
+    
     # TODO: Implement deposit logic
-    # 1. Verify wallet signature
-    # 2. Create transaction
-    # 3. Store in database
-    # 4. Return transaction hash
+    # 1. Create transaction
+    # 2. Store in database
+    # 3. Return transaction hash
     
     return {
         "transactionHash": "5j7s...",
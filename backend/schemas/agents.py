@@ -22,6 +22,7 @@ class DebateMessage(BaseModel):
     message: str
     timestamp: str
     vote: Literal["YES", "NO"]
+    phase: Optional[Literal["initial", "debate", "final", "consensus"]] = None
 
 
 class DebateTranscriptResponse(BaseModel):
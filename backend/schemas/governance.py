@@ -39,9 +39,24 @@ ProposalReasoningResponse = List[AgentReasoning]
 
 
 class VoteRequest(BaseModel):
+    """
+    A signed vote signs this text (UTF-8, lines joined by "\n", no trailing newline):
+
+        Quack governance vote
+        Proposal: <proposal id>
+        Vote: <YES|NO>
+        Wallet: <walletAddress>
+        Nonce: <nonce>
+        Signed at: <signedAt>
+
+    signedAt is unix seconds; the vote is rejected once it is more than
+    SIGNATURE_MAX_AGE seconds old, and a nonce is accepted once per wallet.
+    """
     vote: Literal["YES", "NO"]
     walletAddress: str
     signature: Optional[str] = None
+    nonce: Optional[str] = None  # Required with a signature, at most 64 printable characters
+    signedAt: Optional[int] = None
 
 
 class VoteResponse(BaseModel):
@@ -49,3 +64,12 @@ class VoteResponse(BaseModel):
     message: str
     voteId: Optional[str] = None
 
+
+class VoteTallyResponse(BaseModel):
+    proposalId: str
+    yesWeight: int
+    noWeight: int
+    yesVotes: int
+    noVotes: int
+    voters: int
+
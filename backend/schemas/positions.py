@@ -6,6 +6,8 @@ from typing import List, Literal, Optional
 
 
 class Position(BaseModel):
+    id: Optional[str] = None  # Bet id
+    version: Optional[int] = None  # Book version this position last changed at
     market: str
     side: Literal["LONG", "SHORT"]
     betDescription: str
@@ -19,3 +21,8 @@ class Position(BaseModel):
 
 PositionsResponse = List[Position]
 
+
+class PositionChangesResponse(BaseModel):
+    version: int
+    reset: bool  # True when positions is a full snapshot replacing the client's copy
+    positions: List[Position]  # Opened or repriced since the requested version
@@ -2,7 +2,7 @@
 Pydantic schemas for report-related endpoints
 """
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 
 class DailyReport(BaseModel):
@@ -13,7 +13,7 @@ class DailyReport(BaseModel):
     winRate: float
     keyTrades: List[str]
     agentNotes: str
-    ipfsReport: str
+    ipfsReport: Optional[str] = None
 
 
 DailyReportsResponse = List[DailyReport]
@@ -60,9 +60,23 @@ PnlDistributionResponse = List[PnlHistogramPoint]
 
 
 class DepositRequest(BaseModel):
+    """
+    A signed deposit signs this text (UTF-8, lines joined by "\n", no trailing newline):
+
+        Quack vault deposit
+        Wallet: <walletAddress>
+        Amount: <amount with exactly 6 decimals, e.g. 100.000000>
+        Nonce: <nonce>
+        Signed at: <signedAt>
+
+    signedAt is unix seconds; the deposit is rejected once it is more than
+    SIGNATURE_MAX_AGE seconds old, and a nonce is accepted once per wallet.
+    """
     amount: float
     walletAddress: str
     signature: Optional[str] = None
+    nonce: Optional[str] = None  # Required with a signature, at most 64 printable characters
+    signedAt: Optional[int] = None
 
 
 class DepositResponse(BaseModel):
@@ -0,0 +1,4 @@
+"""
+Service modules shared by the API routers
+(TypeScript bridge, worker pools, caches and in-memory stores)
+"""
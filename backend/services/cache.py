@@ -0,0 +1,105 @@
+"""
+In-process async cache with TTL, stale-while-revalidate and single-flight loading
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Caches the results of async loaders by key.
+    - Fresh entries (younger than ttl) are served directly.
+    - Stale entries (within ttl + stale_ttl) are served immediately while one
+      background refresh runs.
+    - Concurrent misses for the same key share one in-flight load.
+    Failed loads are never cached; with cache_none=False neither are None results
+    (e.g. "not found"), so a later lookup tries again.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, max_entries: int = 256, cache_none: bool = True):
+        self.ttl = ttl
+        self.cache_none = cache_none
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refresh_errors = 0
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl:
+                self.hits += 1
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self._start_load(key, loader).add_done_callback(self._log_refresh_error)
+                return value
+
+        self.misses += 1
+        return await self._load(key, loader)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = self._start_load(key, loader)
+        # Shield so one cancelled caller does not cancel the load for everyone else
+        return await asyncio.shield(task)
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+
+        def store(done: asyncio.Future):
+            self._inflight.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                if done.result() is not None or self.cache_none:
+                    self.set(key, done.result())
+
+        task.add_done_callback(store)
+        return task
+
+    def _log_refresh_error(self, done: asyncio.Future):
+        if not done.cancelled() and done.exception() is not None:
+            self.refresh_errors += 1
+            print(f"[Cache] Background refresh failed: {done.exception()}")
+
+    def set(self, key: Hashable, value: Any):
+        self._entries.pop(key, None)
+        self._entries[key] = (value, time.monotonic())
+        while len(self._entries) > self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._entries.pop(next(iter(self._entries)))
+
+    def last_value(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Last successfully loaded value for key, however old (until evicted)
+        """
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else default
+
+    def invalidate(self, key: Hashable = None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refresh_errors": self.refresh_errors,
+        }
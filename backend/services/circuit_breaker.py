@@ -0,0 +1,96 @@
+"""
+Circuit breaker for calls to external dependencies (TypeScript bridge, Snowflake).
+After failure_threshold consecutive failures the circuit opens and calls fail
+immediately with CircuitOpen instead of waiting out a timeout. Once
+reset_timeout has passed, a single probe call is let through (half-open):
+success closes the circuit, failure opens it again.
+"""
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import BRIDGE_BREAKER_FAILURE_THRESHOLD, BRIDGE_BREAKER_RESET_TIMEOUT
+from services.ts_bridge import BridgeError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(BridgeError):
+    """The circuit is open; the call was not attempted."""
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BRIDGE_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BRIDGE_BREAKER_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.times_opened = 0
+        self.rejected = 0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return CLOSED
+        if self._probing or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    async def call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() through the breaker. Raises CircuitOpen without calling fn
+        while the circuit is open or another call is probing it.
+        """
+        state = self.state
+        if state == OPEN or (state == HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise CircuitOpen(f"{self.name} circuit is open: {self.last_error}")
+
+        probe = state == HALF_OPEN
+        if probe:
+            self._probing = True
+        try:
+            result = await fn()
+        except Exception as e:
+            self._record_failure(e)
+            raise
+        finally:
+            if probe:
+                self._probing = False
+
+        self.failures = 0
+        if self.opened_at is not None:
+            print(f"[CircuitBreaker] {self.name} circuit closed")
+            self.opened_at = None
+        return result
+
+    def _record_failure(self, error: Exception):
+        self.failures += 1
+        self.last_error = str(error)
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.times_opened += 1
+                print(f"[CircuitBreaker] {self.name} circuit opened after {self.failures} failures: {error}")
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = round(self.reset_timeout - (time.monotonic() - self.opened_at), 1)
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in": retry_in,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,66 @@
+"""
+Shared access to the Snowflake dashboard queries.
+Results are cached per function name and arguments so concurrent page loads
+share one warehouse query instead of each running their own. Queries go to the
+resident dashboard daemon when it is available, otherwise to a one-off ts-node process.
+All queries pass through a circuit breaker: while Snowflake or the bridge is
+down, calls fail fast and cached lists are served from their last good result.
+"""
+import json
+from typing import Any
+
+from app.config import (
+    DASHBOARD_CACHE_TTL,
+    DASHBOARD_CACHE_STALE_TTL,
+    DASHBOARD_CACHE_MAX_ENTRIES,
+    DASHBOARD_DAEMON_ENABLED,
+)
+from services.cache import TTLCache
+from services.circuit_breaker import CircuitBreaker
+from services.dashboard_daemon import dashboard_daemon, DaemonUnavailable
+from services.metrics import bridge_fallbacks
+from services.ts_bridge import BridgeError, call_typescript_dashboard
+
+dashboard_cache = TTLCache(
+    ttl=DASHBOARD_CACHE_TTL,
+    stale_ttl=DASHBOARD_CACHE_STALE_TTL,
+    max_entries=DASHBOARD_CACHE_MAX_ENTRIES,
+)
+
+dashboard_breaker = CircuitBreaker("dashboard")
+
+_MISSING = object()
+
+
+async def query_dashboard(function_name: str, *args) -> Any:
+    """
+    Run a dashboard.ts function, preferring the resident daemon.
+    Raises CircuitOpen immediately while the bridge is failing.
+    """
+    async def run():
+        if DASHBOARD_DAEMON_ENABLED:
+            try:
+                return await dashboard_daemon.call(function_name, *args)
+            except DaemonUnavailable as e:
+                print(f"Dashboard daemon unavailable, using ts-node: {e}")
+                bridge_fallbacks.inc(function=function_name, reason="daemon_unavailable")
+        return await call_typescript_dashboard(function_name, *args)
+
+    return await dashboard_breaker.call(run)
+
+
+async def get_dashboard_data(function_name: str, *args) -> Any:
+    """
+    Call a dashboard.ts function through the cache.
+    If the query fails, the last good result for the same call is returned instead.
+    """
+    key = (function_name, json.dumps(args))
+    try:
+        return await dashboard_cache.get(key, lambda: query_dashboard(function_name, *args))
+    except BridgeError as e:
+        last_good = dashboard_cache.last_value(key, _MISSING)
+        if last_good is _MISSING:
+            raise
+        print(f"Dashboard query {function_name} failed, serving last good result: {e}")
+        bridge_fallbacks.inc(function=function_name, reason="last_good")
+        return last_good
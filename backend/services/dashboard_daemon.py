@@ -0,0 +1,220 @@
+"""
+Client for the resident dashboard query daemon (src/services/snowflake/dashboardDaemon.ts).
+The daemon keeps pooled Snowflake sessions open; calls are dispatched by
+function name with JSON arguments over a Unix socket, one frame per line.
+"""
+import asyncio
+import itertools
+import json
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from app.config import (
+    DASHBOARD_DAEMON_AUTOSTART,
+    DASHBOARD_DAEMON_SOCKET,
+    DASHBOARD_DAEMON_POOL_SIZE,
+    DASHBOARD_DAEMON_STARTUP_TIMEOUT,
+    DASHBOARD_DAEMON_RETRY_INTERVAL,
+    DASHBOARD_DAEMON_STANDIN,
+    TS_DASHBOARD_TIMEOUT,
+)
+from services.metrics import bridge_duration, bridge_parse, bridge_timeouts
+from services.ts_bridge import BridgeError, BridgeTimeout
+
+BACKEND_DIR = Path(__file__).parent.parent
+TS_DAEMON = BACKEND_DIR / "src" / "services" / "snowflake" / "dashboardDaemon.ts"
+TS_DAEMON_JS = BACKEND_DIR / "dist" / "src" / "services" / "snowflake" / "dashboardDaemon.js"
+
+STREAM_LIMIT = 16 * 1024 * 1024
+MAX_IDLE_CONNECTIONS = 8
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class DaemonUnavailable(BridgeError):
+    """The dashboard daemon is not running and could not be started."""
+
+
+def daemon_command(socket_path: str, pool_size: int, standin: bool = False) -> List[str]:
+    """
+    Command line for the daemon. Prefers compiled JavaScript, falls back to ts-node.
+    """
+    if TS_DAEMON_JS.exists():
+        cmd = ["node", str(TS_DAEMON_JS)]
+    else:
+        cmd = ["npx", "ts-node", "--project", "tsconfig.json", str(TS_DAEMON)]
+    cmd += ["--socket", socket_path, "--pool", str(pool_size)]
+    if standin:
+        cmd.append("--standin")
+    return cmd
+
+
+class DashboardDaemonClient:
+    """
+    Talks to the daemon over its Unix socket, reusing idle connections.
+    If the socket is not reachable and autostart is on, the daemon is spawned
+    once; a failed start is not retried for retry_interval seconds.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DASHBOARD_DAEMON_SOCKET,
+        pool_size: int = DASHBOARD_DAEMON_POOL_SIZE,
+        autostart: bool = DASHBOARD_DAEMON_AUTOSTART,
+        standin: bool = DASHBOARD_DAEMON_STANDIN,
+    ):
+        self.socket_path = socket_path
+        self.pool_size = pool_size
+        self.autostart = autostart
+        self.standin = standin
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._idle: List[Connection] = []
+        self._frame_ids = itertools.count(1)
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._start_failed_at = 0.0
+
+    async def call(self, function_name: str, *args, timeout: float = TS_DASHBOARD_TIMEOUT) -> Any:
+        """
+        Run a dashboard function in the daemon and return its result
+        """
+        started = time.perf_counter()
+        try:
+            return await self._call(function_name, args, timeout)
+        finally:
+            bridge_duration.observe(time.perf_counter() - started, function=function_name, transport="daemon")
+
+    async def _call(self, function_name: str, args: tuple, timeout: float) -> Any:
+        reader, writer = await self._acquire()
+        frame_id = next(self._frame_ids)
+        payload = json.dumps({"id": frame_id, "function": function_name, "args": list(args)}) + "\n"
+
+        try:
+            writer.write(payload.encode())
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+        except asyncio.TimeoutError:
+            writer.close()
+            bridge_timeouts.inc(function=function_name, transport="daemon")
+            raise BridgeTimeout(f"Dashboard daemon timed out after {timeout:g} seconds")
+        except (ConnectionError, OSError) as e:
+            writer.close()
+            raise DaemonUnavailable(f"Dashboard daemon connection lost: {e}")
+        except asyncio.CancelledError:
+            writer.close()
+            raise
+
+        if not line:
+            writer.close()
+            raise DaemonUnavailable("Dashboard daemon closed the connection")
+
+        parse_started = time.perf_counter()
+        try:
+            frame = json.loads(line)
+        except json.JSONDecodeError as e:
+            writer.close()
+            raise BridgeError(f"Invalid response from dashboard daemon: {e}")
+        bridge_parse.observe(time.perf_counter() - parse_started, function=function_name)
+
+        if frame.get("id") != frame_id:
+            writer.close()
+            raise BridgeError("Dashboard daemon response out of order")
+
+        self._release((reader, writer))
+        if frame.get("error"):
+            raise BridgeError(f"Dashboard daemon error: {frame['error']}")
+        return frame.get("result")
+
+    async def _acquire(self) -> Connection:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+        try:
+            return await self._connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not self.autostart:
+                raise DaemonUnavailable(f"Dashboard daemon is not listening on {self.socket_path}")
+        except OSError as e:
+            raise DaemonUnavailable(f"Could not connect to dashboard daemon: {e}")
+
+        await self._ensure_started()
+        try:
+            return await self._connect()
+        except OSError as e:
+            raise DaemonUnavailable(f"Could not connect to dashboard daemon: {e}")
+
+    def _release(self, connection: Connection):
+        if len(self._idle) < MAX_IDLE_CONNECTIONS:
+            self._idle.append(connection)
+        else:
+            connection[1].close()
+
+    async def _connect(self) -> Connection:
+        return await asyncio.open_unix_connection(self.socket_path, limit=STREAM_LIMIT)
+
+    async def _ensure_started(self):
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self.process is not None and self.process.returncode is None:
+                # Started by a concurrent caller, possibly still warming up
+                if await self._wait_until_listening():
+                    return
+                raise DaemonUnavailable("Dashboard daemon is running but not listening")
+            if time.monotonic() - self._start_failed_at < DASHBOARD_DAEMON_RETRY_INTERVAL:
+                raise DaemonUnavailable("Dashboard daemon failed to start recently")
+
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    *daemon_command(self.socket_path, self.pool_size, self.standin),
+                    stdin=asyncio.subprocess.DEVNULL,
+                    cwd=str(BACKEND_DIR),
+                    start_new_session=True,
+                )
+            except OSError as e:
+                self._start_failed_at = time.monotonic()
+                raise DaemonUnavailable(f"Could not start dashboard daemon: {e}")
+
+            if not await self._wait_until_listening():
+                self._start_failed_at = time.monotonic()
+                await self.shutdown()
+                raise DaemonUnavailable("Dashboard daemon did not start listening in time")
+
+    async def _wait_until_listening(self) -> bool:
+        deadline = time.monotonic() + DASHBOARD_DAEMON_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process is not None and self.process.returncode is not None:
+                return False
+            try:
+                _, writer = await self._connect()
+                writer.close()
+                return True
+            except OSError:
+                # Not bound yet, refused, or a stale non-socket path still in the way
+                await asyncio.sleep(0.1)
+        return False
+
+    async def shutdown(self):
+        """
+        Close idle connections and stop the daemon if this client started it
+        """
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+        process, self.process = self.process, None
+        if process is not None and process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGTERM)
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except (ProcessLookupError, PermissionError):
+                pass
+            except asyncio.TimeoutError:
+                os.killpg(process.pid, signal.SIGKILL)
+
+
+dashboard_daemon = DashboardDaemonClient()
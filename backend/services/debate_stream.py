@@ -0,0 +1,185 @@
+"""
+Fan-out hub for live debate messages.
+The decision engine publishes each debate message once per debate; every
+subscriber reads from its own bounded buffer, so one slow client never blocks
+the engine or the other subscribers. A subscriber whose buffer overflows is
+dropped and told it lagged. Recent debates keep their history, so late joiners
+replay what they missed before receiving live messages.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config import DEBATE_STREAM_BUFFER, DEBATE_STREAM_RETENTION
+
+Message = Dict[str, Any]
+
+
+class Subscriber:
+    def __init__(self, history: List[Message], buffer: int):
+        self._backlog = deque(history)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+        self.lagged = False
+
+    def offer(self, item: Optional[Message]):
+        """
+        Queue a message (None ends the stream) without ever blocking the publisher
+        """
+        if self.lagged:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.lagged = True
+
+    async def next(self) -> Optional[Message]:
+        """
+        Next message, or None when the debate is over or the subscriber lagged
+        """
+        if self._backlog:
+            return self._backlog.popleft()
+        if self.lagged and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+
+class DebateChannel:
+    def __init__(self, debate_id: str):
+        self.debate_id = debate_id
+        self.started_at = time.time()
+        self.messages: List[Message] = []
+        self.subscribers = set()
+        self.finished = False
+
+    def publish(self, message: Message):
+        self.messages.append(message)
+        for subscriber in list(self.subscribers):
+            subscriber.offer(message)
+            if subscriber.lagged:
+                self.subscribers.discard(subscriber)
+
+    def finish(self):
+        self.finished = True
+        for subscriber in self.subscribers:
+            subscriber.offer(None)
+        self.subscribers.clear()
+
+
+class DebateHub:
+    """
+    Debates by id. The most recently started debate is the live one.
+    """
+
+    def __init__(self, buffer: int = DEBATE_STREAM_BUFFER, retention: int = DEBATE_STREAM_RETENTION):
+        self.buffer = buffer
+        self.retention = retention
+        self.channels: "OrderedDict[str, DebateChannel]" = OrderedDict()
+        self.live_id: Optional[str] = None
+        self.lagged = 0
+        self._started: Optional[asyncio.Event] = None
+
+    def open(self, debate_id: str) -> DebateChannel:
+        """
+        Create the channel for a debate that has not started yet (e.g. a queued job),
+        so clients can subscribe before the first message
+        """
+        channel = self.channels.get(debate_id)
+        if channel is None or channel.finished:
+            channel = DebateChannel(debate_id)
+            self.channels[debate_id] = channel
+            self._prune()
+        return channel
+
+    def start(self, debate_id: str) -> DebateChannel:
+        """
+        Mark a debate as running; it becomes the live debate
+        """
+        channel = self.open(debate_id)
+        channel.started_at = time.time()
+        self.live_id = debate_id
+        if self._started is not None:
+            self._started.set()
+            self._started = None
+        return channel
+
+    def publish(self, debate_id: str, message: Message):
+        channel = self.channels.get(debate_id)
+        if channel is not None and not channel.finished:
+            before = len(channel.subscribers)
+            channel.publish(message)
+            self.lagged += before - len(channel.subscribers)
+
+    def finish(self, debate_id: str):
+        channel = self.channels.get(debate_id)
+        if channel is not None:
+            channel.finish()
+
+    def get(self, debate_id: str) -> Optional[DebateChannel]:
+        return self.channels.get(debate_id)
+
+    def live(self) -> Optional[DebateChannel]:
+        return self.channels.get(self.live_id) if self.live_id else None
+
+    async def wait_for_debate(self) -> DebateChannel:
+        """
+        Wait until the next debate starts
+        """
+        if self._started is None:
+            self._started = asyncio.Event()
+        await self._started.wait()
+        return self.live()
+
+    def subscribe(self, channel: DebateChannel) -> Subscriber:
+        """
+        Subscribe to a debate, replaying its history first
+        """
+        subscriber = Subscriber(channel.messages, self.buffer)
+        if channel.finished:
+            subscriber.offer(None)
+        else:
+            channel.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, channel: DebateChannel, subscriber: Subscriber):
+        channel.subscribers.discard(subscriber)
+
+    def _prune(self):
+        # Oldest finished debates go first; running debates are never dropped
+        while len(self.channels) > self.retention:
+            oldest = next((i for i, c in self.channels.items() if c.finished), None)
+            if oldest is None:
+                break
+            del self.channels[oldest]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "debates": len(self.channels),
+            "running": sum(1 for channel in self.channels.values() if not channel.finished),
+            "subscribers": sum(len(channel.subscribers) for channel in self.channels.values()),
+            "lagged": self.lagged,
+        }
+
+
+def messages_from_result(result: Dict[str, Any]) -> List[Message]:
+    """
+    Debate messages reconstructed from a finished decision's conversation logs
+    """
+    logs = result.get("conversation_logs") or {}
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    messages = []
+    for phase, key in (("initial", "initial_decisions"), ("final", "final_decisions")):
+        for agent in logs.get(key) or []:
+            decision = agent.get("decision") or {}
+            messages.append({
+                "agent": agent.get("agent") or "Unknown",
+                "message": decision.get("reasoning") or "",
+                "timestamp": timestamp,
+                "vote": decision.get("direction") or "NO",
+                "phase": phase,
+            })
+    return messages
+
+
+debate_hub = DebateHub()
@@ -0,0 +1,113 @@
+"""
+Memoization for decision requests.
+Requests are keyed on a hash of their canonical JSON form, so the same market
+and AgentData map to the same key regardless of field order. Identical
+requests within the TTL reuse one result, and concurrent identical requests
+share a single in-flight decision run.
+Auto-select requests (no market named, "pick the best market now") are never
+memoized: their answer depends on when they run, so they only share a run
+that is already in flight.
+"""
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+from app.config import DECISION_MEMO_TTL, DECISION_MEMO_MAX_ENTRIES
+from services.cache import TTLCache
+
+
+def request_key(request_data: Dict[str, Any]) -> str:
+    """
+    SHA-256 of the request as canonical JSON (sorted keys, no whitespace)
+    """
+    canonical = json.dumps(request_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class DecisionMemo:
+    """
+    Decision results by request key. Error results are not kept.
+    """
+
+    def __init__(self, ttl: float = DECISION_MEMO_TTL, max_entries: int = DECISION_MEMO_MAX_ENTRIES):
+        self._cache = TTLCache(ttl=ttl, max_entries=max_entries)
+        self._auto_inflight: Dict[str, asyncio.Future] = {}
+        self.bypassed = 0
+        self.auto_runs = 0
+        self.auto_coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.ttl > 0
+
+    async def get(
+        self,
+        request_data: Dict[str, Any],
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        fresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Memoized result for request_data, calling run() on a miss.
+        fresh=True always runs a new decision and replaces the memoized one.
+        """
+        if not self.enabled:
+            return await run()
+
+        key = request_key(request_data)
+        if not request_data.get("market"):
+            return await self._auto_select(key, run, fresh)
+        if fresh:
+            self.bypassed += 1
+            result = await run()
+            if result.get("status") != "error":
+                self._cache.set(key, result)
+            return result
+
+        result = await self._cache.get(key, run)
+        if result.get("status") == "error":
+            self._cache.invalidate(key)
+        return result
+
+    async def _auto_select(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        fresh: bool,
+    ) -> Dict[str, Any]:
+        task = None if fresh else self._auto_inflight.get(key)
+        if task is not None:
+            self.auto_coalesced += 1
+            return await asyncio.shield(task)
+
+        self.auto_runs += 1
+        task = asyncio.ensure_future(run())
+        self._auto_inflight[key] = task
+
+        def forget(done: asyncio.Future):
+            if self._auto_inflight.get(key) is done:
+                del self._auto_inflight[key]
+
+        task.add_done_callback(forget)
+        # Shield so one cancelled caller does not cancel the run for everyone else
+        return await asyncio.shield(task)
+
+    def invalidate(self):
+        self._cache.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._cache.stats()
+        return {
+            "entries": stats["entries"],
+            "hits": stats["hits"],
+            "coalesced": stats["coalesced"],
+            "runs": stats["misses"] - stats["coalesced"] + self.bypassed + self.auto_runs,
+            "bypassed": self.bypassed,
+            "auto_select_runs": self.auto_runs,
+            "auto_select_coalesced": self.auto_coalesced,
+            # Each hit or coalesced request is one 5-agent debate not run
+            "llm_runs_saved": stats["hits"] + stats["coalesced"] + self.auto_coalesced,
+        }
+
+
+decision_memo = DecisionMemo()
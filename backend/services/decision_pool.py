@@ -0,0 +1,298 @@
+"""
+Persistent worker pool for the TypeScript decision engine.
+Keeps long-lived Node processes running decisionService in --worker mode and
+exchanges one JSON frame per line over stdin/stdout, so Node startup and
+TypeScript compilation are paid once per worker instead of once per request.
+"""
+import asyncio
+import itertools
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import (
+    DECISION_POOL_SIZE,
+    DECISION_POOL_MAX_REQUESTS,
+    DECISION_POOL_REQUEST_TIMEOUT,
+    DECISION_POOL_STARTUP_TIMEOUT,
+    DECISION_POOL_HEALTH_INTERVAL,
+)
+from services.metrics import bridge_first_byte, bridge_duration, bridge_parse, bridge_timeouts
+
+BACKEND_DIR = Path(__file__).parent.parent
+TS_SERVICE = BACKEND_DIR / "agent_engine" / "services" / "decisionService.ts"
+TS_SERVICE_JS = BACKEND_DIR / "dist" / "agent_engine" / "services" / "decisionService.js"
+
+# Response frames carry full conversation logs, well past asyncio's 64 KiB line limit
+STREAM_LIMIT = 16 * 1024 * 1024
+PING_TIMEOUT = 5.0
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+
+class WorkerError(Exception):
+    """A decision worker crashed, timed out or answered with an error frame."""
+
+
+class WorkerStartError(WorkerError):
+    """A decision worker process could not be started."""
+
+
+def worker_command() -> List[str]:
+    """
+    Command line for a resident worker.
+    Prefers compiled JavaScript, falls back to ts-node.
+    """
+    if TS_SERVICE_JS.exists():
+        return ["node", str(TS_SERVICE_JS), "--worker"]
+    return ["npx", "ts-node", "--project", "tsconfig.json", str(TS_SERVICE), "--worker"]
+
+
+class DecisionWorker:
+    """
+    One long-lived Node process. Serves a single request at a time.
+    """
+
+    def __init__(self, worker_id: int):
+        self.worker_id = worker_id
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.requests_served = 0
+        self.last_used = 0.0
+        self.stderr_tail: deque = deque(maxlen=50)
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._frame_ids = itertools.count(1)
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self):
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                *worker_command(),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(BACKEND_DIR),
+                limit=STREAM_LIMIT,
+            )
+        except OSError as e:
+            raise WorkerStartError(f"Could not start decision worker: {e}")
+
+        self.requests_served = 0
+        self.last_used = time.monotonic()
+        self._stderr_task = asyncio.create_task(self._drain_stderr(self.process))
+
+        try:
+            await self.ping(timeout=DECISION_POOL_STARTUP_TIMEOUT)
+        except WorkerError as e:
+            raise WorkerStartError(str(e))
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process):
+        # Agent logs go to stderr; keep reading so a full pipe never blocks the worker
+        async for line in process.stderr:
+            self.stderr_tail.append(line.decode(errors="replace").rstrip())
+
+    def kill(self):
+        """
+        Drop the process immediately (used after timeouts, crashes and cancellation)
+        """
+        process, self.process = self.process, None
+        if process is not None and process.returncode is None:
+            process.kill()
+
+    async def stop(self):
+        """
+        Ask the worker to exit by closing stdin, killing it if it does not comply
+        """
+        process, self.process = self.process, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except (asyncio.TimeoutError, OSError):
+            process.kill()
+
+    async def call(
+        self,
+        frame: Dict[str, Any],
+        timeout: float,
+        on_event: Optional[EventHandler] = None,
+    ) -> Dict[str, Any]:
+        if not self.alive:
+            raise WorkerError(f"Decision worker {self.worker_id} is not running")
+
+        frame_id = next(self._frame_ids)
+        payload = json.dumps({"id": frame_id, **frame}) + "\n"
+        label = frame.get("type", "unknown")
+        started = time.perf_counter()
+
+        try:
+            self.process.stdin.write(payload.encode())
+            await self.process.stdin.drain()
+            response = await asyncio.wait_for(
+                self._read_response(frame_id, label, started, on_event),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            self.kill()
+            bridge_timeouts.inc(function=label, transport="worker")
+            raise WorkerError(f"Decision worker {self.worker_id} timed out after {timeout:g} seconds")
+        except (BrokenPipeError, ConnectionResetError):
+            self.kill()
+            raise WorkerError(f"Decision worker {self.worker_id} crashed: {self.last_error()}")
+        except asyncio.CancelledError:
+            # The caller went away mid-request; the worker state is unknown
+            self.kill()
+            raise
+        finally:
+            bridge_duration.observe(time.perf_counter() - started, function=label, transport="worker")
+
+        self.last_used = time.monotonic()
+        if response.get("error"):
+            raise WorkerError(f"Decision worker error: {response['error']}")
+        return response
+
+    async def _read_response(
+        self,
+        frame_id: int,
+        label: str,
+        started: float,
+        on_event: Optional[EventHandler] = None,
+    ) -> Dict[str, Any]:
+        first_frame = True
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                self.kill()
+                raise WorkerError(f"Decision worker {self.worker_id} exited: {self.last_error()}")
+
+            line = line.strip()
+            if not line.startswith(b"{"):
+                continue  # stray log output
+            parse_started = time.perf_counter()
+            try:
+                frame = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if frame.get("id") != frame_id:
+                continue
+            if first_frame:
+                first_frame = False
+                bridge_first_byte.observe(parse_started - started, function=label, transport="worker")
+            if frame.get("type") == "event":
+                # Progress frame for the running request; the final frame follows
+                if on_event is not None:
+                    try:
+                        on_event(frame.get("event", {}))
+                    except Exception as e:
+                        print(f"[DecisionPool] Event handler failed: {e}")
+                continue
+            bridge_parse.observe(time.perf_counter() - parse_started, function=label)
+            return frame
+
+    async def ping(self, timeout: float = PING_TIMEOUT):
+        await self.call({"type": "ping"}, timeout=timeout)
+
+    async def run_decision(
+        self,
+        request_data: Dict[str, Any],
+        on_event: Optional[EventHandler] = None,
+    ) -> Dict[str, Any]:
+        response = await self.call(
+            {"type": "decision", "request": request_data},
+            timeout=DECISION_POOL_REQUEST_TIMEOUT,
+            on_event=on_event,
+        )
+        self.requests_served += 1
+        return response.get("result", {})
+
+    def last_error(self) -> str:
+        return self.stderr_tail[-1] if self.stderr_tail else "no output"
+
+
+class DecisionWorkerPool:
+    """
+    Fixed-size pool of decision workers.
+    Workers are started lazily, health-checked with a ping when they have been
+    idle for a while, restarted after a crash and recycled after max_requests.
+    """
+
+    def __init__(
+        self,
+        size: int = DECISION_POOL_SIZE,
+        max_requests: int = DECISION_POOL_MAX_REQUESTS,
+        health_interval: float = DECISION_POOL_HEALTH_INTERVAL,
+    ):
+        self.size = size
+        self.max_requests = max_requests
+        self.health_interval = health_interval
+        self.workers: List[DecisionWorker] = []
+        self.restarts = 0
+        self.recycled = 0
+        self.requests = 0
+        self._idle: Optional[asyncio.Queue] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def _ensure_workers(self):
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            self.workers = [DecisionWorker(i) for i in range(self.size)]
+            for worker in self.workers:
+                self._idle.put_nowait(worker)
+
+    async def _checkout(self, worker: DecisionWorker):
+        if worker.alive and worker.requests_served >= self.max_requests:
+            await worker.stop()
+            self.recycled += 1
+        elif worker.alive and time.monotonic() - worker.last_used > self.health_interval:
+            try:
+                await worker.ping()
+            except WorkerError as e:
+                print(f"[DecisionPool] Health check failed for worker {worker.worker_id}: {e}")
+                self.restarts += 1
+        elif not worker.alive and worker.last_used:
+            self.restarts += 1
+
+        if not worker.alive:
+            await worker.start()
+
+    async def run_decision(
+        self,
+        request_data: Dict[str, Any],
+        on_event: Optional[EventHandler] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run one decision on the next free worker.
+        on_event is called with each debate event the worker streams back.
+        """
+        self._ensure_workers()
+        worker = await self._idle.get()
+        try:
+            await self._checkout(worker)
+            self.requests += 1
+            return await worker.run_decision(request_data, on_event)
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def shutdown(self):
+        await asyncio.gather(*(worker.stop() for worker in self.workers), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "alive": sum(1 for worker in self.workers if worker.alive),
+            "idle": self._idle.qsize() if self._idle is not None else self.size,
+            "requests": self.requests,
+            "restarts": self.restarts,
+            "recycled": self.recycled,
+        }
+
+
+decision_pool = DecisionWorkerPool()
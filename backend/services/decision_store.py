@@ -0,0 +1,62 @@
+"""
+Decision store with a primary-key index.
+Every decision seen in a latest-decisions list is indexed by id, so detail
+lookups are O(1) dict hits. A miss runs a single-row getDecisionById query
+instead of pulling the latest N decisions and scanning them.
+"""
+from typing import Any, Dict, List, Optional
+
+from app.config import DECISION_STORE_TTL, DECISION_STORE_MAX_ENTRIES
+from services.cache import TTLCache
+from services.dashboard import get_dashboard_data, query_dashboard
+
+
+class DecisionStore:
+    """
+    Decisions indexed by id. Lookups for unknown ids are pushed down to
+    Snowflake as a targeted by-id query; concurrent lookups share one query.
+    """
+
+    def __init__(self, ttl: float = DECISION_STORE_TTL, max_entries: int = DECISION_STORE_MAX_ENTRIES):
+        # Misses are not cached: a decision written just after a miss must be found next time
+        self._index = TTLCache(ttl=ttl, max_entries=max_entries, cache_none=False)
+
+    def index(self, decisions: List[Dict[str, Any]]):
+        for decision in decisions:
+            if decision.get("id"):
+                self._index.set(decision["id"], decision)
+
+    async def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one decision by id, or None if it does not exist
+        """
+        return await self._index.get(decision_id, lambda: query_dashboard("getDecisionById", decision_id))
+
+    async def conversation_logs(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        """
+        A decision's debate logs (INVESTMENT_DECISIONS.CONVERSATION_LOGS, keyed by
+        the same id), or None. Not cached here; callers keep the transcript built from them.
+        """
+        return await query_dashboard("getConversationLogs", decision_id)
+
+    async def latest(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the latest decisions (through the dashboard cache) and index them
+        """
+        decisions = await get_dashboard_data("getLatestDecisions", limit)
+        self.index(decisions)
+        return decisions
+
+    async def page(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get one keyset page of decisions (see getDecisionsPage) and index it
+        """
+        decisions = await get_dashboard_data("getDecisionsPage", query)
+        self.index(decisions)
+        return decisions
+
+    def stats(self) -> Dict[str, Any]:
+        return self._index.stats()
+
+
+decision_store = DecisionStore()
@@ -0,0 +1,87 @@
+"""
+Pure-Python ed25519 signature verification (RFC 8032, section 5.1.7)
+Fallback for when PyNaCl is not installed. It is correct but slow (a few
+milliseconds per signature), so the signature service runs it on a process pool.
+"""
+import hashlib
+
+P = 2 ** 255 - 19
+Q = 2 ** 252 + 27742317777372353535851937790883648493  # Group order
+D = -121665 * pow(121666, P - 2, P) % P
+SQRT_M1 = pow(2, (P - 1) // 4, P)
+
+
+def _inverse(x: int) -> int:
+    return pow(x, P - 2, P)
+
+
+def _add(a, b):
+    # Point addition in extended coordinates (X, Y, Z, T)
+    e1 = (a[1] - a[0]) * (b[1] - b[0]) % P
+    e2 = (a[1] + a[0]) * (b[1] + b[0]) % P
+    c = 2 * a[3] * b[3] * D % P
+    d = 2 * a[2] * b[2] % P
+    e, f, g, h = e2 - e1, d - c, d + c, e2 + e1
+    return (e * f % P, g * h % P, f * g % P, e * h % P)
+
+
+def _multiply(scalar: int, point):
+    result = (0, 1, 1, 0)
+    while scalar > 0:
+        if scalar & 1:
+            result = _add(result, point)
+        point = _add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _equal(a, b) -> bool:
+    return (a[0] * b[2] - b[0] * a[2]) % P == 0 and (a[1] * b[2] - b[1] * a[2]) % P == 0
+
+
+def _recover_x(y: int, sign: int):
+    if y >= P:
+        return None
+    x2 = (y * y - 1) * _inverse(D * y * y + 1) % P
+    if x2 == 0:
+        return None if sign else 0
+    x = pow(x2, (P + 3) // 8, P)
+    if (x * x - x2) % P != 0:
+        x = x * SQRT_M1 % P
+    if (x * x - x2) % P != 0:
+        return None
+    if (x & 1) != sign:
+        x = P - x
+    return x
+
+
+def _decompress(data: bytes):
+    y = int.from_bytes(data, "little")
+    sign = y >> 255
+    y &= (1 << 255) - 1
+    x = _recover_x(y, sign)
+    if x is None:
+        return None
+    return (x, y, 1, x * y % P)
+
+
+_GY = 4 * _inverse(5) % P
+_GX = _recover_x(_GY, 0)
+BASE = (_GX, _GY, 1, _GX * _GY % P)
+
+
+def verify(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    """
+    Whether signature is a valid ed25519 signature of message by public_key
+    """
+    if len(public_key) != 32 or len(signature) != 64:
+        return False
+    a = _decompress(public_key)
+    r = _decompress(signature[:32])
+    if a is None or r is None:
+        return False
+    s = int.from_bytes(signature[32:], "little")
+    if s >= Q:
+        return False
+    h = int.from_bytes(hashlib.sha512(signature[:32] + public_key + message).digest(), "little") % Q
+    return _equal(_multiply(s, BASE), _add(r, _multiply(h, a)))
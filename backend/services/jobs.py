@@ -0,0 +1,151 @@
+"""
+Background job manager for long-running work (e.g. 5-agent decisions).
+Jobs run on a fixed number of runner tasks behind a bounded queue, so HTTP
+requests return immediately and are never held open by LLM latency.
+"""
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.config import (
+    DECISION_JOB_CONCURRENCY,
+    DECISION_JOB_MAX_QUEUE,
+    DECISION_JOB_RETENTION,
+)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """The job queue is at capacity."""
+
+
+class Job:
+    def __init__(self, run: Callable[[], Awaitable[Any]]):
+        self.id = str(uuid.uuid4())
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self._run = run
+        self._done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for the job to finish; returns whether it did
+        """
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.finished
+
+
+class JobManager:
+    """
+    Runs submitted jobs on `concurrency` runner tasks.
+    Finished jobs stay readable for `retention` seconds; they are expired from
+    the front of a finish-ordered queue, so pruning never scans live jobs.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DECISION_JOB_CONCURRENCY,
+        max_queue: int = DECISION_JOB_MAX_QUEUE,
+        retention: float = DECISION_JOB_RETENTION,
+    ):
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.retention = retention
+        self.jobs: Dict[str, Job] = {}
+        self._finished: "deque[Job]" = deque()  # Finished jobs, oldest first
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._runners: List[asyncio.Task] = []
+
+    def _ensure_runners(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._runners = [asyncio.create_task(self._runner()) for _ in range(self.concurrency)]
+
+    async def _runner(self):
+        while True:
+            job = await self._queue.get()
+            job.status = RUNNING
+            job.started_at = time.time()
+            self.running += 1
+            try:
+                job.result = await job._run()
+                job.status = SUCCEEDED
+                self.completed += 1
+            except Exception as e:
+                job.error = str(e)
+                job.status = FAILED
+                self.failed += 1
+            finally:
+                job.finished_at = time.time()
+                job._run = None
+                job._done.set()
+                self.running -= 1
+                self._finished.append(job)
+                self._queue.task_done()
+
+    def submit(self, run: Callable[[], Awaitable[Any]]) -> Job:
+        """
+        Queue a job. Raises QueueFull when the queue is at capacity.
+        """
+        self._ensure_runners()
+        self._prune()
+        job = Job(run)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFull(f"Job queue is full ({self.max_queue} jobs waiting)")
+        self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._prune()
+        return self.jobs.get(job_id)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        while self._finished and self._finished[0].finished_at < cutoff:
+            del self.jobs[self._finished.popleft().id]
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def shutdown(self):
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+        self._queue = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": self.queue_depth,
+            "running": self.running,
+            "retained": len(self.jobs),
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+decision_jobs = JobManager()
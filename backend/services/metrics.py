@@ -0,0 +1,142 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+Counters and histograms are keyed by label values and rendered on demand by
+the /metrics endpoint; there is no background collection.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+_registry: List["Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric(ABC):
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _registry.append(self)
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines += self._samples()
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """
+        Sample lines of this metric, without the HELP/TYPE header
+        """
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(list(zip(self.labelnames, key)))} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Per label set: [count per bucket (non-cumulative)], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = ([0] * len(self.buckets), [0.0])
+        counts, total = entry
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        total[0] += value
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in self._values.items():
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(pairs + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _registry:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+# TypeScript bridge (one-off processes, decision workers, dashboard daemon)
+# transport is "process", "worker" or "daemon".
+bridge_queue_wait = Histogram(
+    "quack_bridge_queue_wait_seconds", "Time spent waiting for a bridge concurrency slot", ["function"])
+bridge_spawn = Histogram(
+    "quack_bridge_spawn_seconds", "Time to spawn a TypeScript child process", ["function"])
+bridge_first_byte = Histogram(
+    "quack_bridge_first_byte_seconds", "Time from call start to the first byte of output", ["function", "transport"])
+bridge_duration = Histogram(
+    "quack_bridge_duration_seconds", "Total wall time of a bridge call", ["function", "transport"])
+bridge_stdout_bytes = Histogram(
+    "quack_bridge_stdout_bytes", "Size of a child process's stdout", ["function"], buckets=SIZE_BUCKETS)
+bridge_parse = Histogram(
+    "quack_bridge_parse_seconds", "Time to parse JSON output from the bridge", ["function"])
+bridge_exits = Counter(
+    "quack_bridge_exit_total", "Child process exits by exit code", ["function", "code"])
+bridge_timeouts = Counter(
+    "quack_bridge_timeouts_total", "Bridge calls that hit their timeout", ["function", "transport"])
+bridge_fallbacks = Counter(
+    "quack_bridge_fallbacks_total", "Bridge calls answered by a fallback path", ["function", "reason"])
@@ -0,0 +1,55 @@
+"""
+Proposal index for Snowflake-backed proposals
+Proposals mapped from decisions are kept by id as pages are served, so
+GET /proposals/{id} is a dict hit instead of another decision lookup and
+mapping. Filtering and ordering are pushed down to Snowflake (getDecisionsPage);
+the mock bets are filtered in the columnar BetLedger.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from app.config import PROPOSAL_INDEX_MAX_ENTRIES
+
+
+class ProposalIndex:
+    """
+    Proposals by id, evicting the least recently used beyond max_entries.
+    """
+
+    def __init__(self, max_entries: int = PROPOSAL_INDEX_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._by_id: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add(self, proposal: Dict[str, Any]):
+        """
+        Insert or replace a proposal
+        """
+        proposal_id = proposal.get("id")
+        if not proposal_id:
+            return
+        self._by_id[proposal_id] = proposal
+        self._by_id.move_to_end(proposal_id)
+        while len(self._by_id) > self.max_entries:
+            self._by_id.popitem(last=False)
+
+    def index(self, proposals: Iterable[Dict[str, Any]]):
+        for proposal in proposals:
+            self.add(proposal)
+
+    def get(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        proposal = self._by_id.get(proposal_id)
+        if proposal is not None:
+            self._by_id.move_to_end(proposal_id)
+        return proposal
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._by_id),
+            "max_entries": self.max_entries,
+        }
+
+
+proposal_index = ProposalIndex()
@@ -0,0 +1,96 @@
+"""
+Cache of ready-encoded JSON responses with strong ETags
+Each entry is the encoded body for one query shape, tagged with the version of
+the data it was built from. While the version is unchanged the bytes are
+served as-is, and a request whose If-None-Match matches the ETag gets a 304
+without any serialization at all.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.config import PROPOSAL_RESPONSE_CACHE_MAX_ENTRIES
+
+
+def etag_for(body: bytes) -> str:
+    """
+    Strong ETag: a digest of the exact bytes served
+    """
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match check (weak comparison, as RFC 9110 requires for this header)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class EncodedResponse:
+    def __init__(self, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.etag = etag_for(body)
+        self.headers = dict(headers or {}, ETag=self.etag)
+
+    def respond(self, request: Request) -> Response:
+        """
+        200 with the stored bytes, or 304 if the client already has them
+        """
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
+
+
+class ResponseCache:
+    """
+    Encoded responses by key, each valid for one data version.
+    Least recently used entries are evicted beyond max_entries.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, EncodedResponse]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def get(self, key: Hashable, version: Any) -> Optional[EncodedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, version: Any, body: bytes, headers: Optional[Dict[str, str]] = None) -> EncodedResponse:
+        encoded = EncodedResponse(body, headers)
+        self._entries[key] = (version, encoded)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return encoded
+
+    def respond(self, request: Request, encoded: EncodedResponse) -> Response:
+        response = encoded.respond(request)
+        if response.status_code == 304:
+            self.not_modified += 1
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+
+proposal_responses = ResponseCache(PROPOSAL_RESPONSE_CACHE_MAX_ENTRIES)
@@ -0,0 +1,304 @@
+"""
+Wallet signature verification for votes and deposits
+Checks ed25519 signatures of signed messages against Solana public keys
+(base58 wallet addresses).
+- Batched: concurrent requests are collected for up to SIGNATURE_BATCH_DELAY
+  seconds (or SIGNATURE_BATCH_SIZE signatures) and verified together on a
+  worker pool, off the event loop.
+- Cached: recent (pubkey, message, signature) results are kept in an LRU, and
+  identical checks already in flight share one result, so retries are free.
+- Fresh: signed messages carry a nonce and a signing time. Messages older than
+  SIGNATURE_MAX_AGE seconds are rejected, and each (wallet, nonce) is accepted
+  once while its message is still fresh, so a signature can't be replayed.
+Uses PyNaCl (libsodium) on a thread pool when installed; otherwise a
+pure-Python implementation on a process pool.
+"""
+import asyncio
+import base64
+import heapq
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.config import (
+    SIGNATURE_BATCH_DELAY,
+    SIGNATURE_BATCH_SIZE,
+    SIGNATURE_CACHE_SIZE,
+    SIGNATURE_MAX_AGE,
+    SIGNATURE_REQUIRED,
+    SIGNATURE_WORKERS,
+)
+from data.base58 import b58decode
+
+try:
+    from nacl.exceptions import BadSignatureError
+    from nacl.signing import VerifyKey
+except ImportError:
+    VerifyKey = None
+    from services import ed25519
+
+Check = Tuple[bytes, bytes, bytes]  # (public key, message, signature)
+
+AMOUNT_DECIMALS = 6  # Deposits are signed in underlying (USDC) precision
+MAX_CLOCK_SKEW = 30  # Seconds a signing time may be ahead of the server clock
+MAX_NONCE_LENGTH = 64
+
+
+def decode_signature(value: str) -> bytes:
+    """
+    64-byte signature from base58 (as Solana wallets show it) or base64
+    """
+    try:
+        signature = b58decode(value)
+        if len(signature) == 64:
+            return signature
+    except ValueError:
+        pass
+    return base64.b64decode(value, validate=True)
+
+
+def vote_message(proposal_id: str, vote: str, wallet: str, nonce: str, signed_at: int) -> str:
+    """
+    Text a wallet signs to vote on a proposal (format documented on VoteRequest)
+    """
+    return (
+        f"Quack governance vote\nProposal: {proposal_id}\nVote: {vote}\nWallet: {wallet}"
+        f"\nNonce: {nonce}\nSigned at: {signed_at}"
+    )
+
+
+def deposit_message(wallet: str, amount: float, nonce: str, signed_at: int) -> str:
+    """
+    Text a wallet signs to request a deposit (format documented on DepositRequest).
+    The amount is written with AMOUNT_DECIMALS decimals, so the text doesn't depend on float repr.
+    """
+    return (
+        f"Quack vault deposit\nWallet: {wallet}\nAmount: {amount:.{AMOUNT_DECIMALS}f}"
+        f"\nNonce: {nonce}\nSigned at: {signed_at}"
+    )
+
+
+def verify_batch(checks: List[Check]) -> List[bool]:
+    """
+    Verify a batch of signatures (runs on a pool worker)
+    """
+    results = []
+    for public_key, message, signature in checks:
+        if VerifyKey is None:
+            results.append(ed25519.verify(public_key, message, signature))
+            continue
+        try:
+            VerifyKey(public_key).verify(message, signature)
+            results.append(True)
+        except (BadSignatureError, ValueError, TypeError):
+            results.append(False)
+    return results
+
+
+class SignatureVerifier:
+    """
+    Batches signature checks onto a worker pool and caches their results.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = SIGNATURE_BATCH_SIZE,
+        batch_delay: float = SIGNATURE_BATCH_DELAY,
+        workers: int = SIGNATURE_WORKERS,
+        cache_size: int = SIGNATURE_CACHE_SIZE,
+    ):
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.workers = workers
+        self.cache_size = cache_size
+        self.backend = "pynacl" if VerifyKey is not None else "python"
+        self._executor: Optional[Executor] = None
+        self._cache: "OrderedDict[Check, bool]" = OrderedDict()
+        self._inflight: Dict[Check, asyncio.Future] = {}
+        self._queue: List[Check] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.verified = 0
+        self.rejected = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.busy_seconds = 0.0  # Wall time with at least one batch running
+        self._running = 0
+        self._busy_since = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # libsodium releases the GIL, threads are enough; pure Python needs processes
+            pool = ThreadPoolExecutor if VerifyKey is not None else ProcessPoolExecutor
+            self._executor = pool(max_workers=self.workers)
+        return self._executor
+
+    async def verify(self, wallet: str, message: str, signature: str) -> bool:
+        """
+        Whether signature is wallet's signature of message.
+        Malformed keys or signatures are simply invalid.
+        """
+        try:
+            check = (b58decode(wallet), message.encode(), decode_signature(signature))
+        except ValueError:
+            self.rejected += 1
+            return False
+        if len(check[0]) != 32 or len(check[2]) != 64:
+            self.rejected += 1
+            return False
+
+        if check in self._cache:
+            self._cache.move_to_end(check)
+            self.cache_hits += 1
+            return self._cache[check]
+        future = self._inflight.get(check)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = self._inflight[check] = loop.create_future()
+        self._queue.append(check)
+        if len(self._queue) >= self.batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_delay, self._dispatch)
+        return await asyncio.shield(future)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Check]):
+        loop = asyncio.get_running_loop()
+        if not self._running:
+            self._busy_since = time.perf_counter()
+        self._running += 1
+        try:
+            results = await loop.run_in_executor(self._get_executor(), verify_batch, batch)
+        except Exception as e:
+            print(f"Signature batch failed: {e}")
+            for check in batch:
+                self._inflight.pop(check).set_exception(e)
+            return
+        finally:
+            self._running -= 1
+            if not self._running:
+                self.busy_seconds += time.perf_counter() - self._busy_since
+        self.batches += 1
+
+        for check, valid in zip(batch, results):
+            self.verified += 1
+            if not valid:
+                self.rejected += 1
+            self._cache[check] = valid
+            self._inflight.pop(check).set_result(valid)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "verified": self.verified,
+            "rejected": self.rejected,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "avg_batch_size": round(self.verified / self.batches, 1) if self.batches else 0,
+            # Throughput while verifying, across the pool
+            "verifications_per_sec": round(self.verified / self.busy_seconds) if self.busy_seconds else 0,
+        }
+
+
+class NonceRegistry:
+    """
+    (wallet, nonce) pairs already accepted, each kept until its message goes stale.
+    """
+
+    def __init__(self):
+        self._expiry: Dict[Tuple[str, str], float] = {}
+        self._heap: List[Tuple[float, Tuple[str, str]]] = []  # (expiry, key), soonest first
+
+    def _prune(self, now: float):
+        while self._heap and self._heap[0][0] <= now:
+            _, key = heapq.heappop(self._heap)
+            self._expiry.pop(key, None)
+
+    def seen(self, wallet: str, nonce: str) -> bool:
+        self._prune(time.time())
+        return (wallet, nonce) in self._expiry
+
+    def use(self, wallet: str, nonce: str, expires_at: float) -> bool:
+        """
+        Record a nonce; False if it was already used
+        """
+        self._prune(time.time())
+        key = (wallet, nonce)
+        if key in self._expiry:
+            return False
+        self._expiry[key] = expires_at
+        heapq.heappush(self._heap, (expires_at, key))
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+
+signature_verifier = SignatureVerifier()
+used_nonces = NonceRegistry()
+
+
+def check_freshness(nonce: Optional[str], signed_at: Optional[int], now: Optional[float] = None):
+    """
+    401 unless the nonce is well formed and signed_at is within SIGNATURE_MAX_AGE of now
+    """
+    if not nonce or signed_at is None:
+        raise HTTPException(status_code=401, detail="Signed requests need a nonce and signedAt")
+    if len(nonce) > MAX_NONCE_LENGTH or not nonce.isprintable():
+        raise HTTPException(status_code=401, detail="Invalid nonce")
+    now = time.time() if now is None else now
+    if signed_at < now - SIGNATURE_MAX_AGE:
+        raise HTTPException(status_code=401, detail="Signed message has expired")
+    if signed_at > now + MAX_CLOCK_SKEW:
+        raise HTTPException(status_code=401, detail="Signed message is from the future")
+
+
+async def require_signature(
+    wallet: str,
+    message: str,
+    signature: Optional[str],
+    nonce: Optional[str] = None,
+    signed_at: Optional[int] = None,
+) -> bool:
+    """
+    401 unless signature is wallet's signature of message, the message is fresh
+    and its nonce hasn't been used by this wallet yet.
+    Returns whether the request was signed: unsigned requests only get through
+    (returning False) when SIGNATURE_REQUIRED is turned off.
+    """
+    if signature is None:
+        if SIGNATURE_REQUIRED:
+            raise HTTPException(status_code=401, detail="Wallet signature required")
+        return False
+    check_freshness(nonce, signed_at)
+    if used_nonces.seen(wallet, nonce):
+        raise HTTPException(status_code=401, detail="Signed message was already used")
+    if not await signature_verifier.verify(wallet, message, signature):
+        raise HTTPException(status_code=401, detail="Invalid wallet signature")
+    # Claimed after verifying, so a bad signature can't burn a wallet's nonce;
+    # concurrent copies of one request both verify, only the first claims it
+    if not used_nonces.use(wallet, nonce, signed_at + SIGNATURE_MAX_AGE):
+        raise HTTPException(status_code=401, detail="Signed message was already used")
+    return True
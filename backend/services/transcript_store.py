@@ -0,0 +1,226 @@
+"""
+Compressed debate transcript store
+Each decision's transcript (debate messages and per-agent reasoning) is kept
+zlib-compressed and indexed by proposal id. Only the index lives in memory;
+the compressed records are appended to TRANSCRIPT_STORE_PATH and read back
+by offset, so memory stays bounded however many debates accumulate.
+- Lazy: a transcript is decompressed only when it is requested, and the most
+  recently requested ones are kept decompressed in an LRU.
+- Recovery: on first use the file's record headers are scanned to rebuild the
+  index (no decompression); a torn last record is cut off.
+- Off the event loop: put/get compress, decompress and touch the file on a
+  worker thread, one at a time under a lock. keep() is the best-effort put for
+  request paths: a transcript that can't be written is logged, not raised.
+The mock transcripts in data/mock_transcripts.json are loaded the same way,
+compressed in memory and never written to the file.
+"""
+import asyncio
+import json
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.config import TRANSCRIPT_CACHE_SIZE, TRANSCRIPT_STORE_PATH
+from services.debate_stream import messages_from_result
+
+Transcript = Dict[str, Any]  # {"messages": [...], "reasoning": [...]}
+
+MOCK_TRANSCRIPTS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "mock_transcripts.json")
+DEFAULT_TRANSCRIPT = "default"  # Mock transcript for proposals without one
+
+_HEADER = struct.Struct("<HI")  # Id length, compressed length
+COMPRESSION_LEVEL = 9
+
+
+def reasoning_from_result(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Each agent's final vote and rationale (initial ones if there was no final round)
+    """
+    logs = result.get("conversation_logs") or {}
+    agents = logs.get("final_decisions") or logs.get("initial_decisions") or []
+    reasoning = []
+    for agent in agents:
+        decision = agent.get("decision") or {}
+        reasoning.append({
+            "agent": agent.get("agent") or "Unknown",
+            "vote": decision.get("direction") or "NO",
+            "rationale": decision.get("reasoning") or "",
+        })
+    return reasoning
+
+
+def transcript_from_result(result: Dict[str, Any]) -> Transcript:
+    return {"messages": messages_from_result(result), "reasoning": reasoning_from_result(result)}
+
+
+def _compress(transcript: Transcript) -> bytes:
+    raw = json.dumps(transcript, separators=(",", ":")).encode()
+    return zlib.compress(raw, COMPRESSION_LEVEL)
+
+
+class TranscriptStore:
+    """
+    Compressed transcripts by proposal id, with an LRU of decompressed ones.
+    """
+
+    def __init__(self, path: str = TRANSCRIPT_STORE_PATH, cache_size: int = TRANSCRIPT_CACHE_SIZE):
+        self.path = path
+        self.cache_size = cache_size
+        # Proposal id -> (offset, length) in the file, or the compressed bytes for in-memory entries
+        self._index: Dict[str, Union[Tuple[int, int], bytes]] = {}
+        self._cache: "OrderedDict[str, Transcript]" = OrderedDict()
+        self._loaded = False
+        self._lock = threading.Lock()  # File appends and index/cache updates, across worker threads
+        self._size = 0
+        self.stored_bytes = 0
+        self.stale_bytes = 0  # Superseded records still in the file
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+
+    def _ensure_loaded(self):
+        # Callers hold self._lock
+        if not self._loaded:
+            self._load()
+
+    def _load(self):
+        self._loaded = True
+        self._seed_mock()
+        if not self.path or not os.path.exists(self.path):
+            return
+        file_size = os.path.getsize(self.path)
+        offset = 0
+        with open(self.path, "rb") as f:
+            # Read each record's header and id, then skip over its body
+            while offset + _HEADER.size <= file_size:
+                id_length, length = _HEADER.unpack(f.read(_HEADER.size))
+                start = offset + _HEADER.size + id_length
+                if start + length > file_size:
+                    break
+                proposal_id = f.read(id_length).decode()
+                self._point(proposal_id, (start, length), length)
+                offset = f.seek(start + length)
+        if offset < file_size:
+            print(f"Transcript store: dropping torn record at byte {offset}")
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+        self._size = offset
+        print(f"Transcript store loaded: {len(self._index)} transcripts")
+
+    def _seed_mock(self):
+        try:
+            with open(MOCK_TRANSCRIPTS_PATH, encoding="utf-8") as f:
+                mock = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Mock transcripts unavailable: {e}")
+            return
+        self._store(DEFAULT_TRANSCRIPT, _compress(mock["default"]), persist=False)
+        for proposal_id, transcript in mock["proposals"].items():
+            self._store(proposal_id, _compress(transcript), persist=False)
+
+    def _point(self, proposal_id: str, location: Union[Tuple[int, int], bytes], length: int):
+        previous = self._index.get(proposal_id)
+        if previous is not None:
+            previous_length = len(previous) if isinstance(previous, bytes) else previous[1]
+            self.stored_bytes -= previous_length
+            if not isinstance(previous, bytes):
+                self.stale_bytes += previous_length
+        self._index[proposal_id] = location
+        self.stored_bytes += length
+        self._cache.pop(proposal_id, None)
+
+    def _store(self, proposal_id: str, blob: bytes, persist: bool):
+        if not persist or not self.path:
+            self._point(proposal_id, blob, len(blob))
+            return
+        key = proposal_id.encode()
+        with open(self.path, "ab") as f:
+            try:
+                f.write(_HEADER.pack(len(key), len(blob)) + key + blob)
+                f.flush()
+            except OSError:
+                f.truncate(self._size)  # Don't leave a partial record ahead of the next append
+                raise
+        start = self._size + _HEADER.size + len(key)
+        self._size = start + len(blob)
+        self._point(proposal_id, (start, len(blob)), len(blob))
+
+    def _put(self, proposal_id: str, transcript: Transcript, persist: bool):
+        blob = _compress(transcript)
+        with self._lock:
+            self._ensure_loaded()
+            self._store(proposal_id, blob, persist)
+
+    def _get(self, proposal_id: str) -> Optional[Transcript]:
+        with self._lock:
+            self._ensure_loaded()
+            transcript = self._cache.get(proposal_id)
+            if transcript is not None:
+                self._cache.move_to_end(proposal_id)
+                self.hits += 1
+                return transcript
+
+            location = self._index.get(proposal_id)
+            if location is None:
+                return None
+            self.misses += 1
+            if isinstance(location, bytes):
+                blob = location
+            else:
+                with open(self.path, "rb") as f:
+                    f.seek(location[0])
+                    blob = f.read(location[1])
+        transcript = json.loads(zlib.decompress(blob))
+        with self._lock:
+            self._cache[proposal_id] = transcript
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return transcript
+
+    async def put(self, proposal_id: str, transcript: Transcript, persist: bool = True):
+        """
+        Store (or replace) a proposal's transcript.
+        persist=False keeps it compressed in memory only.
+        """
+        await asyncio.to_thread(self._put, proposal_id, transcript, persist)
+
+    async def keep(self, proposal_id: str, transcript: Transcript) -> bool:
+        """
+        put(), but a failed write (read-only directory, full disk) is logged
+        instead of raised. Returns whether the transcript was stored.
+        """
+        try:
+            await self.put(proposal_id, transcript)
+            return True
+        except OSError as e:
+            self.write_errors += 1
+            print(f"Transcript store: could not keep {proposal_id}: {e}")
+            return False
+
+    async def get(self, proposal_id: str) -> Optional[Transcript]:
+        """
+        A proposal's transcript, decompressed on first request
+        """
+        return await asyncio.to_thread(self._get, proposal_id)
+
+    def __contains__(self, proposal_id: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return proposal_id in self._index
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "transcripts": len(self._index),
+            "cached": len(self._cache),
+            "stored_bytes": self.stored_bytes,
+            "stale_bytes": self.stale_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "write_errors": self.write_errors,
+        }
+
+
+transcript_store = TranscriptStore()
@@ -0,0 +1,214 @@
+"""
+Non-blocking bridge to the TypeScript services.
+Runs node / ts-node child processes with asyncio so a slow Snowflake or Gemini
+call never blocks the event loop. Concurrency is capped per kind of call (long
+decision runs and short dashboard queries have separate semaphores, so slow
+decisions can't starve the dashboard) and timed-out children are killed
+together with anything they spawned.
+"""
+import asyncio
+import json
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from app.config import TS_BRIDGE_CONCURRENCY, TS_BRIDGE_DECISION_CONCURRENCY, TS_DASHBOARD_TIMEOUT
+from services.metrics import (
+    bridge_queue_wait,
+    bridge_spawn,
+    bridge_first_byte,
+    bridge_duration,
+    bridge_stdout_bytes,
+    bridge_parse,
+    bridge_exits,
+    bridge_timeouts,
+)
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+_limiters = {
+    "dashboard": asyncio.Semaphore(TS_BRIDGE_CONCURRENCY),
+    "decision": asyncio.Semaphore(TS_BRIDGE_DECISION_CONCURRENCY),
+}
+
+
+class BridgeError(Exception):
+    """A TypeScript call failed, exited non-zero or returned unparseable output."""
+
+
+class BridgeTimeout(BridgeError):
+    """A TypeScript call did not finish within its timeout."""
+
+
+class ProcessResult(NamedTuple):
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def _kill(process: asyncio.subprocess.Process):
+    # npx / ts-node fork the real node process; kill the whole session
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _communicate(
+    process: asyncio.subprocess.Process,
+    input_bytes: Optional[bytes],
+    on_first_byte,
+) -> Tuple[bytes, bytes]:
+    """
+    Like process.communicate(), but reports when stdout produces its first byte
+    """
+    async def feed():
+        if input_bytes is not None:
+            try:
+                process.stdin.write(input_bytes)
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            process.stdin.close()
+
+    async def read_stdout() -> bytes:
+        chunks = []
+        while True:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
+                return b"".join(chunks)
+            if not chunks:
+                on_first_byte()
+            chunks.append(chunk)
+
+    _, stdout, stderr = await asyncio.gather(feed(), read_stdout(), process.stderr.read())
+    await process.wait()
+    return stdout, stderr
+
+
+async def run_process(
+    cmd: List[str],
+    input_data: Optional[str] = None,
+    timeout: float = TS_DASHBOARD_TIMEOUT,
+    label: str = "unknown",
+    kind: str = "dashboard",
+) -> ProcessResult:
+    """
+    Run a child process from the backend directory and collect its output.
+    kind ("dashboard" or "decision") picks the concurrency limit it waits on.
+    Raises BridgeTimeout (after killing the child) if it runs past timeout,
+    and BridgeError if it can't be started.
+    Timings are recorded in the bridge metrics under label.
+    """
+    queued_at = time.perf_counter()
+    async with _limiters[kind]:
+        started = time.perf_counter()
+        bridge_queue_wait.observe(started - queued_at, function=label)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(BACKEND_DIR),
+                start_new_session=True,
+            )
+        except FileNotFoundError as e:
+            raise BridgeError(f"Command not found: {cmd[0]} ({e})")
+        except OSError as e:
+            raise BridgeError(f"Could not start {cmd[0]}: {e}")
+        bridge_spawn.observe(time.perf_counter() - started, function=label)
+
+        def on_first_byte():
+            bridge_first_byte.observe(time.perf_counter() - started, function=label, transport="process")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                _communicate(process, input_data.encode() if input_data is not None else None, on_first_byte),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            _kill(process)
+            await process.wait()
+            bridge_timeouts.inc(function=label, transport="process")
+            raise BridgeTimeout(f"TypeScript service timed out after {timeout:g} seconds")
+        except asyncio.CancelledError:
+            _kill(process)
+            raise
+        finally:
+            bridge_duration.observe(time.perf_counter() - started, function=label, transport="process")
+
+    bridge_stdout_bytes.observe(len(stdout), function=label)
+    bridge_exits.inc(function=label, code=process.returncode)
+    return ProcessResult(
+        process.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+def parse_json_output(stdout: str, label: str = "unknown") -> Any:
+    """
+    Parse the JSON payload from a TypeScript process.
+    The services log to stdout as well, so take the last line that looks like JSON.
+    """
+    started = time.perf_counter()
+    try:
+        return _parse_json_output(stdout)
+    finally:
+        bridge_parse.observe(time.perf_counter() - started, function=label)
+
+
+def _parse_json_output(stdout: str) -> Any:
+    for line in reversed(stdout.strip().split("\n")):
+        line = line.strip()
+        if line and (line.startswith("{") or line.startswith("[")):
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                continue
+    try:
+        return json.loads(stdout.strip())
+    except json.JSONDecodeError as e:
+        raise BridgeError(f"Invalid response from TypeScript service: {e}")
+
+
+async def run_ts_script(
+    script_content: str,
+    timeout: float = TS_DASHBOARD_TIMEOUT,
+    label: str = "script",
+) -> Any:
+    """
+    Evaluate a TypeScript snippet with ts-node and return its JSON output
+    """
+    result = await run_process(["npx", "ts-node", "-e", script_content], timeout=timeout, label=label)
+    if result.returncode != 0:
+        raise BridgeError(f"ts-node error: {result.stderr or result.stdout}")
+    return parse_json_output(result.stdout, label=label)
+
+
+async def call_typescript_dashboard(function_name: str, *args, timeout: float = TS_DASHBOARD_TIMEOUT) -> Any:
+    """
+    Call a function from src/services/snowflake/dashboard.ts.
+    Arguments are JSON-encoded so strings are passed safely.
+    """
+    script_content = f"""
+import {{ {function_name} }} from './src/services/snowflake/dashboard';
+import {{ initSnowflake }} from './src/database/snowflake';
+
+async function run() {{
+  try {{
+    await initSnowflake();
+    const result = await {function_name}({', '.join(json.dumps(arg) for arg in args)});
+    console.log(JSON.stringify(result));
+  }} catch (error) {{
+    console.error(JSON.stringify({{ error: String(error) }}));
+    process.exit(1);
+  }}
+}}
+
+run();
+"""
+    return await run_ts_script(script_content, timeout=timeout, label=function_name)
@@ -0,0 +1,262 @@
+"""
+Governance vote ingestion
+Votes are accepted into memory and acknowledged immediately, then written
+behind to an append-only JSON lines log in micro-batches (every
+VOTE_FLUSH_INTERVAL seconds or VOTE_FLUSH_BATCH votes, whichever comes first).
+- Dedupe: one vote per wallet per proposal, as the on-chain VoteRecord PDA enforces.
+- Tallies: YES/NO weight per proposal is kept as running totals, so reading a
+  tally is O(1) rather than a recount.
+- Recovery: on first use the log is replayed to rebuild votes and tallies.
+A crash can lose at most the votes of one unflushed batch.
+
+Benchmark:
+    python -m services.vote_ledger --votes 200000 --proposals 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from app.config import VOTE_FLUSH_BATCH, VOTE_FLUSH_INTERVAL, VOTE_LOG_PATH
+
+
+class DuplicateVote(Exception):
+    """The wallet has already voted on this proposal."""
+
+
+class Tally:
+    __slots__ = ("yes_weight", "no_weight", "yes_count", "no_count")
+
+    def __init__(self):
+        self.yes_weight = 0
+        self.no_weight = 0
+        self.yes_count = 0
+        self.no_count = 0
+
+    def add(self, vote: str, weight: int):
+        if vote == "YES":
+            self.yes_weight += weight
+            self.yes_count += 1
+        else:
+            self.no_weight += weight
+            self.no_count += 1
+
+
+class VoteLedger:
+    """
+    Votes by proposal with per-wallet dedupe, incremental tallies and a write-behind log.
+    """
+
+    def __init__(
+        self,
+        log_path: str = VOTE_LOG_PATH,
+        flush_interval: float = VOTE_FLUSH_INTERVAL,
+        flush_batch: int = VOTE_FLUSH_BATCH,
+    ):
+        self.log_path = log_path
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self._voters: Dict[str, Set[str]] = {}
+        self._tallies: Dict[str, Tally] = {}
+        self._pending: List[str] = []  # Encoded log lines not yet written
+        self._loaded = False
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._closing = False
+        self.sequence = 0
+        self.accepted = 0
+        self.duplicates = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.write_errors = 0
+
+    def _load(self):
+        # Rebuild votes and tallies from the log on first use
+        self._loaded = True
+        if not self.log_path or not os.path.exists(self.log_path):
+            return
+        with open(self.log_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    self._apply(record["proposal"], record["wallet"], record["vote"], record["weight"])
+                except (ValueError, KeyError, DuplicateVote):
+                    continue  # Torn last line or replayed duplicate
+                self.sequence = max(self.sequence, record.get("seq", 0))
+        print(f"Vote log replayed: {self.sequence} votes on {len(self._tallies)} proposals")
+
+    def _apply(self, proposal_id: str, wallet: str, vote: str, weight: int):
+        voters = self._voters.setdefault(proposal_id, set())
+        if wallet in voters:
+            raise DuplicateVote(f"Wallet {wallet} has already voted on proposal {proposal_id}")
+        voters.add(wallet)
+        tally = self._tallies.get(proposal_id)
+        if tally is None:
+            tally = self._tallies[proposal_id] = Tally()
+        tally.add(vote, weight)
+
+    def cast(self, proposal_id: str, wallet: str, vote: str, weight: int = 1) -> int:
+        """
+        Record a vote and return its sequence number.
+        Raises DuplicateVote if the wallet already voted on the proposal.
+        """
+        if not self._loaded:
+            self._load()
+        try:
+            self._apply(proposal_id, wallet, vote, weight)
+        except DuplicateVote:
+            self.duplicates += 1
+            raise
+
+        self.sequence += 1
+        self.accepted += 1
+        self._pending.append(json.dumps({
+            "seq": self.sequence,
+            "proposal": proposal_id,
+            "wallet": wallet,
+            "vote": vote,
+            "weight": weight,
+            "ts": time.time(),
+        }, separators=(",", ":")) + "\n")
+        self._ensure_writer()
+        if len(self._pending) >= self.flush_batch and self._flush_requested is not None:
+            self._flush_requested.set()
+        return self.sequence
+
+    def has_voted(self, proposal_id: str, wallet: str) -> bool:
+        if not self._loaded:
+            self._load()
+        return wallet in self._voters.get(proposal_id, ())
+
+    def tally(self, proposal_id: str) -> Dict[str, Any]:
+        """
+        Running YES/NO totals for a proposal
+        """
+        if not self._loaded:
+            self._load()
+        tally = self._tallies.get(proposal_id) or Tally()
+        return {
+            "proposalId": proposal_id,
+            "yesWeight": tally.yes_weight,
+            "noWeight": tally.no_weight,
+            "yesVotes": tally.yes_count,
+            "noVotes": tally.no_count,
+            "voters": tally.yes_count + tally.no_count,
+        }
+
+    def _ensure_writer(self):
+        if self._writer is None or self._writer.done():
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return  # No event loop (e.g. scripts): flush() writes synchronously
+            self._flush_requested = asyncio.Event()
+            self._writer = asyncio.create_task(self._write_behind())
+
+    async def _write_behind(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            if self._pending:
+                await self.flush()
+
+    def _write(self, lines: List[str]):
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def flush(self):
+        """
+        Write all pending votes to the log as one append
+        """
+        batch, self._pending = self._pending, []
+        if not batch or not self.log_path:
+            return
+        try:
+            await asyncio.to_thread(self._write, batch)
+        except OSError as e:
+            print(f"Vote log write failed, will retry: {e}")
+            self.write_errors += 1
+            self._pending = batch + self._pending
+            return
+        self.flushed += len(batch)
+        self.flushes += 1
+
+    async def close(self):
+        """
+        Stop the writer after it has written everything pending
+        """
+        if self._writer is not None:
+            self._closing = True
+            self._flush_requested.set()
+            await self._writer
+            self._writer = None
+            self._closing = False
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "proposals": len(self._tallies),
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "pending": len(self._pending),
+            "flushed": self.flushed,
+            "flushes": self.flushes,
+            "write_errors": self.write_errors,
+        }
+
+
+vote_ledger = VoteLedger()
+
+
+async def benchmark(votes: int, proposals: int, log_path: str) -> Dict[str, Any]:
+    """
+    Cast `votes` distinct votes across `proposals` proposals and wait until all are on disk
+    """
+    ledger = VoteLedger(log_path=log_path)
+    started = time.perf_counter()
+    for i in range(votes):
+        ledger.cast(f"prop-{i % proposals:03d}", f"wallet-{i // proposals}", "YES" if i % 3 else "NO", weight=1 + i % 7)
+        if i % 1000 == 999:
+            await asyncio.sleep(0)  # Let the writer run, as request handling would
+    cast_done = time.perf_counter()
+    await ledger.close()
+    finished = time.perf_counter()
+
+    tally_started = time.perf_counter()
+    for i in range(100000):
+        ledger.tally(f"prop-{i % proposals:03d}")
+    tally_time = time.perf_counter() - tally_started
+
+    return {
+        "votes": votes,
+        "proposals": proposals,
+        "castPerSec": round(votes / (cast_done - started)),
+        "durablePerSec": round(votes / (finished - started)),
+        "flushes": ledger.flushes,
+        "tallyReadsPerSec": round(100000 / tally_time),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vote ingestion throughput")
+    parser.add_argument("--votes", type=int, default=200000)
+    parser.add_argument("--proposals", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = asyncio.run(benchmark(args.votes, args.proposals, os.path.join(tmp, "votes.jsonl")))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
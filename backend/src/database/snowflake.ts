@@ -24,15 +24,12 @@ if (fs.existsSync(rootEnvPath)) {
 let connection: snowflake.Connection | null = null;
 let isInitialized = false;
 
+let pool: any = null;
+
 /**
- * Initialize Snowflake connection (singleton)
+ * Build connection options from environment variables
  */
-export async function initSnowflake(): Promise<void> {
-  if (isInitialized && connection) {
-    console.log('[Snowflake] Connection already initialized');
-    return;
-  }
-
+function getConnectionOptions(): any {
   let account = process.env.SNOWFLAKE_ACCOUNT;
   const username = process.env.SNOWFLAKE_USERNAME;
   const password = process.env.SNOWFLAKE_PASSWORD;
@@ -81,7 +78,19 @@ export async function initSnowflake(): Promise<void> {
     connectionOptions.region = region;
   }
 
-  connection = snowflake.createConnection(connectionOptions);
+  return connectionOptions;
+}
+
+/**
+ * Initialize Snowflake connection (singleton)
+ */
+export async function initSnowflake(): Promise<void> {
+  if (isInitialized && connection) {
+    console.log('[Snowflake] Connection already initialized');
+    return;
+  }
+
+  connection = snowflake.createConnection(getConnectionOptions());
 
   return new Promise((resolve, reject) => {
     connection!.connect((err: any, conn: any) => {
@@ -105,22 +114,32 @@ export async function initSnowflake(): Promise<void> {
  * @returns Promise resolving to query results
  */
 export async function execute(query: string, binds?: any[]): Promise<any[]> {
+  if (pool) {
+    return pool.use((pooledConnection: snowflake.Connection) => runQuery(pooledConnection, query, binds));
+  }
+
   if (!connection || !isInitialized) {
     await initSnowflake();
   }
 
-  return new Promise((resolve, reject) => {
-    if (!connection) {
-      reject(new Error('[Snowflake] Connection not initialized'));
-      return;
-    }
+  if (!connection) {
+    throw new Error('[Snowflake] Connection not initialized');
+  }
+
+  return runQuery(connection, query, binds);
+}
 
+/**
+ * Run a query on a specific connection
+ */
+function runQuery(conn: snowflake.Connection, query: string, binds?: any[]): Promise<any[]> {
+  return new Promise((resolve, reject) => {
     console.log('[Snowflake] Executing query:', query.substring(0, 100) + (query.length > 100 ? '...' : ''));
     if (binds && binds.length > 0) {
       console.log('[Snowflake] Bind parameters:', binds);
     }
 
-    connection.execute(
+    conn.execute(
       {
         sqlText: query,
         binds: binds || [],
@@ -155,10 +174,51 @@ export function closeConnection(): void {
   }
 }
 
+/**
+ * Initialize a pool of Snowflake sessions for long-lived processes
+ * (e.g. the dashboard daemon). Once a pool exists, execute() runs every
+ * query on a pooled session instead of the singleton connection.
+ * @param size Maximum number of open sessions
+ */
+export async function initSnowflakePool(size: number = 4): Promise<void> {
+  if (pool) {
+    console.log('[Snowflake] Pool already initialized');
+    return;
+  }
+
+  console.log(`[Snowflake] Initializing connection pool (max ${size} sessions)...`);
+  pool = snowflake.createPool(getConnectionOptions(), {
+    max: size,
+    min: 1,
+  });
+
+  // Open the first session now so bad credentials fail at startup, not on the first query
+  try {
+    await pool.use(async () => undefined);
+  } catch (error) {
+    pool = null;
+    throw error;
+  }
+  console.log('[Snowflake] Connection pool ready');
+}
+
+/**
+ * Drain and close the session pool
+ */
+export async function closePool(): Promise<void> {
+  if (pool) {
+    const draining = pool;
+    pool = null;
+    await draining.drain();
+    await draining.clear();
+    console.log('[Snowflake] Connection pool closed');
+  }
+}
+
 /**
  * Get connection status
  */
 export function isConnected(): boolean {
-  return isInitialized && connection !== null;
+  return pool !== null || (isInitialized && connection !== null);
 }
 
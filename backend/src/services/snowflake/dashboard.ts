@@ -31,27 +31,163 @@ export async function getLatestDecisions(limit: number = 20): Promise<DecisionRe
   try {
     const rows = await execute(query, [limit]);
     console.log(`[Snowflake] Retrieved ${rows.length} latest decisions`);
-    return rows.map((row: any) => ({
-      id: row.ID,
-      created_at: row.CREATED_AT,
-      market_id: row.MARKET_ID,
-      market_question: row.MARKET_QUESTION,
-      final_direction: row.FINAL_DIRECTION,
-      final_size: row.FINAL_SIZE,
-      agent_outputs: typeof row.AGENT_OUTPUTS === 'string' 
-        ? JSON.parse(row.AGENT_OUTPUTS) 
-        : row.AGENT_OUTPUTS,
-      consensus_reasoning: row.CONSENSUS_REASONING,
-      raw_market_data: typeof row.RAW_MARKET_DATA === 'string'
-        ? JSON.parse(row.RAW_MARKET_DATA)
-        : row.RAW_MARKET_DATA,
-    }));
+    return rows.map(mapDecisionRow);
   } catch (error) {
     console.error('[Snowflake] Error fetching latest decisions:', error);
     throw error;
   }
 }
 
+/**
+ * One page of decisions, newest first, with filters applied in the query
+ */
+export interface DecisionPageQuery {
+  limit: number;
+  direction?: 'YES' | 'NO';
+  from?: string; // ISO timestamp, inclusive
+  to?: string; // ISO timestamp, inclusive
+  after?: { created_at: string; id: string }; // Keyset cursor: last row of the previous page
+}
+
+/**
+ * Get a page of decisions ordered by (created_at, id) descending.
+ * Pages continue from the previous page's last row (keyset), so every page
+ * costs the same no matter how deep it is.
+ * @param page Filters, cursor and page size
+ * @returns Array of decision records
+ */
+export async function getDecisionsPage(page: DecisionPageQuery): Promise<DecisionRecord[]> {
+  const conditions: string[] = [];
+  const binds: any[] = [];
+
+  if (page.direction) {
+    conditions.push('final_direction = ?');
+    binds.push(page.direction);
+  }
+  if (page.from) {
+    conditions.push('created_at >= ?');
+    binds.push(page.from);
+  }
+  if (page.to) {
+    conditions.push('created_at <= ?');
+    binds.push(page.to);
+  }
+  if (page.after) {
+    conditions.push('(created_at < ? OR (created_at = ? AND id < ?))');
+    binds.push(page.after.created_at, page.after.created_at, page.after.id);
+  }
+
+  const query = `
+    SELECT 
+      id,
+      created_at,
+      market_id,
+      market_question,
+      final_direction,
+      final_size,
+      agent_outputs,
+      consensus_reasoning,
+      raw_market_data
+    FROM decisions
+    ${conditions.length ? `WHERE ${conditions.join(' AND ')}` : ''}
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+  `;
+  binds.push(page.limit);
+
+  try {
+    const rows = await execute(query, binds);
+    console.log(`[Snowflake] Retrieved a page of ${rows.length} decisions`);
+    return rows.map(mapDecisionRow);
+  } catch (error) {
+    console.error('[Snowflake] Error fetching decisions page:', error);
+    throw error;
+  }
+}
+
+/**
+ * Get a single decision by its primary key
+ * @param id Decision ID
+ * @returns The decision record, or null if it does not exist
+ */
+export async function getDecisionById(id: string): Promise<DecisionRecord | null> {
+  const query = `
+    SELECT 
+      id,
+      created_at,
+      market_id,
+      market_question,
+      final_direction,
+      final_size,
+      agent_outputs,
+      consensus_reasoning,
+      raw_market_data
+    FROM decisions
+    WHERE id = ?
+    LIMIT 1
+  `;
+
+  try {
+    const rows = await execute(query, [id]);
+    console.log(`[Snowflake] Retrieved decision ${id}: ${rows.length ? 'found' : 'not found'}`);
+    return rows.length ? mapDecisionRow(rows[0]) : null;
+  } catch (error) {
+    console.error('[Snowflake] Error fetching decision by id:', error);
+    throw error;
+  }
+}
+
+/**
+ * Get the debate logs of a decision (initial and final agent decisions).
+ * The agent engine's storeDecision (agent_engine/services/snowflakeStore.ts)
+ * writes them to INVESTMENT_DECISIONS under DECISION_ID, and writes the
+ * decisions row the proposal is listed from with id = that DECISION_ID.
+ * @param decisionId Decision ID (= proposal id)
+ * @returns The CONVERSATION_LOGS object, or null if the decision has none
+ */
+export async function getConversationLogs(decisionId: string): Promise<any | null> {
+  const query = `
+    SELECT CONVERSATION_LOGS
+    FROM INVESTMENT_DECISIONS
+    WHERE DECISION_ID = ?
+    LIMIT 1
+  `;
+
+  try {
+    const rows = await execute(query, [decisionId]);
+    console.log(`[Snowflake] Retrieved conversation logs for ${decisionId}: ${rows.length ? 'found' : 'not found'}`);
+    if (!rows.length || rows[0].CONVERSATION_LOGS == null) {
+      return null;
+    }
+    const logs = rows[0].CONVERSATION_LOGS;
+    return typeof logs === 'string' ? JSON.parse(logs) : logs;
+  } catch (error) {
+    console.error('[Snowflake] Error fetching conversation logs:', error);
+    throw error;
+  }
+}
+
+/**
+ * Map a raw decisions row to a DecisionRecord
+ */
+function mapDecisionRow(row: any): DecisionRecord {
+  return {
+    id: row.ID,
+    created_at: row.CREATED_AT,
+    market_id: row.MARKET_ID,
+    market_question: row.MARKET_QUESTION,
+    final_direction: row.FINAL_DIRECTION,
+    final_size: row.FINAL_SIZE,
+    agent_outputs: typeof row.AGENT_OUTPUTS === 'string' 
+      ? JSON.parse(row.AGENT_OUTPUTS) 
+      : row.AGENT_OUTPUTS,
+    consensus_reasoning: row.CONSENSUS_REASONING,
+    raw_market_data: typeof row.RAW_MARKET_DATA === 'string'
+      ? JSON.parse(row.RAW_MARKET_DATA)
+      : row.RAW_MARKET_DATA,
+  };
+}
+
 /**
  * Get trades by status
  * @param status Trade status: PENDING, EXECUTED, or FAILED
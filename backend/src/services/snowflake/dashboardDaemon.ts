@@ -0,0 +1,176 @@
+/**
+ * Dashboard Query Daemon
+ * Resident process that keeps a pool of Snowflake sessions open and serves
+ * dashboard queries over a local Unix socket, one JSON frame per line:
+ *   request:  {"id": 1, "function": "getLatestDecisions", "args": [20]}
+ *   response: {"id": 1, "result": [...]}  or  {"id": 1, "error": "..."}
+ *
+ * Usage:
+ *   ts-node src/services/snowflake/dashboardDaemon.ts --socket /tmp/quack-dashboard.sock --pool 4
+ *   Add --standin to serve in-memory sample data instead of Snowflake (local testing).
+ */
+
+import * as fs from 'fs';
+import * as net from 'net';
+
+type QueryBackend = Record<string, (...args: any[]) => Promise<any>>;
+
+/**
+ * Read a `--name value` command line argument
+ */
+function getArg(name: string, fallback: string): string {
+  const index = process.argv.indexOf(name);
+  return index >= 0 && index + 1 < process.argv.length ? process.argv[index + 1] : fallback;
+}
+
+/**
+ * Real backend: dashboard queries running on pooled Snowflake sessions.
+ * Loaded lazily so the stand-in backend works without snowflake-sdk installed.
+ */
+async function createSnowflakeBackend(poolSize: number): Promise<QueryBackend> {
+  const { initSnowflakePool } = require('../../database/snowflake');
+  const dashboard = require('./dashboard');
+
+  await initSnowflakePool(poolSize);
+
+  return {
+    getLatestDecisions: dashboard.getLatestDecisions,
+    getDecisionsPage: dashboard.getDecisionsPage,
+    getDecisionById: dashboard.getDecisionById,
+    getConversationLogs: dashboard.getConversationLogs,
+    getTradesByStatus: dashboard.getTradesByStatus,
+    getMarketHistory: dashboard.getMarketHistory,
+  };
+}
+
+/**
+ * Stand-in backend: same functions, in-memory data, no warehouse
+ */
+function createStandinBackend(): QueryBackend {
+  const decisions = Array.from({ length: 25 }, (_, i) => ({
+    id: `standin-${String(i + 1).padStart(3, '0')}`,
+    created_at: new Date(Date.now() - i * 3600 * 1000).toISOString(),
+    market_id: `standin-market-${i + 1}`,
+    market_question: `Stand-in market question #${i + 1}?`,
+    final_direction: i % 3 === 0 ? 'NO' : 'YES',
+    final_size: 1000 + i * 250,
+    agent_outputs: [
+      { agent: 'QuantAgent', decision: { direction: 'YES', confidence: 70, size: 1000, reasoning: 'Stand-in reasoning.' } },
+      { agent: 'RiskAgent', decision: { direction: 'NO', confidence: 60, size: 500, reasoning: 'Stand-in reasoning.' } },
+    ],
+    consensus_reasoning: 'Stand-in consensus reasoning.',
+    raw_market_data: {},
+  }));
+
+  return {
+    getLatestDecisions: async (limit: number = 20) => decisions.slice(0, limit),
+    getDecisionsPage: async (page: any) =>
+      decisions
+        .filter((d) => !page.direction || d.final_direction === page.direction)
+        .filter((d) => !page.from || d.created_at >= page.from)
+        .filter((d) => !page.to || d.created_at <= page.to)
+        .filter((d) => !page.after || d.created_at < page.after.created_at
+          || (d.created_at === page.after.created_at && d.id < page.after.id))
+        .slice(0, page.limit),
+    getDecisionById: async (id: string) => decisions.find((d) => d.id === id) || null,
+    getConversationLogs: async (id: string) => {
+      const decision = decisions.find((d) => d.id === id);
+      return decision
+        ? { initial_decisions: decision.agent_outputs, final_decisions: decision.agent_outputs }
+        : null;
+    },
+    getTradesByStatus: async () => [],
+    getMarketHistory: async () => [],
+  };
+}
+
+async function handleFrame(backend: QueryBackend, socket: net.Socket, line: string): Promise<void> {
+  const reply = (frame: Record<string, any>) => {
+    if (!socket.destroyed) {
+      socket.write(JSON.stringify(frame) + '\n');
+    }
+  };
+
+  let frame: any;
+  try {
+    frame = JSON.parse(line);
+  } catch (error) {
+    reply({ id: null, error: 'Invalid JSON frame' });
+    return;
+  }
+
+  if (frame.function === 'ping') {
+    reply({ id: frame.id, result: 'pong' });
+    return;
+  }
+
+  const fn = Object.prototype.hasOwnProperty.call(backend, frame.function) ? backend[frame.function] : undefined;
+  if (!fn) {
+    reply({ id: frame.id, error: `Unknown function: ${frame.function}` });
+    return;
+  }
+
+  try {
+    const result = await fn(...(Array.isArray(frame.args) ? frame.args : []));
+    reply({ id: frame.id, result });
+  } catch (error) {
+    reply({ id: frame.id, error: error instanceof Error ? error.message : String(error) });
+  }
+}
+
+async function main(): Promise<void> {
+  const socketPath = getArg('--socket', process.env.DASHBOARD_DAEMON_SOCKET || '/tmp/quack-dashboard.sock');
+  const poolSize = parseInt(getArg('--pool', process.env.DASHBOARD_DAEMON_POOL_SIZE || '4'), 10);
+  const standin = process.argv.includes('--standin');
+
+  const backend = standin ? createStandinBackend() : await createSnowflakeBackend(poolSize);
+
+  if (fs.existsSync(socketPath)) {
+    fs.unlinkSync(socketPath);
+  }
+
+  const server = net.createServer((socket) => {
+    let buffer = '';
+    socket.setEncoding('utf8');
+
+    socket.on('data', (chunk: string) => {
+      buffer += chunk;
+      let newline = buffer.indexOf('\n');
+      while (newline >= 0) {
+        const line = buffer.slice(0, newline).trim();
+        buffer = buffer.slice(newline + 1);
+        if (line) {
+          handleFrame(backend, socket, line);
+        }
+        newline = buffer.indexOf('\n');
+      }
+    });
+
+    socket.on('error', (error) => {
+      console.error('[DashboardDaemon] Socket error:', error.message);
+    });
+  });
+
+  const shutdown = async () => {
+    server.close();
+    if (!standin) {
+      const { closePool } = require('../../database/snowflake');
+      await closePool().catch(() => undefined);
+    }
+    if (fs.existsSync(socketPath)) {
+      fs.unlinkSync(socketPath);
+    }
+    process.exit(0);
+  };
+  process.on('SIGTERM', shutdown);
+  process.on('SIGINT', shutdown);
+
+  server.listen(socketPath, () => {
+    console.error(`[DashboardDaemon] Listening on ${socketPath} (${standin ? 'stand-in backend' : `${poolSize} Snowflake sessions`})`);
+  });
+}
+
+main().catch((error) => {
+  console.error('[DashboardDaemon] Failed to start:', error);
+  process.exit(1);
+});
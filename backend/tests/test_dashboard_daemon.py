@@ -0,0 +1,126 @@
+"""
+Dashboard daemon client against the daemon's stand-in backend (--standin),
+plus the fallback to one-off ts-node calls when the daemon is unavailable.
+The stand-in tests need the compiled daemon (npm run build) or ts-node installed.
+"""
+import asyncio
+import errno
+import json
+import shutil
+
+import pytest
+
+import services.dashboard as dashboard
+import services.dashboard_daemon as daemon_module
+from services.dashboard_daemon import (
+    BACKEND_DIR,
+    TS_DAEMON_JS,
+    DaemonUnavailable,
+    DashboardDaemonClient,
+)
+from services.ts_bridge import BridgeError
+
+can_run_daemon = shutil.which("node") is not None and (
+    TS_DAEMON_JS.exists() or (BACKEND_DIR / "node_modules" / "ts-node").exists()
+)
+needs_daemon = pytest.mark.skipif(not can_run_daemon, reason="dashboard daemon cannot be run (no build or ts-node)")
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "dashboard.sock")
+
+
+def with_standin(socket_path, test):
+    async def run():
+        client = DashboardDaemonClient(socket_path=socket_path, pool_size=1, autostart=True, standin=True)
+        try:
+            await test(client)
+        finally:
+            await client.shutdown()
+    asyncio.run(run())
+
+
+@needs_daemon
+def test_dispatches_by_function_name(socket_path):
+    async def test(client):
+        latest = await client.call("getLatestDecisions", 3)
+        assert [d["id"] for d in latest] == ["standin-001", "standin-002", "standin-003"]
+
+        decision = await client.call("getDecisionById", "standin-002")
+        assert decision["market_id"] == "standin-market-2"
+        assert await client.call("getDecisionById", "missing") is None
+
+        logs = await client.call("getConversationLogs", "standin-002")
+        assert [a["agent"] for a in logs["final_decisions"]] == ["QuantAgent", "RiskAgent"]
+        assert await client.call("getConversationLogs", "missing") is None
+
+        with pytest.raises(BridgeError, match="Unknown function"):
+            await client.call("dropTables")
+        # The connection is still usable after an error frame
+        assert await client.call("ping") == "pong"
+
+    with_standin(socket_path, test)
+
+
+@needs_daemon
+def test_json_lines_framing(socket_path):
+    async def test(client):
+        await client.call("ping")  # Starts the daemon
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        try:
+            # Two frames in one write, then one frame split across writes
+            writer.write(b'{"id": 1, "function": "ping"}\n{"id": 2, "function": "getLatestDecisions", "args": [2]}\n')
+            writer.write(b'{"id": 3, "funct')
+            await writer.drain()
+            writer.write(b'ion": "ping"}\nnot json\n')
+            await writer.drain()
+
+            frames = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in range(4)]
+        finally:
+            writer.close()
+
+        by_id = {frame["id"]: frame for frame in frames}
+        assert by_id[1]["result"] == "pong"
+        assert len(by_id[2]["result"]) == 2
+        assert by_id[3]["result"] == "pong"
+        assert by_id[None]["error"] == "Invalid JSON frame"
+
+    with_standin(socket_path, test)
+
+
+def test_unavailable_without_autostart(socket_path):
+    async def test():
+        client = DashboardDaemonClient(socket_path=socket_path, autostart=False)
+        with pytest.raises(DaemonUnavailable):
+            await client.call("getLatestDecisions", 5)
+
+    asyncio.run(test())
+
+
+def test_startup_wait_survives_other_socket_errors(socket_path, monkeypatch):
+    async def not_a_socket():
+        raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+
+    async def test():
+        client = DashboardDaemonClient(socket_path=socket_path)
+        monkeypatch.setattr(client, "_connect", not_a_socket)
+        assert await client._wait_until_listening() is False
+
+    monkeypatch.setattr(daemon_module, "DASHBOARD_DAEMON_STARTUP_TIMEOUT", 0.3)
+    asyncio.run(test())
+
+
+def test_query_falls_back_to_ts_node(socket_path, monkeypatch):
+    calls = []
+
+    async def one_off(function_name, *args):
+        calls.append((function_name, args))
+        return ["from ts-node"]
+
+    monkeypatch.setattr(dashboard, "DASHBOARD_DAEMON_ENABLED", True)
+    monkeypatch.setattr(dashboard, "dashboard_daemon", DashboardDaemonClient(socket_path=socket_path, autostart=False))
+    monkeypatch.setattr(dashboard, "call_typescript_dashboard", one_off)
+
+    assert asyncio.run(dashboard.query_dashboard("getLatestDecisions", 5)) == ["from ts-node"]
+    assert calls == [("getLatestDecisions", (5,))]
@@ -0,0 +1,105 @@
+"""
+/governance/proposals pages: keyset cursors over the mock ledger, which
+source serves a page when Snowflake answers empty or fails, and ETag revalidation.
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import routers.governance as governance
+from app.main import app
+from data.bet_ledger import BetLedger
+from data.consistent_data import get_dataset
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def mock_pages(client, **params):
+    # Follow X-Next-Cursor to the end, returning each page's ids
+    pages, cursor = [], None
+    while True:
+        query = dict(params, use_real_data="false")
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/api/governance/proposals", params=query)
+        assert response.status_code == 200
+        pages.append([proposal["id"] for proposal in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+def test_cursor_round_trip_covers_every_proposal_once(client):
+    newest = client.get("/api/governance/proposals", params={"use_real_data": "false", "limit": 100}).json()
+    pages = mock_pages(client, limit=40)
+
+    ids = [proposal_id for page in pages for proposal_id in page]
+    assert all(len(page) == 40 for page in pages[:-1])
+    assert sorted(ids) == sorted(bet["id"] for bet in get_dataset().ledger.rows())
+    # Newest first, and the cursor continues exactly where a bigger page would
+    assert ids[:100] == [proposal["id"] for proposal in newest]
+    timestamps = [proposal["timestamp"] for proposal in newest]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_cursor_keeps_filters(client):
+    pages = mock_pages(client, status="approved", limit=25)
+    ids = [proposal_id for page in pages for proposal_id in page]
+    approved = client.get(
+        "/api/governance/proposals", params={"use_real_data": "false", "status": "APPROVED", "limit": 100}
+    ).json()
+    assert ids[:len(approved)] == [p["id"] for p in approved]
+    assert len(ids) == len(set(ids))
+
+
+@pytest.mark.parametrize("cursor", ["not base64 json!", "WzFd", "WyJub3QgYSB0aW1lIiwicHJvcC0wMDEiXQ"])
+def test_bad_cursor_is_400(client, cursor):
+    response = client.get("/api/governance/proposals", params={"use_real_data": "false", "cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_empty_snowflake_page_does_not_fall_back_to_mock(client, monkeypatch):
+    async def no_decisions(*args):
+        return []
+
+    monkeypatch.setattr(governance, "fetch_decisions_page", no_decisions)
+    response = client.get("/api/governance/proposals", params={"status": "PENDING"})
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_failed_snowflake_fetch_falls_back_to_mock(client, monkeypatch):
+    async def unavailable(*args):
+        raise RuntimeError("warehouse down")
+
+    monkeypatch.setattr(governance, "fetch_decisions_page", unavailable)
+    response = client.get("/api/governance/proposals", params={"limit": 5})
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()][0].startswith("prop-")
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_etag_revalidation_follows_the_ledger_generation(client, monkeypatch):
+    bets = get_dataset().ledger.rows(limit=5)
+    ledger = BetLedger(bets)
+    monkeypatch.setattr(governance, "get_dataset", lambda: SimpleNamespace(ledger=ledger))
+    params = {"use_real_data": "false", "limit": 10}
+
+    first = client.get("/api/governance/proposals", params=params)
+    etag = first.headers["ETag"]
+    cached = client.get("/api/governance/proposals", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    ledger.append(dict(bets[-1], id="prop-new", timestamp="2099-01-01T00:00:00Z"))
+    changed = client.get("/api/governance/proposals", params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["id"] == "prop-new"
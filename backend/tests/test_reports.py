@@ -0,0 +1,32 @@
+"""
+Daily report rollup: re-closing a day replaces its row and its share of the totals.
+"""
+from data.reports import UNIT, NavSnapshot, ReportRollup, day_date
+
+DAY = 19000
+
+
+def snapshot(day: int, pnl: float) -> NavSnapshot:
+    return NavSnapshot(day, round((1000 + pnl) * UNIT), 1000 * UNIT, round(pnl * UNIT))
+
+
+def test_reclosing_a_day_takes_back_its_previous_contribution():
+    rollup = ReportRollup()
+    rollup.record_bet(DAY, 25.0, True, "BTC above 100k")
+    rollup.close_day(snapshot(DAY, 25.0))
+    rollup.close_day(snapshot(DAY + 1, -10.0))
+    assert rollup.summary() == {
+        "totalPnl": 15.0, "averageWinRate": 100.0, "totalTrades": 1, "profitableDays": 1, "totalDays": 2,
+    }
+
+    # A bet settled after the close and a corrected NavReport for the first day
+    rollup.record_bet(DAY, -40.0, False, "ETH flips BTC")
+    row = rollup.close_day(snapshot(DAY, -15.0))
+
+    assert rollup.summary() == {
+        "totalPnl": -25.0, "averageWinRate": 50.0, "totalTrades": 2, "profitableDays": 0, "totalDays": 2,
+    }
+    assert rollup.get(day_date(DAY).isoformat()) is row
+    assert row["trades"] == 2
+    assert row["pnl"] == "-15.00"
+    assert [report["date"] for report in rollup.daily(10)] == [day_date(DAY + 1).isoformat(), day_date(DAY).isoformat()]
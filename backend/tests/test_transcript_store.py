@@ -0,0 +1,36 @@
+"""
+Transcript store: round trips through the file, reloading, and writes that fail.
+"""
+import asyncio
+
+from services.transcript_store import DEFAULT_TRANSCRIPT, TranscriptStore
+
+TRANSCRIPT = {
+    "messages": [{"agent": "Alpha", "message": "Buy YES"}],
+    "reasoning": [{"agent": "Alpha", "vote": "YES", "rationale": "Momentum"}],
+}
+
+
+def test_put_get_and_reload(tmp_path):
+    path = str(tmp_path / "transcripts.bin")
+
+    async def write():
+        store = TranscriptStore(path=path)
+        await store.put("decision-1", TRANSCRIPT)
+        await store.put("decision-2", dict(TRANSCRIPT, messages=[]))
+        assert await store.get("decision-1") == TRANSCRIPT
+        assert await store.get(DEFAULT_TRANSCRIPT) is not None  # Mock transcripts stay in memory
+        assert await store.get("missing") is None
+
+    asyncio.run(write())
+    reloaded = TranscriptStore(path=path)
+    assert asyncio.run(reloaded.get("decision-1")) == TRANSCRIPT
+    assert asyncio.run(reloaded.get("decision-2"))["messages"] == []
+
+
+def test_keep_logs_a_failed_write(tmp_path):
+    store = TranscriptStore(path=str(tmp_path / "missing-dir" / "transcripts.bin"))
+
+    assert asyncio.run(store.keep("decision-1", TRANSCRIPT)) is False
+    assert store.stats()["write_errors"] == 1
+    assert asyncio.run(store.get("decision-1")) is None
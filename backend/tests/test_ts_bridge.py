@@ -0,0 +1,38 @@
+"""
+TypeScript bridge process runner: start failures and per-kind concurrency limits.
+"""
+import asyncio
+import sys
+
+import pytest
+
+import services.ts_bridge as ts_bridge
+from services.ts_bridge import BridgeError, run_process
+
+
+def test_unstartable_command_is_a_bridge_error(tmp_path):
+    script = tmp_path / "not-executable.sh"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o644)
+
+    with pytest.raises(BridgeError, match="Could not start"):
+        asyncio.run(run_process([str(script)]))
+
+
+def test_decisions_do_not_block_dashboard_queries(monkeypatch):
+    async def test():
+        monkeypatch.setattr(ts_bridge, "_limiters", {
+            "dashboard": asyncio.Semaphore(1),
+            "decision": asyncio.Semaphore(1),
+        })
+        slow = ["sleep", "2"]
+        decision = asyncio.ensure_future(run_process(slow, timeout=10, label="decision", kind="decision"))
+        await asyncio.sleep(0.1)
+        dashboard = run_process([sys.executable, "-c", "print('ok')"], label="dashboard")
+        # Finishes while the decision still holds the only decision slot
+        result = await asyncio.wait_for(dashboard, timeout=1.5)
+        assert result.stdout.strip() == "ok"
+        assert not decision.done()
+        await decision
+
+    asyncio.run(test())
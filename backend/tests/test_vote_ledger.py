@@ -0,0 +1,123 @@
+"""
+Vote ingestion: per-wallet dedupe, log replay (including a torn last line),
+write retries, votes on unknown proposals and unsigned votes.
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import services.signatures as signatures
+from app.main import app
+from data.consistent_data import get_dataset
+from services.decision_store import decision_store
+from services.vote_ledger import DuplicateVote, VoteLedger, vote_ledger
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "votes.jsonl")
+
+
+def test_one_vote_per_wallet_per_proposal(log_path):
+    ledger = VoteLedger(log_path=log_path)
+    ledger.cast("prop-001", "wallet-a", "YES", weight=5)
+    ledger.cast("prop-002", "wallet-a", "NO", weight=5)  # Another proposal is fine
+    with pytest.raises(DuplicateVote):
+        ledger.cast("prop-001", "wallet-a", "NO", weight=5)
+    ledger.cast("prop-001", "wallet-b", "NO", weight=2)
+
+    assert ledger.tally("prop-001") == {
+        "proposalId": "prop-001", "yesWeight": 5, "noWeight": 2, "yesVotes": 1, "noVotes": 1, "voters": 2,
+    }
+    assert ledger.has_voted("prop-001", "wallet-a")
+    assert ledger.stats()["duplicates"] == 1
+
+
+def test_replay_rebuilds_tallies_and_skips_a_torn_line(log_path):
+    async def write():
+        ledger = VoteLedger(log_path=log_path)
+        ledger.cast("prop-001", "wallet-a", "YES", weight=3)
+        ledger.cast("prop-001", "wallet-b", "NO", weight=1)
+        ledger.cast("prop-002", "wallet-a", "NO", weight=3)
+        await ledger.close()
+
+    asyncio.run(write())
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write('{"seq":4,"proposal":"prop-002","wal')  # Crash mid-append
+
+    replayed = VoteLedger(log_path=log_path)
+    assert replayed.tally("prop-001")["yesWeight"] == 3
+    assert replayed.tally("prop-001")["noWeight"] == 1
+    assert replayed.tally("prop-002")["voters"] == 1
+    assert replayed.sequence == 3
+    with pytest.raises(DuplicateVote):
+        replayed.cast("prop-001", "wallet-a", "NO")
+    assert replayed.cast("prop-002", "wallet-b", "YES") == 4
+
+
+def test_failed_write_is_retried(log_path, monkeypatch):
+    async def test():
+        ledger = VoteLedger(log_path=log_path, flush_interval=60)
+        real_write = ledger._write
+        failures = []
+
+        def flaky_write(lines):
+            if not failures:
+                failures.append(lines)
+                raise OSError("disk full")
+            real_write(lines)
+
+        monkeypatch.setattr(ledger, "_write", flaky_write)
+        ledger.cast("prop-001", "wallet-a", "YES")
+        ledger.cast("prop-001", "wallet-b", "YES")
+
+        await ledger.flush()
+        assert ledger.stats()["write_errors"] == 1
+        assert ledger.stats()["pending"] == 2
+        assert ledger.stats()["flushed"] == 0
+
+        await ledger.close()
+        assert ledger.stats()["pending"] == 0
+        assert ledger.stats()["flushed"] == 2
+
+    asyncio.run(test())
+    assert VoteLedger(log_path=log_path).tally("prop-001")["yesVotes"] == 2
+
+
+def test_vote_on_unknown_proposal_is_404(monkeypatch):
+    async def no_decision(decision_id):
+        return None
+
+    monkeypatch.setattr(decision_store, "get", no_decision)
+    proposals = vote_ledger.stats()["proposals"]
+    response = TestClient(app).post(
+        "/api/governance/proposals/does-not-exist/vote",
+        json={"vote": "YES", "walletAddress": "AnyonesWallet111"},
+    )
+    assert response.status_code == 404
+    assert vote_ledger.stats()["proposals"] == proposals
+
+
+def test_unsigned_votes_are_rejected_by_default():
+    proposal_id = get_dataset().ledger.rows(limit=1)[0]["id"]
+    response = TestClient(app).post(
+        f"/api/governance/proposals/{proposal_id}/vote",
+        json={"vote": "YES", "walletAddress": "AnyonesWallet111"},
+    )
+    assert response.status_code == 401
+
+
+def test_unsigned_votes_are_not_counted_when_signatures_are_off(monkeypatch):
+    monkeypatch.setattr(signatures, "SIGNATURE_REQUIRED", False)
+    proposal_id = get_dataset().ledger.rows(limit=1)[0]["id"]
+    tally = vote_ledger.tally(proposal_id)
+    response = TestClient(app).post(
+        f"/api/governance/proposals/{proposal_id}/vote",
+        json={"vote": "YES", "walletAddress": "AnyonesWallet111"},
+    )
+    assert response.status_code == 200
+    assert response.json()["success"] is False
+    # No weight, and the wallet can still cast its signed vote
+    assert vote_ledger.tally(proposal_id) == tally
+    assert not vote_ledger.has_voted(proposal_id, "AnyonesWallet111")
@@ -15,7 +15,7 @@ interface DailyReport {
   winRate: number;
   keyTrades: string[];
   agentNotes: string;
-  ipfsReport: string;
+  ipfsReport?: string | null;
 }
 
 interface ReportAccordionProps {
@@ -85,20 +85,22 @@ export const ReportAccordion = ({ reports }: ReportAccordionProps) => {
                   </div>
                 </div>
 
-                <div>
-                  <h4 className="font-semibold mb-2">Full Report (IPFS)</h4>
-                  <a
-                    href={report.ipfsReport}
-                    target="_blank"
-                    rel="noopener noreferrer"
-                    className="flex items-center gap-2 p-3 rounded-lg bg-muted/50 border border-border hover:border-primary transition-colors group w-fit"
-                  >
-                    <ExternalLink className="w-4 h-4 text-muted-foreground group-hover:text-primary" />
-                    <span className="text-sm font-mono text-muted-foreground group-hover:text-foreground">
-                      {report.ipfsReport}
-                    </span>
-                  </a>
-                </div>
+                {report.ipfsReport && (
+                  <div>
+                    <h4 className="font-semibold mb-2">Full Report (IPFS)</h4>
+                    <a
+                      href={report.ipfsReport}
+                      target="_blank"
+                      rel="noopener noreferrer"
+                      className="flex items-center gap-2 p-3 rounded-lg bg-muted/50 border border-border hover:border-primary transition-colors group w-fit"
+                    >
+                      <ExternalLink className="w-4 h-4 text-muted-foreground group-hover:text-primary" />
+                      <span className="text-sm font-mono text-muted-foreground group-hover:text-foreground">
+                        {report.ipfsReport}
+                      </span>
+                    </a>
+                  </div>
+                )}
               </div>
             </AccordionContent>
           </AccordionItem>
@@ -53,6 +53,8 @@ export interface DepositRequest {
   amount: number;
   walletAddress: string;
   signature?: string;
+  nonce?: string;
+  signedAt?: number;
 }
 
 export interface DepositResponse {
@@ -124,6 +126,8 @@ export interface VoteRequest {
   vote: 'YES' | 'NO';
   walletAddress: string;
   signature?: string;
+  nonce?: string;
+  signedAt?: number;
 }
 
 export interface VoteResponse {
@@ -161,7 +165,7 @@ export interface DailyReport {
   winRate: number;
   keyTrades: string[];
   agentNotes: string;
-  ipfsReport: string;
+  ipfsReport?: string | null;
 }
 
 export interface ReportSummary {